@@ -29,6 +29,13 @@ based on sections defined by boundary points.
 
     rotate2
     close_points
+    pack_points
+    set_precision
+    get_precision
+    set_backend
+    get_backend
+    moments
+    batch_moments
     area
     centroid
     inertias
@@ -40,21 +47,116 @@ based on sections defined by boundary points.
     principal_extreme_fibers
     elast_sect_mod
     principal_elast_sect_mod
+    plast_sect_mod
+    batch_plast_sect_mod
+    plastic_neutral_axes
+    axis_inertias
+    axis_gyradii
+    axis_extreme_fibers
+    axis_elast_sect_mod
+    axis_plast_sect_mod
+    axis_summary
     plot_section
     section_summary
+    batch_section_summary
+
+
+Section Moments
+===============
+The following class stores the area, centroid, centroidal moment of inertias,
+and bounds of a section as an immutable value. Section moments may be added,
+subtracted, weighted, translated, rotated, mirrored, and scaled in constant
+time, such that parts may be repositioned or resized without recalculating
+their properties from boundary points. The moments of parametric shapes may
+be calculated directly by functions such as :func:`angle_moments`.
+
+.. autosummary::
+    :toctree: generated/
+
+    SectionMoments
+
+
+Arc Functions
+=============
+Boundaries may include exact circular arc edges by adding a third column
+of bulge factors to the boundary points. The bulge factor of a point applies
+to the edge from that point to the next, and a bulge of zero indicates a
+straight edge. Such boundaries are accepted by the boundary and multi-boundary
+functions, and their properties are calculated in closed form.
+
+.. autosummary::
+    :toctree: generated/
+
+    arc_bulge
+    arc_segments
+    arc_error
+    tessellate
+
+
+Parameter Sweep Functions
+=========================
+The following functions may be used to evaluate section summary functions
+over grids or tables of parameters. A DataFrame accessor may also be
+registered by calling :func:`register_accessor`, after which
+``df.xsect.sweep(i_beam_summary)`` evaluates a summary function over the rows
+of a DataFrame. Sweeps too large to be held in memory may be
+written chunk by chunk to a result sink by :func:`run_sweep`.
+
+.. autosummary::
+    :toctree: generated/
+
+    iter_sweep
+    sweep
+    run_sweep
+    NpySink
+    CsvSink
+    SweepAccessor
+    register_accessor
+
+
+Convex Hull Functions
+=====================
+The following may be used to efficiently query the extreme points of a
+section about any axis.
+
+.. autosummary::
+    :toctree: generated/
+
+    convex_hull
+    HullIndex
+
+
+Torsion Functions
+=================
+The following may be used to calculate the St. Venant torsion constant of
+arbitrary sections, including those with holes, by the finite element
+method. The solvers for recently used geometries are cached, such that
+repeated queries do not remesh or refactorize the section.
+
+.. autosummary::
+    :toctree: generated/
+
+    TorsionSolver
+    torsion_constant
+    multi_torsion_constant
+    batch_torsion_constant
 
 
 Multi-Boundary Functions
 ========================
 The following functions may be used to calculate cross sectional properties
 for composite sections composed of multiple elements which are defined
-by boundary points.
+by boundary points. The :class:`CompositeSection` class calculates the
+properties of such sections on demand and caches them, such that shared
+intermediate properties, such as the centroid, are only calculated once.
+The functions below are convenience wrappers around this class.
 
 .. plot:: ../examples/multi_section_ex1.py
 
 .. autosummary::
     :toctree: generated/
 
+    CompositeSection
     multi_area
     multi_centroid
     multi_inertias
@@ -66,10 +168,87 @@ by boundary points.
     multi_principal_extreme_fibers
     multi_elast_sect_mod
     multi_principal_elast_sect_mod
+    multi_plast_sect_mod
+    multi_plastic_neutral_axes
+    multi_axis_inertias
+    multi_axis_gyradii
+    multi_axis_extreme_fibers
+    multi_axis_elast_sect_mod
+    multi_axis_plast_sect_mod
+    multi_axis_summary
     multi_plot_section
+    multi_section_moments
     multi_section_summary
 
 
+Overlap Functions
+=================
+The multi-boundary functions assume that the added shapes do not overlap
+and that each subtracted shape lies inside a single added shape. The
+following may be used to resolve composite sections which do not meet
+these conditions into equivalent sets of added and subtracted shapes
+which may be passed to the multi-boundary functions. Candidate overlaps
+are located by a sort and sweep over the shape bounding boxes, so exact
+intersections are only calculated for shapes near one another.
+
+.. autosummary::
+    :toctree: generated/
+
+    overlap_pairs
+    resolve_overlaps
+
+
+Batch Execution
+===============
+The following classes may be used to calculate the properties of large
+numbers of sections over a pool of worker processes. The sections are
+chunked by their vertex counts, and the results are returned in the order
+of the input sections. Boundaries packed into a :class:`VertexArena` are
+stored in shared memory, such that the workers attach to them without
+copying and write their results into a shared result array.
+
+.. autosummary::
+    :toctree: generated/
+
+    BatchExecutor
+    VertexArena
+
+
+Vertex Store
+============
+The following class stores libraries of boundaries on disk as raw vertex and
+offset files, which are opened as memory maps and processed in sequential
+chunks, such that libraries larger than the available memory may be
+summarized. Boundaries may be appended without rewriting the library.
+
+.. autosummary::
+    :toctree: generated/
+
+    VertexStore
+
+
+Streaming Functions
+===================
+The following may be used to calculate the properties of boundaries too
+large to be held in memory, which are supplied as iterables of consecutive
+chunks of points. The edge between consecutive chunks is carried over, such
+that the results match those of the boundary functions, while memory is
+bounded by the chunk size.
+
+The plastic section modulii returned by :func:`stream_section_summary`
+require several passes over the boundary, typically 7, so the chunks must be
+supplied by a function returning a new iterable for each pass. A one-shot
+iterable, such as a generator or a file being read, is read in a single pass
+and the plastic section modulii are omitted.
+
+.. autosummary::
+    :toctree: generated/
+
+    MomentStream
+    stream_moments
+    stream_section_summary
+
+
 Round Functions
 ===============
 The following functions may be used to calculate cross sectional properties
@@ -84,7 +263,11 @@ for round sections, such as rounds and pipes.
     round_inertia
     round_gyradius
     round_sect_mod
+    round_plast_sect_mod
     round_points
+    round_points_error
+    round_arc_points
+    round_moments
     round_summary
 
 
@@ -99,6 +282,7 @@ for solid or thin walled polygon sections.
     :toctree: generated/
 
     polygon_points
+    polygon_moments
     polygon_summary
 
 
@@ -113,6 +297,7 @@ for angle or "L" shape sections.
     :toctree: generated/
 
     angle_points
+    angle_moments
     angle_summary
 
 
@@ -127,6 +312,7 @@ for double angle or "2L" shape sections.
     :toctree: generated/
 
     double_angle_points
+    double_angle_moments
     double_angle_summary
 
 
@@ -141,6 +327,7 @@ for cruciform or "4L" shape sections.
     :toctree: generated/
 
     cruciform_points
+    cruciform_moments
     cruciform_summary
 
 
@@ -155,6 +342,7 @@ for I-beam sections.
     :toctree: generated/
 
     i_beam_points
+    i_beam_moments
     i_beam_summary
 
 
@@ -169,16 +357,28 @@ for T-beam sections.
     :toctree: generated/
 
     t_beam_points
+    t_beam_moments
     t_beam_summary
 """
 
 from .angle import *
+from .arc import *
+from .arena import *
+from .backend import *
 from .boundary import *
 from .cross_section import *
 from .cruciform import *
 from .double_angle import *
+from .executor import *
+from .hull import *
 from .i_beam import *
 from .multi import *
+from .overlap import *
 from .polygon import *
 from .round import *
+from .section_moments import *
+from .store import *
+from .stream import *
+from .sweep import *
 from .t_beam import *
+from .torsion import *
@@ -1,8 +1,11 @@
 from __future__ import division
 import numpy as np
-from .boundary import section_summary
+from .boundary import _broadcast_params, _rectangle_sums, _stack_points
+from .boundary import _shape_summary
+from .plastic import _rectangle_plastic
+from .section_moments import SectionMoments
 
-__all__ = ['angle_points', 'angle_summary']
+__all__ = ['angle_points', 'angle_moments', 'angle_summary']
 
 
 def angle_points(leg1, leg2, thickness1, thickness2=None):
@@ -29,21 +32,102 @@ def angle_points(leg1, leg2, thickness1, thickness2=None):
     return np.array(p, dtype='float')
 
 
+def _angle_rects(leg1, leg2, thickness1, thickness2, x, y, sx=1, sy=1):
+    """
+    Returns a list of the (xmin, ymin, xmax, ymax) bounds of the two
+    rectangles composing angles with their heels located at the input
+    coordinates. The legs extend in the directions of the input signs.
+
+    Parameters
+    ----------
+    leg1, leg2, thickness1, thickness2 : array
+        The angle dimensions. See :func:`angle_points`.
+    x, y : array
+        The coordinates of the heels of the angles.
+    sx, sy : {1, -1}
+        The directions of the horizontal and vertical legs.
+    """
+    def rect(x0, y0, x1, y1):
+        x0, x1 = x + sx*x0, x + sx*x1
+        y0, y1 = y + sy*y0, y + sy*y1
+        return (np.minimum(x0, x1), np.minimum(y0, y1),
+                np.maximum(x0, x1), np.maximum(y0, y1))
+
+    z = np.zeros_like(leg1)
+    return [rect(z, z, leg2, thickness2), rect(z, thickness2, thickness1, leg1)]
+
+
+def _angle_sums(leg1, leg2, thickness1, thickness2, x, y, sx=1, sy=1):
+    """
+    Returns the raw moment sums about the origin for angles with their heels
+    located at the input coordinates. See :func:`_angle_rects` for the
+    parameters.
+    """
+    r = _angle_rects(leg1, leg2, thickness1, thickness2, x, y, sx, sy)
+    return sum(_rectangle_sums(*q) for q in r)
+
+
+def _angle_hull(leg1, leg2, thickness1, thickness2, x, y, sx=1, sy=1):
+    """
+    Returns a list of the convex hull vertices of the angles described by
+    the input parameters, excluding the heels. See :func:`_angle_sums`
+    for the parameters.
+    """
+    p = [(leg2, 0), (leg2, thickness2), (thickness1, leg1), (0, leg1)]
+    return [(x + sx*u, y + sy*v) for u, v in p]
+
+
+def angle_moments(leg1, leg2, thickness1, thickness2=None):
+    """
+    Returns the :class:`.SectionMoments` of angles with their heels located
+    at the origin. The moments are calculated in closed form, and the
+    dimensions may be arrays, in which case they are broadcast against
+    one another. See :func:`angle_points` for the parameters.
+    """
+    if thickness2 is None:
+        thickness2 = thickness1
+
+    shape, (l1, l2, t1, t2) = _broadcast_params(
+        leg1, leg2, thickness1, thickness2)
+
+    z = np.zeros_like(l1)
+    s = _angle_sums(l1, l2, t1, t2, z, z)
+    bounds = np.column_stack([z, z, l2, l1])
+
+    return SectionMoments._from_sums(shape, s, bounds)
+
+
 def angle_summary(leg1, leg2, thickness1, thickness2=None):
     """
     Returns a dictionary with a summary of angle section properties.
 
+    The properties are calculated in closed form, and the dimensions may be
+    arrays, in which case they are broadcast against one another and each
+    property is returned as an array of the broadcast shape.
+
     Parameters
     ----------
-    leg1 : float
+    leg1 : float or array
         The length of the leg in the vertical direction.
-    leg2 : float
+    leg2 : float or array
         The length of the leg in the horizontal direction.
-    thickness1 : float
+    thickness1 : float or array
         The thickness of `leg1`.
-    thickness2 : float
+    thickness2 : float or array
         The thickness of `leg2`. If None, the thickness is assumed the same
         as `thickness1`.
     """
-    p = angle_points(leg1, leg2, thickness1, thickness2)
-    return section_summary(p)
+    if thickness2 is None:
+        thickness2 = thickness1
+
+    shape, (l1, l2, t1, t2) = _broadcast_params(
+        leg1, leg2, thickness1, thickness2)
+
+    z = np.zeros_like(l1)
+    s = _angle_sums(l1, l2, t1, t2, z, z)
+
+    bounds = np.column_stack([z, z, l2, l1])
+    plastic = _rectangle_plastic(_angle_rects(l1, l2, t1, t2, z, z))
+    hull = _stack_points([(z, z)] + _angle_hull(l1, l2, t1, t2, z, z))
+
+    return _shape_summary(shape, s, bounds, plastic, hull)
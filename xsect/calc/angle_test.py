@@ -1,5 +1,7 @@
 from __future__ import division
 import pytest
+import numpy as np
+from .boundary import section_summary
 from ..data import query_aisc
 from .angle import *
 
@@ -16,3 +18,14 @@ def test_angle_summary():
 
     for k, x in a.items():
         assert pytest.approx(x, 0.01) == b[k]
+
+
+def test_angle_summary_array():
+    t = np.array([0.5, 1.125])
+    a = angle_summary(8, 6, t, 0.75)
+
+    for i, x in enumerate(t):
+        b = section_summary(angle_points(8, 6, x, 0.75))
+
+        for k, v in b.items():
+            assert pytest.approx(a[k][i], rel=1e-9, abs=1e-9) == v
@@ -0,0 +1,325 @@
+from __future__ import division
+import numpy as np
+
+__all__ = ['arc_bulge', 'arc_segments', 'arc_error', 'tessellate']
+
+
+def arc_bulge(angle):
+    """
+    Returns the bulge factor for a circular arc edge subtending the input
+    included angle. A positive angle represents a counterclockwise arc.
+
+    Boundaries may contain exact circular arc edges by specifying a third
+    column of bulge factors in the boundary point array. The bulge factor
+    of a point applies to the edge from that point to the next point
+    in the boundary, with a bulge of zero indicating a straight edge.
+
+    Parameters
+    ----------
+    angle : float
+        The counterclockwise included angle of the arc, in radians. The
+        magnitude of the angle should be less than 2 pi.
+    """
+    return np.tan(0.25 * np.asarray(angle))
+
+
+def _chord_error(angle):
+    """
+    Returns the relative error in the area moment of inertia about the
+    center of a circular sector when its arc is replaced by a chord. This
+    bounds the relative error in the area, which is smaller.
+
+    Parameters
+    ----------
+    angle : array
+        The included angle of the sector, in radians.
+    """
+    d = np.abs(np.asarray(angle, dtype='float'))
+    e = 1 - np.sin(d) * (2 + np.cos(d)) / (3 * np.where(d == 0, 1, d))
+    series = d**2 / 3 - d**4 / 20
+    return np.where(d < 1e-3, series, e)
+
+
+def arc_segments(radius, angle, tol=None, rtol=None):
+    """
+    Returns the minimum number of straight segments required to approximate
+    a circular arc within the specified tolerances.
+
+    Parameters
+    ----------
+    radius : float
+        The radius of the arc.
+    angle : float
+        The included angle of the arc, in radians.
+    tol : float
+        The maximum sagitta, that is the maximum distance between the arc
+        and any segment. If None, the sagitta is not limited.
+    rtol : float
+        The maximum relative error in the area and moment of inertia of the
+        sector swept by the arc. If None, the relative error is not limited.
+    """
+    if tol is None and rtol is None:
+        raise ValueError('At least one of tol or rtol must be specified.')
+
+    angle = abs(angle)
+    n = 1
+
+    if tol is not None and tol < radius:
+        d = 2 * np.arccos(1 - tol / radius)
+        n = max(n, int(np.ceil(angle / d)))
+
+    if rtol is not None:
+        # Refine the estimate from the leading term of the error series
+        d = (3 * rtol)**0.5
+        n = max(n, int(np.ceil(angle / d)))
+
+        while _chord_error(angle / n) > rtol:
+            n += 1
+
+    return n
+
+
+def arc_error(radius, angle, n):
+    """
+    Returns the sagitta and relative error in the area and moment of inertia
+    of the sector swept by a circular arc when approximated by `n` equal
+    straight segments.
+
+    Parameters
+    ----------
+    radius : float
+        The radius of the arc.
+    angle : float
+        The included angle of the arc, in radians.
+    n : int
+        The number of segments.
+    """
+    d = abs(angle) / n
+    sagitta = radius * (1 - np.cos(0.5 * d))
+    return float(sagitta), float(_chord_error(d))
+
+
+def _arc_geometry(p0, p1, bulge):
+    """
+    Returns the centers, radii, start angles, and counterclockwise sweep
+    angles for the arcs spanning between the input points.
+
+    Parameters
+    ----------
+    p0, p1 : array
+        Arrays of (x, y) arc start and end points of shape (K, 2).
+    bulge : array
+        An array of nonzero arc bulge factors of shape (K,).
+    """
+    d = p1 - p0
+    length = np.sqrt(d[:,0]**2 + d[:,1]**2)
+
+    f = 0.25 * (1 - bulge**2) / bulge
+    center = 0.5*(p0 + p1) + f[:,np.newaxis] * np.column_stack([-d[:,1], d[:,0]])
+    radius = 0.25 * length * (1 + bulge**2) / np.abs(bulge)
+
+    v = p0 - center
+    start = np.arctan2(v[:,1], v[:,0])
+    sweep = 4 * np.arctan(bulge)
+
+    return center, radius, start, sweep
+
+
+def _arc_edges(p, offsets):
+    """
+    Returns the indices of the arc edges in the input vertex buffer along with
+    the indices of their end points and their boundary numbers. Returns None
+    if the buffer does not contain arcs.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3). The third column, if
+        present, contains the bulge factors of the edges.
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    """
+    if p.shape[1] < 3:
+        return None
+
+    i = np.nonzero(p[:,2])[0]
+
+    if len(i) == 0:
+        return None
+
+    seg = np.searchsorted(offsets, i, side='right') - 1
+    j = i + 1
+    last = j == offsets[seg + 1]
+    j[last] = offsets[seg[last]]
+
+    return i, j, seg
+
+
+def _segment_arcs(p, offsets):
+    """
+    Returns the arc geometry, as returned by :func:`_arc_geometry`, for all
+    arc edges in the input vertex buffer, along with the boundary number of
+    each arc. Returns None if the buffer does not contain arcs.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    """
+    edges = _arc_edges(p, offsets)
+
+    if edges is None:
+        return None
+
+    i, j, seg = edges
+    return _arc_geometry(p[i,:2], p[j,:2], p[i,2]) + (seg,)
+
+
+def _in_sweep(start, sweep, angles):
+    """
+    Returns a boolean array indicating whether the input angles lie within
+    the sweep of the arcs.
+
+    Parameters
+    ----------
+    start, sweep : array
+        The start and counterclockwise sweep angles of the arcs.
+    angles : array
+        The angles to check.
+    """
+    t = np.mod(np.sign(sweep) * (angles - start), 2*np.pi)
+    return t <= np.abs(sweep)
+
+
+def _arc_extent(center, radius, start, sweep, angles):
+    """
+    Returns the maximum projections of the arcs onto the directions located
+    at the input angles. Where the direction lies outside of the sweep of
+    an arc, the maximum is attained at an end point of the arc, and negative
+    infinity is returned instead.
+
+    Parameters
+    ----------
+    center, radius, start, sweep : array
+        The arc geometry, as returned by :func:`_arc_geometry`.
+    angles : array
+        The direction angles. Must be broadcastable with the arc geometry.
+    """
+    c, s = np.cos(angles), np.sin(angles)
+    proj = center[...,0] * c + center[...,1] * s + radius
+    return np.where(_in_sweep(start, sweep, angles), proj, -np.inf)
+
+
+def _arc_moments(center, radius, start, sweep):
+    """
+    Returns the signed raw moment sums contributed by the circular segments
+    between the arc chords and the arcs. The results have the same scaling
+    as those returned by :func:`.boundary._segment_moments` and so may be
+    added to the straight edge sums of the arc chords. The result is an
+    array of shape (K, 6).
+
+    Parameters
+    ----------
+    center, radius, start, sweep : array
+        The arc geometry, as returned by :func:`_arc_geometry`.
+    """
+    r = radius
+    alpha = 0.5 * np.abs(sweep)
+    sign = np.sign(sweep)
+    sa, ca = np.sin(alpha), np.cos(alpha)
+
+    # Properties in local coordinates about the arc center, with the x'-axis
+    # along the symmetry axis of the segment
+    a = 0.5 * r**2 * (2*alpha - np.sin(2*alpha))
+    q = 2/3 * r**3 * sa**3
+    ixx = r**4 * ((2*alpha + np.sin(2*alpha)) / 8 - 0.5 * ca**3 * sa)
+    iyy = r**4 * ((2*alpha - np.sin(2*alpha)) / 8 - ca * sa**3 / 6)
+
+    # Rotate to global axes and transfer to the origin
+    phi = start + 0.5 * sweep
+    c, s = np.cos(phi), np.sin(phi)
+    cx, cy = center[:,0], center[:,1]
+
+    mx = a*cx + q*c
+    my = a*cy + q*s
+    mxx = ixx*c**2 + iyy*s**2 + 2*cx*q*c + a*cx**2
+    myy = ixx*s**2 + iyy*c**2 + 2*cy*q*s + a*cy**2
+    mxy = (ixx - iyy)*s*c + q*(cx*s + cy*c) + a*cx*cy
+
+    return sign[:,np.newaxis] * np.column_stack([
+        2*a, 6*my, 6*mx, 12*myy, 12*mxx, 24*mxy
+    ])
+
+
+def _arc_bounds(center, radius, start, sweep):
+    """
+    Returns the (xmin, ymin, xmax, ymax) bounds of the arcs at the cardinal
+    directions. Values for directions outside the sweep of an arc are
+    infinite. The result is an array of shape (K, 4).
+
+    Parameters
+    ----------
+    center, radius, start, sweep : array
+        The arc geometry, as returned by :func:`_arc_geometry`.
+    """
+    ang = np.array([np.pi, 1.5*np.pi, 0, 0.5*np.pi])
+    sign = np.array([-1, -1, 1, 1])
+    g = [x[:,np.newaxis] for x in (center, radius, start, sweep)]
+    return sign * _arc_extent(g[0], g[1], g[2], g[3], ang)
+
+
+def tessellate(points, step=0.01, tol=None, rtol=None):
+    """
+    Returns an array of (x, y) boundary points of shape (M, 2) in which any
+    circular arc edges in the input boundary are replaced by straight
+    segments. Boundaries without arc edges are returned with only their
+    (x, y) columns.
+
+    Parameters
+    ----------
+    points : array
+        An array of boundary points of shape (N, 2), or of shape (N, 3) if
+        the boundary contains arc edges. See :func:`arc_bulge`.
+    step : float
+        The maximum arc length of the segments replacing each arc. Not used
+        if `tol` or `rtol` is specified.
+    tol : float
+        The maximum sagitta between each arc and its segments.
+        See :func:`arc_segments`.
+    rtol : float
+        The maximum relative error in the area and moment of inertia of the
+        sector swept by each arc. See :func:`arc_segments`.
+    """
+    p = np.asarray(points, dtype='float')
+    offsets = np.array([0, len(p)])
+    edges = _arc_edges(p, offsets)
+
+    if edges is None:
+        return p[:,:2]
+
+    i, j, _ = edges
+    center, radius, start, sweep = _arc_geometry(p[i,:2], p[j,:2], p[i,2])
+
+    # Number of points contributed by each edge, including its start point
+    n = np.ones(len(p), dtype='int')
+
+    if tol is None and rtol is None:
+        n[i] = np.maximum(1, np.ceil(np.abs(radius * sweep) / step)).astype('int')
+    else:
+        n[i] = [arc_segments(r, a, tol, rtol) for r, a in zip(radius, sweep)]
+
+    q = np.repeat(p[:,:2], n, axis=0)
+    k = np.concatenate([[0], np.cumsum(n)[:-1]])
+
+    for x, c, r, a, b in zip(i, center, radius, start, sweep):
+        t = np.arange(1, n[x]) / n[x]
+        ang = a + t * b
+        q[k[x]+1:k[x]+n[x]] = c + r * np.column_stack([np.cos(ang), np.sin(ang)])
+
+    # Append the end point of a trailing arc
+    if p.shape[0] - 1 in i:
+        q = np.append(q, [p[0,:2]], axis=0)
+
+    return q
@@ -0,0 +1,68 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .arc import *
+
+
+def test_arc_bulge():
+    assert approx(arc_bulge(np.pi)) == 1
+    assert approx(arc_bulge(-np.pi)) == -1
+    assert approx(arc_bulge(0)) == 0
+
+
+def test_arc_segments():
+    # Sagitta tolerance
+    n = arc_segments(100, np.pi, tol=0.1)
+    assert arc_error(100, np.pi, n)[0] <= 0.1
+    assert arc_error(100, np.pi, n - 1)[0] > 0.1
+
+    # Relative tolerance
+    n = arc_segments(100, np.pi, rtol=1e-6)
+    assert arc_error(100, np.pi, n)[1] <= 1e-6
+    assert arc_error(100, np.pi, n - 1)[1] > 1e-6
+
+    # Combined tolerances
+    assert arc_segments(100, np.pi, 0.1, 1e-6) == max(
+        arc_segments(100, np.pi, tol=0.1), arc_segments(100, np.pi, rtol=1e-6))
+
+    with pytest.raises(ValueError):
+        arc_segments(100, np.pi)
+
+
+def test_arc_error():
+    # Single chord across a half circle
+    s, e = arc_error(1, np.pi, 1)
+    assert approx(s) == 1
+    assert approx(e) == 1
+
+    # Small angles use the error series
+    assert approx(arc_error(1, 1e-4, 1)[1], rel=1e-6) == 1e-8 / 3
+
+
+def test_tessellate():
+    # Half disk with a counterclockwise arc
+    p = np.array([(1, 0, arc_bulge(np.pi)), (-1, 0, 0)])
+    q = tessellate(p, step=0.01)
+
+    r = np.linalg.norm(q, axis=1)
+    assert approx(r) == 1
+    assert approx(q[-1]) == (-1, 0)
+    assert np.min(q[:,1]) >= 0
+    assert len(q) > 300
+
+    # Closing arc
+    p = np.array([(-1, 0, 0), (1, 0, arc_bulge(np.pi))])
+    q = tessellate(p, step=0.01)
+    assert approx(q[-1]) == (-1, 0)
+    assert np.min(q[:,1]) >= 0
+
+    # Tolerance
+    p = np.array([(1, 0, arc_bulge(np.pi)), (-1, 0, 0)])
+    q = tessellate(p, tol=0.001)
+    assert len(q) == arc_segments(1, np.pi, tol=0.001) + 1
+
+    # Boundary without arcs
+    p = np.array([(0, 0), (1, 0), (1, 1)])
+    q = tessellate(p)
+    assert approx(q.ravel()) == p.ravel()
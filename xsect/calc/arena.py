@@ -0,0 +1,290 @@
+from __future__ import division
+import numpy as np
+from .boundary import pack_points
+
+__all__ = ['VertexArena']
+
+
+def _shared_array(shape, dtype='float'):
+    """
+    Returns a tuple of a new shared memory block and an array of the input
+    shape and data type backed by the block.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape of the array.
+    dtype : str
+        The data type of the array.
+    """
+    # Imported on use since shared memory requires Python 3.8 or later
+    from multiprocessing.shared_memory import SharedMemory
+
+    dtype = np.dtype(dtype)
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    shm = SharedMemory(create=True, size=size)
+    return shm, np.ndarray(shape, dtype, buffer=shm.buf)
+
+
+def _attach_array(name, shape, dtype='float'):
+    """
+    Returns a tuple of the shared memory block of the input name and an
+    array of the input shape and data type backed by the block.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block.
+    shape : tuple
+        The shape of the array.
+    dtype : str
+        The data type of the array.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype, buffer=shm.buf)
+
+
+class VertexArena():
+    """
+    A class representing a vertex buffer and its boundary offsets stored in
+    a single shared memory block, such that worker processes may attach to
+    the boundaries without copying them. The boundaries may optionally be
+    grouped into composite sections, each consisting of a range of added
+    boundaries followed by a range of subtracted boundaries with weights.
+
+    The process creating the arena owns the shared memory block and must
+    release it by calling :meth:`release`, or by using the arena as a context
+    manager. Processes attaching to the arena by :meth:`attach` must call
+    :meth:`close` when finished, which does not free the block. Arenas
+    require Python 3.8 or later.
+
+    Parameters
+    ----------
+    points : list
+        A list of arrays of (x, y) boundary coordinates of shape (N, 2), or
+        of shape (N, 3) if the boundaries contain arc edges.
+
+    Examples
+    --------
+    >>> points = [round_points(d, 0.5) for d in np.linspace(10, 20, 100)]
+    >>> with VertexArena(points) as arena, BatchExecutor(2) as executor:
+    ...     summary = executor.arena_summaries(arena)
+    """
+    def __init__(self, points):
+        buffer, offsets = pack_points(points)
+        m = len(offsets) - 1
+        self._create(buffer, offsets, [0, m], [m], np.ones(m))
+
+    def __repr__(self):
+        return '{}(name={!r}, boundaries={}, points={})'.format(
+            type(self).__name__, self.name, len(self), self.buffer.shape[0])
+
+    def __len__(self):
+        return self.offsets.shape[0] - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.owner:
+            self.release()
+        else:
+            self.close()
+
+    def __getstate__(self):
+        raise TypeError('{} cannot be pickled. Pass its handle() to workers '
+            'instead.'.format(type(self).__name__))
+
+    @classmethod
+    def from_sections(cls, sections):
+        """
+        Initializes an arena from a list of composite sections.
+
+        Parameters
+        ----------
+        sections : list
+            A list of dictionaries containing the `add` boundaries and the
+            optional `subtract` boundaries and `weights` of each section, as
+            accepted by :func:`.multi_section_summary`.
+        """
+        points, groups, n_add, weights = [], [0], [], []
+
+        for x in sections:
+            add, subtract = list(x['add']), list(x.get('subtract', []))
+            w = x.get('weights')
+            points.extend(add + subtract)
+            groups.append(len(points))
+            n_add.append(len(add))
+            weights.append(np.ones(len(add) + len(subtract)) if w is None
+                           else np.asarray(w, dtype='float'))
+
+        buffer, offsets = pack_points(points)
+        weights = np.concatenate(weights) if weights else np.zeros(0)
+
+        obj = cls.__new__(cls)
+        obj._create(buffer, offsets, groups, n_add, weights)
+        return obj
+
+    def _create(self, buffer, offsets, groups, n_add, weights):
+        """
+        Creates the shared memory block and copies the input arrays into it.
+
+        Parameters
+        ----------
+        buffer : array
+            The vertex buffer of shape (K, C).
+        offsets : array
+            The boundary offsets of shape (M + 1,).
+        groups : array
+            The section offsets into the boundaries of shape (S + 1,).
+        n_add : array
+            The number of added boundaries in each section of shape (S,).
+        weights : array
+            The weights of the boundaries of shape (M,).
+        """
+        m, s = len(offsets) - 1, len(groups) - 1
+        shape = (m, s) + buffer.shape
+        shm, a = _shared_array(_arena_size(shape))
+        self._set(shm, shape, a, True)
+
+        self.offsets[:] = offsets
+        self.groups[:] = groups
+        self.n_add[:] = n_add
+        self.weights[:] = weights
+        self.buffer[:] = buffer
+
+    def _set(self, shm, shape, a, owner):
+        """
+        Sets the array views of the arena onto the shared memory block.
+
+        Parameters
+        ----------
+        shm : :class:`multiprocessing.shared_memory.SharedMemory`
+            The shared memory block.
+        shape : tuple
+            A tuple of the number of boundaries, the number of sections, and
+            the shape of the vertex buffer.
+        a : array
+            The flat array backed by the shared memory block.
+        owner : bool
+            True if the arena owns the block.
+        """
+        m, s, k, c = shape
+        i = np.cumsum([0, m + 1, s + 1, s, m, k * c])
+        ints = a.view('int64')
+
+        self._shm = shm
+        self._shape = shape
+        self.name = shm.name
+        self.owner = owner
+        self.offsets = ints[i[0]:i[1]]
+        self.groups = ints[i[1]:i[2]]
+        self.n_add = ints[i[2]:i[3]]
+        self.weights = a[i[3]:i[4]]
+        self.buffer = a[i[4]:i[5]].reshape(k, c)
+
+    def handle(self):
+        """
+        Returns a picklable handle which may be passed to worker processes
+        to attach to the arena by :meth:`attach`.
+        """
+        return (self.name, self._shape)
+
+    @classmethod
+    def attach(cls, handle):
+        """
+        Attaches to the arena of the input handle without copying its data.
+        The returned arena does not own the shared memory block and should be
+        closed by :meth:`close` when finished.
+
+        Parameters
+        ----------
+        handle : tuple
+            The handle returned by :meth:`handle`.
+        """
+        name, shape = handle
+        shm, a = _attach_array(name, _arena_size(shape))
+        obj = cls.__new__(cls)
+        obj._set(shm, shape, a, False)
+        return obj
+
+    def boundaries(self, i=0, j=None):
+        """
+        Returns a tuple of the vertex buffer and offsets for the range of
+        boundaries from `i` to `j`. The vertex buffer is a view of the
+        shared memory block.
+
+        Parameters
+        ----------
+        i, j : int
+            The start and stop boundary indices. If `j` is None, the range
+            extends to the last boundary.
+        """
+        j = len(self) if j is None else j
+        offsets = self.offsets[i:j+1]
+        return self.buffer[offsets[0]:offsets[-1]], offsets - offsets[0]
+
+    def section(self, i):
+        """
+        Returns a dictionary of the added and subtracted boundaries and the
+        weights of the composite section at the input index. The boundaries
+        are views of the shared memory block.
+
+        Parameters
+        ----------
+        i : int
+            The section index.
+        """
+        b0, b1 = self.groups[i], self.groups[i+1]
+        n = b0 + self.n_add[i]
+        o = self.offsets
+        points = [self.buffer[o[k]:o[k+1]] for k in range(b0, b1)]
+        return dict(add=points[:n-b0], subtract=points[n-b0:],
+                    weights=self.weights[b0:b1])
+
+    def section_count(self):
+        """
+        Returns the number of composite sections in the arena.
+        """
+        return self.groups.shape[0] - 1
+
+    def close(self):
+        """
+        Detaches from the shared memory block. The arrays of the arena may
+        not be accessed after closing.
+        """
+        if self._shm is not None:
+            self.offsets = self.groups = self.n_add = None
+            self.weights = self.buffer = None
+            self._shm.close()
+            self._shm = None
+
+    def release(self):
+        """
+        Detaches from and frees the shared memory block. Only the owner of
+        the arena may release it.
+        """
+        if not self.owner:
+            raise ValueError('Only the owner of the arena may release it.')
+
+        if self._shm is not None:
+            shm = self._shm
+            self.close()
+            shm.unlink()
+
+
+def _arena_size(shape):
+    """
+    Returns the number of 8 byte values in the shared memory block of an
+    arena.
+
+    Parameters
+    ----------
+    shape : tuple
+        A tuple of the number of boundaries, the number of sections, and
+        the shape of the vertex buffer.
+    """
+    m, s, k, c = shape
+    return 2 * (m + s + 1) + k * c
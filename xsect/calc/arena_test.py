@@ -0,0 +1,94 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .angle import angle_points
+from .boundary import pack_points, batch_moments, batch_section_summary
+from .executor import BatchExecutor
+from .multi import multi_section_summary
+from .round import round_points
+from .arena import *
+
+pytest.importorskip('multiprocessing.shared_memory')
+
+
+def sample_points():
+    points = [round_points(d, 0.5) for d in np.linspace(10, 20, 10)]
+    return points + [angle_points(8, 6, t) for t in (0.5, 0.75, 1)]
+
+
+def test_arena():
+    points = sample_points()
+    buffer, offsets = pack_points(points)
+
+    with VertexArena(points) as arena:
+        assert len(arena) == len(points)
+        assert (arena.buffer == buffer).all()
+        assert (arena.offsets == offsets).all()
+
+        other = VertexArena.attach(arena.handle())
+        p, o = other.boundaries(2, 4)
+        assert (p == np.concatenate(points[2:4])).all()
+        assert list(o) == [0, len(points[2]), len(points[2]) + len(points[3])]
+        del p
+
+        with pytest.raises(ValueError):
+            other.release()
+
+        other.close()
+
+    with pytest.raises(FileNotFoundError):
+        VertexArena.attach(arena.handle())
+
+
+def test_arena_summaries():
+    points = sample_points()
+    sol = batch_section_summary(*pack_points(points))
+
+    with VertexArena(points) as arena, BatchExecutor(2, 500) as executor:
+        m = executor.arena_moments(arena)
+        odict = executor.arena_summaries(arena)
+        plastic = executor.arena_summaries(arena, plastic=True)
+
+    assert approx(m) == batch_moments(*pack_points(points))
+
+    for k, x in sol.items():
+        assert approx(odict[k]) == x
+
+    sol = batch_section_summary(*pack_points(points), plastic=True)
+    assert approx(plastic['plast_sect_mod_y']) == sol['plast_sect_mod_y']
+
+
+def test_arena_multi_summaries():
+    sections = [
+        dict(add=[round_points(d)], subtract=[round_points(d - 1)])
+        for d in (10, 12, 14)
+    ]
+    sections.append(dict(add=[angle_points(8, 6, 1)], weights=[2]))
+
+    with VertexArena.from_sections(sections) as arena:
+        assert arena.section_count() == 4
+
+        with BatchExecutor(2) as executor:
+            odict = executor.arena_multi_summaries(arena)
+
+    for i, x in enumerate(sections):
+        sol = multi_section_summary(**x)
+        for k, y in sol.items():
+            assert approx(odict[k][i]) == y
+
+
+def test_arena_empty():
+    with VertexArena([]) as arena, BatchExecutor(2) as executor:
+        m = executor.arena_moments(arena)
+        odict = executor.arena_summaries(arena)
+
+    assert m.shape == (0, 10)
+    assert all(len(x) == 0 for x in odict.values())
+    assert 'area' in odict
+
+    with VertexArena.from_sections([]) as arena, BatchExecutor(2) as executor:
+        odict = executor.arena_multi_summaries(arena)
+
+    assert all(len(x) == 0 for x in odict.values())
+    assert 'area' in odict
@@ -0,0 +1,167 @@
+from __future__ import division
+import warnings
+import numpy as np
+
+__all__ = [
+    'set_backend',
+    'get_backend',
+]
+
+BACKENDS = ('numpy', 'numba')
+_BACKEND = 'numpy' # The active kernel backend
+_KERNELS = {} # Compiled kernels by name
+
+
+def set_backend(name):
+    """
+    Sets the kernel backend used by the boundary moment calculations. Returns
+    the previous backend.
+
+    The `numba` backend compiles fused loop kernels, which make a single pass
+    over the vertex buffer without allocating full length temporaries and
+    release the GIL. Buffers the kernels do not support, such as those
+    containing arc edges or of single precision, fall back to the NumPy
+    implementation. The kernels differ from the NumPy implementation only in
+    the order of summation, so the results agree to within a relative
+    tolerance of 1e-12 of the magnitude of the summed terms. If Numba is not
+    installed, a warning is issued and the `numpy` backend is used.
+
+    Parameters
+    ----------
+    name : {'numpy', 'numba'}
+        The name of the backend.
+    """
+    global _BACKEND
+
+    if name not in BACKENDS:
+        raise ValueError('Backend {!r} must be one of {}.'
+            .format(name, BACKENDS))
+
+    if name == 'numba' and not _has_numba():
+        warnings.warn('Numba is not installed. Falling back to the NumPy '
+            'backend.')
+        name = 'numpy'
+
+    prev = _BACKEND
+    _BACKEND = name
+    return prev
+
+
+def get_backend():
+    """
+    Returns the name of the active kernel backend. See :func:`set_backend`.
+    """
+    return _BACKEND
+
+
+def _has_numba():
+    """
+    Returns True if Numba is installed. Numba is only imported when the
+    `numba` backend is selected.
+    """
+    try:
+        import numba
+    except ImportError:
+        return False
+    return True
+
+
+def _kernel(name):
+    """
+    Returns the compiled kernel of the input name if the `numba` backend
+    is active, compiling it on the first call. Otherwise, returns None.
+
+    Parameters
+    ----------
+    name : str
+        The name of the kernel function, without the leading underscore.
+    """
+    if _BACKEND != 'numba':
+        return None
+
+    if name not in _KERNELS:
+        import numba
+        func = globals()['_' + name]
+        _KERNELS[name] = numba.njit(nogil=True, cache=True)(func)
+
+    return _KERNELS[name]
+
+
+def _segment_sums(p, offsets):
+    """
+    Returns the signed raw moment sums and bounds for the straight edged
+    boundaries packed in the input vertex buffer, as returned by
+    :func:`.boundary._segment_moments`. The moments are summed about the
+    first point of each boundary. Returns a tuple of arrays of shape (M, 6)
+    and (M, 4).
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    """
+    m = offsets.shape[0] - 1
+    s = np.zeros((m, 6))
+    bounds = np.zeros((m, 4))
+
+    for k in range(m):
+        i0, i1 = offsets[k], offsets[k+1]
+        ox, oy = p[i0,0], p[i0,1]
+        xmin, ymin, xmax, ymax = ox, oy, ox, oy
+
+        for i in range(i0, i1):
+            j = i + 1 if i + 1 < i1 else i0
+            x, y = p[i,0] - ox, p[i,1] - oy
+            x1, y1 = p[j,0] - ox, p[j,1] - oy
+            sx, sy = x + x1, y + y1
+            c = x * y1 - x1 * y
+
+            s[k,0] += c
+            s[k,1] += c * sy
+            s[k,2] += c * sx
+            s[k,3] += c * (sy*sy - y*y1)
+            s[k,4] += c * (sx*sx - x*x1)
+            s[k,5] += c * (sx*sy + x*y + x1*y1)
+
+            xmin, xmax = min(xmin, p[i,0]), max(xmax, p[i,0])
+            ymin, ymax = min(ymin, p[i,1]), max(ymax, p[i,1])
+
+        bounds[k,0], bounds[k,1] = xmin, ymin
+        bounds[k,2], bounds[k,3] = xmax, ymax
+
+    return s, bounds
+
+
+def _principal_fibers(p, offsets, centroid, alpha):
+    """
+    Returns the maximum distances of the boundary points from the centroidal
+    principal axes for the boundaries packed in the input vertex buffer, as
+    returned for straight edges by :func:`.boundary._segment_principal_fibers`.
+    Returns a tuple of arrays of shape (M,).
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    centroid : array
+        An array of boundary centroids of shape (M, 2).
+    alpha : array
+        An array of principal angles of shape (M,).
+    """
+    m = offsets.shape[0] - 1
+    v = np.zeros(m)
+    u = np.zeros(m)
+
+    for k in range(m):
+        c, s = np.cos(alpha[k]), np.sin(alpha[k])
+
+        for i in range(offsets[k], offsets[k+1]):
+            qx, qy = p[i,0] - centroid[k,0], p[i,1] - centroid[k,1]
+            v[k] = max(v[k], abs(qy*c - qx*s))
+            u[k] = max(u[k], abs(qx*c + qy*s))
+
+    return v, u
@@ -0,0 +1,58 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .angle import angle_points
+from .boundary import pack_points, batch_moments, batch_section_summary
+from .boundary import _segment_moments, _segment_principal_fibers
+from .boundary import _principal_angles
+from .round import round_points
+from .backend import *
+from .backend import _segment_sums, _principal_fibers
+
+
+def sample_buffer():
+    points = [angle_points(8, 6, 1), round_points(10, 1) + (1e3, -50),
+              np.array([(0, 0), (1, 0), (0, 2)])]
+    return pack_points(points)
+
+
+def test_segment_sums():
+    p, offsets = sample_buffer()
+    s, o, bounds = _segment_moments(p, offsets)
+    t, b = _segment_sums(p, offsets)
+
+    assert approx(t, rel=1e-12, abs=1e-9) == s
+    assert (b == bounds).all()
+
+
+def test_principal_fibers():
+    p, offsets = sample_buffer()
+    m = batch_moments(p, offsets)
+    v, u = _segment_principal_fibers(p, offsets, m)
+    a, b = _principal_fibers(p, offsets, m[:,1:3], _principal_angles(m))
+
+    assert approx(a, rel=1e-12) == v
+    assert approx(b, rel=1e-12) == u
+
+
+def test_set_backend():
+    with pytest.raises(ValueError):
+        set_backend('fortran')
+
+    assert get_backend() == 'numpy'
+
+
+def test_numba_backend():
+    pytest.importorskip('numba')
+    p, offsets = sample_buffer()
+    sol = batch_section_summary(p, offsets)
+    prev = set_backend('numba')
+
+    try:
+        odict = batch_section_summary(p, offsets)
+    finally:
+        set_backend(prev)
+
+    for k, x in sol.items():
+        assert approx(odict[k], rel=1e-12, abs=1e-9) == x
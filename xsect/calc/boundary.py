@@ -1,11 +1,20 @@
 from __future__ import division
 import numpy as np
-import matplotlib.pyplot as plt
+from .arc import _segment_arcs, _arc_moments, _arc_bounds, _arc_extent
+from .arc import tessellate
+from .backend import _kernel
+from .hull import HullIndex
+from .plastic import _segment_plastic, _axis_plastic
 
 __all__ = [
     'rotate2',
     'close_points',
     'dimensions',
+    'pack_points',
+    'set_precision',
+    'get_precision',
+    'moments',
+    'batch_moments',
     'area',
     'centroid',
     'inertias',
@@ -17,11 +26,24 @@ __all__ = [
     'principal_extreme_fibers',
     'elast_sect_mod',
     'principal_elast_sect_mod',
+    'plast_sect_mod',
+    'batch_plast_sect_mod',
+    'plastic_neutral_axes',
+    'axis_inertias',
+    'axis_gyradii',
+    'axis_extreme_fibers',
+    'axis_elast_sect_mod',
+    'axis_plast_sect_mod',
+    'axis_summary',
     'plot_section',
-    'section_summary'
+    'section_summary',
+    'batch_section_summary'
 ]
 
 TOL = 1e-8 # Tolerance for principal angles
+PRECISIONS = ('double', 'single', 'compensated')
+_PRECISION = 'double' # Default precision mode of the moment kernels
+EDGE_BLOCK_SIZE = 16384 # Maximum edges summed at once by the moment kernels
 
 
 def rotate2(x, angle, origin=(0, 0)):
@@ -43,11 +65,9 @@ def rotate2(x, angle, origin=(0, 0)):
     x = x - o
 
     c, s = np.cos(angle), np.sin(angle)
-    r = np.array([[c, -s], [s, c]])
+    r = np.array([[c, s], [-s, c]])
 
-    x = np.array([np.dot(r, v) for v in x])
-
-    return x + o
+    return np.dot(x, r) + o
 
 
 def close_points(points):
@@ -61,9 +81,11 @@ def close_points(points):
         An array of (x, y) coordinates of shape (N, 2).
     """
     p = np.asarray(points)
-    if (p[0] == p[-1]).all():
+    if (p[0,:2] == p[-1,:2]).all():
         return p
-    return np.append(p, [p[0]], axis=0)
+    q = np.append(p, [p[0]], axis=0)
+    q[-1,2:] = 0
+    return q
 
 
 def dimensions(points):
@@ -76,9 +98,795 @@ def dimensions(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
+    m = moments(points)
+    return m[8:10] - m[6:8]
+
+
+def pack_points(points):
+    """
+    Packs a list of boundary point arrays into a single contiguous vertex
+    buffer. Returns a tuple of the buffer of shape (K, 2) and an array of
+    offsets of shape (M + 1,), where the points for boundary `i` are located
+    at `buffer[offsets[i]:offsets[i+1]]`. If any boundary contains arc edges,
+    the buffer is of shape (K, 3), and the boundaries without arc edges are
+    padded with zero bulges.
+
+    Parameters
+    ----------
+    points : list
+        A list of arrays of (x, y) coordinates. Each array should be of
+        the shape (N, 2), or of shape (N, 3) if the boundary contains
+        arc edges.
+    """
+    points = [np.asarray(x, dtype='float') for x in points]
+    n = [len(x) for x in points]
+
+    offsets = np.zeros(len(points) + 1, dtype='int')
+    np.cumsum(n, out=offsets[1:])
+
+    if len(points) == 0:
+        return np.zeros((0, 2)), offsets
+
+    k = max(x.shape[1] for x in points)
+
+    if all(x.shape[1] == k for x in points):
+        return np.concatenate(points), offsets
+
+    p = np.zeros((offsets[-1], k))
+
+    for x, i in zip(points, offsets):
+        p[i:i+len(x),:x.shape[1]] = x
+
+    return p, offsets
+
+
+def set_precision(mode):
+    """
+    Sets the default precision mode of the moment calculations for all
+    subsequent calls that do not specify a precision. Returns the previous
+    mode.
+
+    Parameters
+    ----------
+    mode : {'double', 'single', 'compensated'}
+        The precision mode. In `double` mode, the moment sums are calculated
+        in double precision about the first point of each boundary. In
+        `single` mode, the vertex buffer and all temporaries are stored in
+        single precision, halving the memory required for large batches at
+        the cost of accuracy, which is suited to screening runs. In
+        `compensated` mode, the boundaries are shifted to the centers of
+        their bounds and the moment sums are reduced by compensated pairwise
+        summation, which limits the rounding error for finely discretized
+        shapes located far from the origin.
+    """
+    global _PRECISION
+    prev = _PRECISION
+    _PRECISION = _get_precision(mode)
+    return prev
+
+
+def get_precision():
+    """
+    Returns the default precision mode of the moment calculations. See
+    :func:`set_precision`.
+    """
+    return _PRECISION
+
+
+def _get_precision(precision=None):
+    """
+    Returns the precision mode for the input, which is the default mode if
+    the input is None.
+
+    Parameters
+    ----------
+    precision : str
+        The precision mode. See :func:`set_precision`.
+    """
+    if precision is None:
+        return _PRECISION
+
+    if precision not in PRECISIONS:
+        raise ValueError('Precision {!r} must be one of {}.'
+            .format(precision, PRECISIONS))
+
+    return precision
+
+
+def _precision_dtype(precision):
+    """
+    Returns the data type of the vertex buffer for the precision mode.
+
+    Parameters
+    ----------
+    precision : {'double', 'single', 'compensated'}
+        The precision mode.
+    """
+    return 'float32' if precision == 'single' else 'float'
+
+
+def _pairwise_sum(t, offsets, block=64):
+    """
+    Returns the sums of the segments of the input array along its first axis
+    using compensated pairwise summation. The values are first summed in
+    short blocks, as in the pairwise summation of :func:`numpy.sum`, after
+    which adjacent block sums within each segment are summed in pairs until
+    a single value per segment remains, with the rounding error of each
+    addition accumulated separately by the exact two-sum transformation.
+    The result is an array of shape (M,) + t.shape[1:].
+
+    Parameters
+    ----------
+    t : array
+        An array of values to sum of shape (K, ...).
+    offsets : array
+        An array of segment offsets into the values of shape (M + 1,).
+    block : int
+        The number of values summed directly in each block.
+    """
+    offsets = np.asarray(offsets)
+    n = -(-np.diff(offsets) // block)
+    nb = np.zeros(len(n) + 1, dtype='int')
+    np.cumsum(n, out=nb[1:])
+
+    seg = np.repeat(np.arange(len(n)), n)
+    i = offsets[seg] + block * (np.arange(nb[-1]) - nb[seg])
+    v = np.add.reduceat(np.asarray(t, dtype='float'), i, axis=0)
+    e = np.zeros_like(v)
+
+    while np.any(n > 1):
+        start = np.zeros_like(n)
+        np.cumsum(n[:-1], out=start[1:])
+        i = np.nonzero((np.arange(len(seg)) - start[seg]) % 2 == 0)[0]
+        has = np.zeros(len(i), dtype='bool')
+        has[:-1] = seg[i[:-1] + 1] == seg[i[:-1]]
+        has[-1] = i[-1] + 1 < len(seg) and seg[i[-1] + 1] == seg[i[-1]]
+
+        a, ea = v[i], e[i]
+        j = i[has] + 1
+        b = np.zeros_like(a)
+        b[has] = v[j]
+        ea[has] += e[j]
+
+        # Exact two-sum of the pairs
+        s = a + b
+        bb = s - a
+        err = (a - (s - bb)) + (b - bb)
+
+        v, e, seg = s, ea + err, seg[i]
+        n = (n + 1) // 2
+
+    return v + e
+
+
+def _check_offsets(points, offsets, dtype='float'):
+    """
+    Returns the vertex buffer and offsets for the input points. If the offsets
+    are None, the points are assumed to be a stack of boundaries of shape
+    (M, N, 2).
+
+    Parameters
+    ----------
+    points : array
+        A vertex buffer of shape (K, 2) or a stack of boundaries of
+        shape (M, N, 2).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    dtype : str
+        The data type of the returned vertex buffer.
+    """
+    p = np.asarray(points, dtype=dtype)
+
+    if offsets is None:
+        if p.ndim != 3:
+            raise ValueError('Points must be of shape (M, N, 2) if no '
+                'offsets are specified.')
+        m, n = p.shape[:2]
+        offsets = np.arange(0, m*n + 1, n)
+        p = p.reshape(-1, p.shape[-1])
+    else:
+        offsets = np.asarray(offsets, dtype='int')
+
+        if offsets[0] != 0 or offsets[-1] != p.shape[0]:
+            raise ValueError('Offsets must start at zero and end at the length '
+                'of the vertex buffer.')
+
+    if np.any(np.diff(offsets) <= 0):
+        raise ValueError('Every boundary must contain at least one point.')
+
+    return p, offsets
+
+
+def _edge_moments(x, y, x1, y1):
+    """
+    Returns the signed raw moment terms of the straight edges from the points
+    (x, y) to (x1, y1), which summed over a closed boundary give the raw
+    moment sums described in :func:`_segment_moments`. The result is an
+    array of shape (K, 6).
+
+    Parameters
+    ----------
+    x, y : array
+        The coordinates of the edge start points.
+    x1, y1 : array
+        The coordinates of the edge end points.
+    """
+    sx, sy = x + x1, y + y1
+    c = x * y1 - x1 * y
+
+    return np.column_stack([
+        c,
+        c * sy,
+        c * sx,
+        c * (sy*sy - y*y1),
+        c * (sx*sx - x*x1),
+        c * (sx*sy + x*y + x1*y1)
+    ])
+
+
+def _edge_sums(x, y, x1, y1, start, columns=6):
+    """
+    Returns the sums of the raw moment terms of :func:`_edge_moments` over
+    the segments of edges beginning at the start indices. The terms are
+    calculated and summed one column at a time over blocks of the edges,
+    such that the terms of all edges are not held at once. Each segment is
+    summed in runs of at most :data:`EDGE_BLOCK_SIZE` edges, which are then
+    summed in order, so the sums of a segment do not depend on its position
+    in the arrays. The result is an array of shape (M, columns).
+
+    Parameters
+    ----------
+    x, y : array
+        The coordinates of the edge start points.
+    x1, y1 : array
+        The coordinates of the edge end points.
+    start : array
+        The indices of the first edge of each segment of shape (M,).
+    columns : int
+        The number of leading raw moment sums to calculate.
+    """
+    start = np.asarray(start, dtype='int')
+    size = EDGE_BLOCK_SIZE
+    n = np.diff(np.append(start, len(x)))
+
+    # Split the segments into runs, and the runs into blocks of whole runs
+    k = -(-n // size)
+    first = np.zeros(len(k), dtype='int')
+    np.cumsum(k[:-1], out=first[1:])
+    seg = np.repeat(np.arange(len(k)), k)
+    runs = start[seg] + size * (np.arange(len(seg)) - first[seg])
+    blocks = np.searchsorted(runs, np.arange(0, len(x), size))
+    blocks = np.unique(np.append(blocks, len(runs)))
+
+    s = np.empty((len(runs), columns), dtype=x.dtype)
+    buf = np.empty(min(2 * size, len(x)), dtype=x.dtype)
+
+    for r0, r1 in zip(blocks[:-1], blocks[1:]):
+        i = runs[r0]
+        j = runs[r1] if r1 < len(runs) else len(x)
+        _block_sums(x[i:j], y[i:j], x1[i:j], y1[i:j], runs[r0:r1] - i,
+                    s[r0:r1], buf[:j-i])
+
+    if len(runs) == len(start):
+        return s
+
+    return np.add.reduceat(s, first, axis=0)
+
+
+def _block_sums(x, y, x1, y1, start, out, buf):
+    """
+    Calculates the sums of the raw moment terms of :func:`_edge_moments` over
+    the segments of a block of edges, writing them to the output array.
+
+    Parameters
+    ----------
+    x, y : array
+        The coordinates of the edge start points.
+    x1, y1 : array
+        The coordinates of the edge end points.
+    start : array
+        The indices of the first edge of each segment of shape (M,).
+    out : array
+        The output array of shape (M, C), where C is the number of leading
+        raw moment sums to calculate.
+    buf : array
+        A work array of the length of the edges.
+    """
+    columns = out.shape[1]
+
+    def dot(w):
+        return np.add.reduceat(np.multiply(c, w, out=buf), start)
+
+    c = x * y1
+    c -= x1 * y
+    out[:,0] = np.add.reduceat(c, start)
+
+    if columns > 1:
+        sy = y + y1
+        out[:,1] = dot(sy)
+
+    if columns > 2:
+        sx = x + x1
+        out[:,2] = dot(sx)
+
+    if columns > 3:
+        w = sy * sy
+        w -= y * y1
+        out[:,3] = dot(w)
+
+        np.multiply(sx, sx, out=w)
+        w -= x * x1
+        out[:,4] = dot(w)
+
+        np.multiply(sx, sy, out=w)
+        w += x * y
+        w += x1 * y1
+        out[:,5] = dot(w)
+
+
+def _boundary_sums(points, columns):
+    """
+    Returns the leading raw moment sums, as described in
+    :func:`_segment_moments`, of a single boundary along with the point about
+    which they were summed, without calculating the bounds or remaining sums.
+    Returns None if the boundary contains arc edges, the precision mode is
+    compensated, or a compiled kernel is available, in which case
+    :func:`moments` should be used instead.
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    columns : int
+        The number of leading raw moment sums to calculate.
+    """
+    precision = _get_precision()
+    p = np.asarray(points, dtype=_precision_dtype(precision))
+
+    if (p.ndim != 2 or p.shape[1] != 2 or len(p) < 2
+            or precision == 'compensated'
+            or _kernel('segment_sums') is not None):
+        return None
+
+    # The closing edge ends at the origin and so contributes nothing
+    o = p[0]
+    x = p[:,0] - o[0]
+    y = p[:,1] - o[1]
+    s = _edge_sums(x[:-1], y[:-1], x[1:], y[1:], [0], columns)
+
+    return s[0], o
+
+
+def _segment_moments(p, offsets, precision='double'):
+    """
+    Returns the signed raw moment sums for the boundaries packed in the
+    input vertex buffer, along with the local origins about which they were
+    summed and the bounds of each boundary. The last point of each boundary
+    is connected back to its first, so closing the boundaries beforehand is
+    not required.
+
+    The raw moment sums are an array of shape (M, 6) containing the double
+    area, six times the first moments, twelve times the second moments,
+    and twenty-four times the product moment.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2), or of shape (K, 3) if the boundaries
+        contain arc edges.
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. See :func:`set_precision`. In single mode, the
+        vertex buffer should be of single precision.
+    """
+    start = offsets[:-1]
+    n = np.diff(offsets)
+    arcs = _segment_arcs(p, offsets)
+    kernel = _kernel('segment_sums')
+
+    if kernel is not None and arcs is None and precision == 'double':
+        s, bounds = kernel(p, offsets)
+        return s, p[start,:2], bounds
+
+    bounds = np.column_stack([
+        np.minimum.reduceat(p[:,:2], start, axis=0),
+        np.maximum.reduceat(p[:,:2], start, axis=0)
+    ])
+
+    # Moments are summed about the first point of each boundary, or the
+    # center of its bounds in compensated mode, to limit cancellation for
+    # shapes located far from the origin
+    if precision == 'compensated':
+        o = 0.5 * (bounds[:,:2] + bounds[:,2:])
+    else:
+        o = p[start,:2]
+
+    x = p[:,0] - np.repeat(o[:,0], n)
+    y = p[:,1] - np.repeat(o[:,1], n)
+
+    nxt = np.arange(1, p.shape[0] + 1)
+    nxt[offsets[1:] - 1] = start
+
+    if arcs is None and precision != 'compensated':
+        s = _edge_sums(x, y, x[nxt], y[nxt], start)
+    else:
+        t = _edge_moments(x, y, x[nxt], y[nxt])
+
+        if arcs is not None:
+            # Add the circular segments between the arc chords and arcs
+            center, radius, ang, sweep, seg = arcs
+            i = np.nonzero(p[:,2])[0]
+            t[i] += _arc_moments(center - o[seg], radius, ang, sweep)
+
+        if precision == 'compensated':
+            s = _pairwise_sum(t, offsets)
+        else:
+            s = np.add.reduceat(t, start, axis=0)
+
+    if arcs is not None:
+        b = _arc_bounds(center, radius, ang, sweep)
+        np.minimum.at(bounds[:,:2], seg, b[:,:2])
+        np.maximum.at(bounds[:,2:], seg, b[:,2:])
+
+    return s, o, bounds
+
+
+def _raw_to_moments(s, origin, bounds):
+    """
+    Converts raw moment sums calculated about local origins into an array
+    of area, centroid, centroidal inertias, and bounds of shape (M, 10).
+
+    Parameters
+    ----------
+    s : array
+        An array of raw moment sums of shape (M, 6) as returned by
+        :func:`_segment_moments`.
+    origin : array
+        An array of (x, y) origins about which the raw moments were summed
+        of shape (M, 2).
+    bounds : array
+        An array of (xmin, ymin, xmax, ymax) bounds of shape (M, 4).
+    """
+    a2, qx, qy, ixx, iyy, ixy = s.T
+    sign = np.sign(a2)
+
+    a = 0.5 * a2
+    cx = qy / (3 * a2)
+    cy = qx / (3 * a2)
+
+    ix = sign * (ixx / 12 - a * cy**2)
+    iy = sign * (iyy / 12 - a * cx**2)
+    ixy = sign * (ixy / 24 - a * cx * cy)
+
+    return np.column_stack([np.abs(a), cx + origin[:,0], cy + origin[:,1],
+                            ix, iy, ixy, bounds])
+
+
+def moments(points, precision=None):
+    """
+    Returns the area, centroid, centroidal moment of inertias, and bounds
+    for the shape defined by the input boundary points. All values are
+    derived from a single pass over the boundary edges. The result is an
+    array of shape (10,).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2). If the boundary
+        contains circular arc edges, an array of (x, y, bulge) values of
+        shape (N, 3), as described in :func:`.arc_bulge`.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. If None, the default mode is used. See
+        :func:`set_precision`.
+
+    Returns
+    -------
+    area : float
+        The cross sectional area.
+    x, y : float
+        The x and y centroid coordinates.
+    inertia_x, inertia_y : float
+        The moment of inertias about the centroidal x and y axes.
+    inertia_xy : float
+        The product of inertia about the centroid.
+    xmin, ymin, xmax, ymax : float
+        The bounds of the boundary points.
+    """
     p = np.asarray(points)
-    mn, mx = np.min(p, axis=0), np.max(p, axis=0)
-    return mx - mn
+    return batch_moments(p, [0, p.shape[0]], precision)[0]
+
+
+def batch_moments(points, offsets=None, precision=None):
+    """
+    Returns the moments, as described by :func:`moments`, for many
+    independent boundaries at once. The result is an array of shape (M, 10),
+    which is of single precision in single precision mode.
+
+    Parameters
+    ----------
+    points : array
+        Either a stack of boundaries of shape (M, N, 2) or a vertex buffer
+        of shape (K, 2) containing the concatenated points of all boundaries,
+        such as returned by :func:`pack_points`.
+    offsets : array
+        An array of shape (M + 1,) of boundary offsets into the vertex buffer.
+        If None, the points are assumed to be a stack of boundaries.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. If None, the default mode is used. See
+        :func:`set_precision`.
+    """
+    precision = _get_precision(precision)
+    p, offsets = _check_offsets(points, offsets, _precision_dtype(precision))
+    s, o, bounds = _segment_moments(p, offsets, precision)
+    return _raw_to_moments(s, o, bounds)
+
+
+def _principal_inertias(m):
+    """
+    Returns the principal moment of inertias for the input moments array.
+
+    Parameters
+    ----------
+    m : array
+        An array of moments as returned by :func:`moments`.
+    """
+    ix, iy, ixy = m[...,3], m[...,4], m[...,5]
+    avg = 0.5*(ix + iy)
+    diff = 0.5*(ix - iy)
+    diff = (diff**2 + ixy**2)**0.5
+    return avg + diff, avg - diff
+
+
+def _principal_angles(m):
+    """
+    Returns the angle from the x-axis to the major principal axis for the
+    input moments array.
+
+    Parameters
+    ----------
+    m : array
+        An array of moments as returned by :func:`moments`.
+    """
+    ix, iy, ixy = m[...,3], m[...,4], m[...,5]
+    diff = ix - iy
+    alpha = 0.5*np.arctan2(-ixy, 0.5*diff)
+    return np.where((np.abs(ixy) < TOL) & (np.abs(diff) < TOL), 0.0, alpha)
+
+
+def _rotate_inertias(ix, iy, ixy, angles):
+    """
+    Transforms the second moment tensor to the (u, v) axes located at the
+    input angles from the x-axis. Returns the inertias about the u and v axes
+    and the product of inertia.
+
+    Parameters
+    ----------
+    ix, iy, ixy : float
+        The moment of inertias and product of inertia about the x and y axes.
+    angles : array
+        The counterclockwise angles from the x-axis to the u-axis in radians.
+    """
+    c, s = np.cos(2*angles), np.sin(2*angles)
+    avg = 0.5*(ix + iy)
+    diff = 0.5*(ix - iy)*c - ixy*s
+    iuv = 0.5*(ix - iy)*s + ixy*c
+    return avg + diff, avg - diff, iuv
+
+
+def _segment_principal_fibers(p, offsets, m):
+    """
+    Returns the extreme fibers from the principal axes for the boundaries
+    packed in the input vertex buffer.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2), or of shape (K, 3) if the boundaries
+        contain arc edges.
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    m : array
+        An array of moments of shape (M, 10) for the boundaries.
+    """
+    start = offsets[:-1]
+    n = np.diff(offsets)
+    alpha = _principal_angles(m)
+    kernel = _kernel('principal_fibers')
+
+    if kernel is not None and p.dtype == np.dtype('float'):
+        v, u = kernel(p, offsets, m[:,1:3], alpha)
+    else:
+        c, s = np.repeat(np.cos(alpha), n), np.repeat(np.sin(alpha), n)
+        q = p[:,:2] - np.repeat(m[:,1:3], n, axis=0)
+
+        v = np.abs(q[:,1]*c - q[:,0]*s)
+        u = np.abs(q[:,0]*c + q[:,1]*s)
+
+        v = np.maximum.reduceat(v, start)
+        u = np.maximum.reduceat(u, start)
+
+    arcs = _segment_arcs(p, offsets)
+
+    if arcs is not None:
+        # Check the arcs in the positive and negative axis directions
+        center, radius, ang, sweep, seg = arcs
+        center = (center - m[seg,1:3])[:,np.newaxis]
+        g = (center, radius[:,np.newaxis], ang[:,np.newaxis], sweep[:,np.newaxis])
+        a = alpha[seg][:,np.newaxis] + np.array([0, 0.5, 1, 1.5]) * np.pi
+        e = _arc_extent(g[0], g[1], g[2], g[3], a)
+        np.maximum.at(u, seg, np.max(e[:,0::2], axis=1))
+        np.maximum.at(v, seg, np.max(e[:,1::2], axis=1))
+
+    return v, u
+
+
+def _extreme_fibers(m):
+    """
+    Returns the extreme fibers from the centroidal y and x axes for the
+    input moments array.
+
+    Parameters
+    ----------
+    m : array
+        An array of moments as returned by :func:`moments`.
+    """
+    x, y = m[...,1], m[...,2]
+    cx = np.maximum(x - m[...,6], m[...,8] - x)
+    cy = np.maximum(y - m[...,7], m[...,9] - y)
+    return cy, cx
+
+
+def _broadcast_params(*args):
+    """
+    Broadcasts the input shape parameters against one another. Returns the
+    broadcast shape and a list of the flattened parameter arrays.
+
+    Parameters
+    ----------
+    args : float or array
+        The shape parameters.
+    """
+    args = np.broadcast_arrays(*[np.asarray(x, dtype='float') for x in args])
+    return args[0].shape, [x.ravel() for x in args]
+
+
+def _rectangle_sums(x0, y0, x1, y1):
+    """
+    Returns the raw moment sums about the origin for axis aligned rectangles
+    with the input corner coordinates. The results have the same scaling as
+    those returned by :func:`_segment_moments` and so may be added to obtain
+    the sums for shapes composed of non-overlapping rectangles. The result
+    is an array of shape (M, 6).
+
+    Parameters
+    ----------
+    x0, y0 : array
+        The minimum x and y coordinates of the rectangles.
+    x1, y1 : array
+        The maximum x and y coordinates of the rectangles.
+    """
+    w, h = x1 - x0, y1 - y0
+    a = w * h
+
+    return np.column_stack([
+        2*a, 3*a*(y0 + y1), 3*a*(x0 + x1),
+        4*w*(y1**3 - y0**3), 4*h*(x1**3 - x0**3),
+        6*(x1**2 - x0**2)*(y1**2 - y0**2)
+    ])
+
+
+def _stack_points(points):
+    """
+    Stacks a list of (x, y) coordinate array pairs, each of shape (M,), into
+    an array of shape (M, N, 2).
+
+    Parameters
+    ----------
+    points : list
+        A list of N (x, y) pairs of coordinate arrays.
+    """
+    return np.stack([np.column_stack([x, y]) for x, y in points], axis=1)
+
+
+def _hull_principal_fibers(hull, m):
+    """
+    Returns the extreme fibers from the principal axes for shapes with
+    the input convex hull vertices.
+
+    Parameters
+    ----------
+    hull : array
+        An array of convex hull vertices of shape (M, H, 2). Additional
+        points inside the hull may be included.
+    m : array
+        An array of moments of shape (M, 10) for the shapes.
+    """
+    alpha = _principal_angles(m)[:,np.newaxis]
+    c, s = np.cos(alpha), np.sin(alpha)
+    x = hull[...,0] - m[:,1:2]
+    y = hull[...,1] - m[:,2:3]
+
+    v = np.max(np.abs(y*c - x*s), axis=1)
+    u = np.max(np.abs(x*c + y*s), axis=1)
+
+    return v, u
+
+
+def _shape_summary(shape, sums, bounds, plastic, hull=None):
+    """
+    Returns a dictionary of summary properties, as returned by
+    :func:`section_summary`, for parametric shapes whose raw moment sums
+    are calculated in closed form. Each value is reshaped to the broadcast
+    shape of the shape parameters.
+
+    Parameters
+    ----------
+    shape : tuple
+        The broadcast shape of the shape parameters.
+    sums : array
+        An array of raw moment sums about the origin of shape (M, 6).
+    bounds : array
+        An array of (xmin, ymin, xmax, ymax) bounds of shape (M, 4).
+    plastic : array
+        An array of the plastic section modulii about the x and y axes
+        of shape (M, 2).
+    hull : array
+        An array of convex hull vertices of shape (M, H, 2). If None, the
+        principal axes are assumed to coincide with the x and y axes.
+    """
+    m = _raw_to_moments(sums, np.zeros((len(sums), 2)), bounds)
+
+    if hull is None:
+        fibers = _extreme_fibers(m)
+    else:
+        fibers = _hull_principal_fibers(hull, m)
+
+    summary = _summary(m, fibers, plastic)
+    return {k: x.reshape(shape)[()] for k, x in summary.items()}
+
+
+def _summary(m, principal_fibers, plastic=None):
+    """
+    Returns a dictionary of summary properties derived from the input
+    moments array. See :func:`section_summary` for the returned keys.
+
+    Parameters
+    ----------
+    m : array
+        An array of moments as returned by :func:`moments`.
+    principal_fibers : tuple
+        The extreme fibers from the major and minor principal axes.
+    plastic : array
+        An array of the plastic section modulii about the x and y axes
+        of shape (M, 2). If None, the plastic section modulii are not
+        included.
+    """
+    a, x, y = m[...,0], m[...,1], m[...,2]
+    ix, iy, ixy = m[...,3], m[...,4], m[...,5]
+    w, h = m[...,8] - m[...,6], m[...,9] - m[...,7]
+
+    iu, iv = _principal_inertias(m)
+    cy, cx = _extreme_fibers(m)
+    cv, cu = principal_fibers
+
+    summary = dict(
+        area=a, x=x, y=y, width=w, height=h,
+        inertia_x=ix, inertia_y=iy, inertia_j=ix+iy, inertia_xy=ixy,
+        inertia_z=np.minimum(iu, iv),
+        gyradius_x=np.sqrt(ix / a),
+        gyradius_y=np.sqrt(iy / a),
+        gyradius_z=np.sqrt(np.minimum(iu, iv) / a),
+        elast_sect_mod_x=ix / cy,
+        elast_sect_mod_y=iy / cx,
+        elast_sect_mod_z=np.minimum(iu / cv, iv / cu)
+    )
+
+    if plastic is not None:
+        summary['plast_sect_mod_x'] = plastic[...,0]
+        summary['plast_sect_mod_y'] = plastic[...,1]
+
+    return summary
 
 
 def area(points):
@@ -90,10 +898,13 @@ def area(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    p = close_points(points)
-    x, y = p[:,0], p[:,1]
-    a = 0.5 * np.sum(x[:-1]*y[1:] - x[1:]*y[:-1])
-    return abs(a)
+    # Only the area sum is required for straight edges
+    r = _boundary_sums(points, 1)
+
+    if r is None:
+        return moments(points)[0]
+
+    return 0.5 * abs(r[0][0])
 
 
 def centroid(points):
@@ -106,19 +917,14 @@ def centroid(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    p = close_points(points)
+    # Only the area and first moment sums are required for straight edges
+    r = _boundary_sums(points, 3)
 
-    x, y = p[:,0], p[:,1]
-    a = 3 * np.sum(x[:-1]*y[1:] - x[1:]*y[:-1])
+    if r is None:
+        return moments(points)[1:3]
 
-    c = x[:-1] * y[1:] - x[1:] * y[:-1]
-    cx = (x[:-1] + x[1:]) * c
-    cx = np.sum(cx) / a
-
-    cy = (y[:-1] + y[1:]) * c
-    cy = np.sum(cy) / a
-
-    return np.array([cx, cy])
+    (a2, qx, qy), o = r
+    return np.array([qy / (3 * a2) + o[0], qx / (3 * a2) + o[1]])
 
 
 def inertias(points, origin=None):
@@ -146,27 +952,16 @@ def inertias(points, origin=None):
     inertia_xy : float
         The product of inertia.
     """
-    if origin is None:
-        origin = centroid(points)
-
-    p = close_points(points) - origin
-    x, y = p[:,0], p[:,1]
-
-    c = x[:-1] * y[1:] - x[1:] * y[:-1]
-    ix = c * (y[:-1]**2 + y[:-1]*y[1:] + y[1:]**2)
-    ix = np.sum(ix) / 12
-
-    iy = c * (x[:-1]**2 + x[:-1]*x[1:] + x[1:]**2)
-    iy = np.sum(iy) / 12
-
-    ixy = c * (x[:-1]*y[1:] + 2*x[:-1]*y[:-1] + 2*x[1:]*y[1:] + x[1:]*y[:-1])
-    ixy = np.sum(ixy) / 24
+    a, x, y, ix, iy, ixy = moments(points)[:6]
 
-    if ix < 0: ixy = -ixy
-    ix, iy = abs(ix), abs(iy)
-    ij = ix + iy
+    if origin is not None:
+        # Transfer to the origin using the parallel axis theorem
+        dx, dy = x - origin[0], y - origin[1]
+        ix += a * dy**2
+        iy += a * dx**2
+        ixy += a * dx * dy
 
-    return np.array([ix, iy, ij, ixy])
+    return np.array([ix, iy, ix + iy, ixy])
 
 
 def principal_inertias(points):
@@ -179,12 +974,7 @@ def principal_inertias(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    ix, iy, ij, ixy = inertias(points)
-    avg = 0.5*ij
-    diff = 0.5*(ix - iy)
-    diff = (diff**2 + ixy**2)**0.5
-    iu, iv = avg + diff, avg - diff
-    return np.array([iu, iv])
+    return np.array(_principal_inertias(moments(points)))
 
 
 def principal_angles(points):
@@ -196,14 +986,7 @@ def principal_angles(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    ix, iy, _, ixy = inertias(points)
-    diff = ix - iy
-
-    if abs(ixy) < TOL and abs(diff) < TOL:
-        alpha = 0
-    else:
-        alpha = 0.5*np.arctan2(-ixy, 0.5*diff)
-
+    alpha = _principal_angles(moments(points))
     beta = alpha + np.pi/2
     return np.array([alpha, beta])
 
@@ -218,9 +1001,8 @@ def gyradii(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    i = inertias(points)[:2]
-    a = area(points)
-    return np.sqrt(i / a)
+    m = moments(points)
+    return np.sqrt(m[3:5] / m[0])
 
 
 def principal_gyradii(points):
@@ -233,10 +1015,8 @@ def principal_gyradii(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    points = close_points(points)
-    i = principal_inertias(points)
-    a = area(points)
-    return np.sqrt(i / a)
+    m = moments(points)
+    return np.sqrt(np.array(_principal_inertias(m)) / m[0])
 
 
 def extreme_fibers(points):
@@ -249,12 +1029,10 @@ def extreme_fibers(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    points = np.asarray(points) - centroid(points)
-    c = np.max(np.abs(points), axis=0)
-    return np.flip(c, axis=0)
+    return np.array(_extreme_fibers(moments(points)))
 
 
-def principal_extreme_fibers(points):
+def principal_extreme_fibers(points, index=None):
     """
     The returns the extreme fibers from the principal axes. The result is
     an array of shape (2,).
@@ -263,12 +1041,20 @@ def principal_extreme_fibers(points):
     ----------
     points : array
         An array of (x, y) coordinates of shape (N, 2).
+    index : :class:`.HullIndex`
+        A prebuilt index of the boundary points, such that its convex hull
+        may be reused across calls. If None, the points are scanned directly.
     """
-    points = np.asarray(points) - centroid(points)
-    alpha, _ = principal_angles(points)
-    c = rotate2(points, alpha)
-    c = np.max(np.abs(points), axis=0)
-    return np.flip(c, axis=0)
+    m = moments(points)
+
+    if index is None:
+        p = np.asarray(points, dtype='float')
+        offsets = np.array([0, p.shape[0]])
+        v, u = _segment_principal_fibers(p, offsets, m[np.newaxis])
+        return np.array([v[0], u[0]])
+
+    alpha = _principal_angles(m)
+    return index.extreme_fibers(alpha, m[1:3])[0]
 
 
 def elast_sect_mod(points):
@@ -281,12 +1067,11 @@ def elast_sect_mod(points):
     points : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    i = inertias(points)[:2]
-    c = extreme_fibers(points)
-    return i / c
+    m = moments(points)
+    return m[3:5] / np.array(_extreme_fibers(m))
 
 
-def principal_elast_sect_mod(points):
+def principal_elast_sect_mod(points, index=None):
     """
     Returns the section modulii about the principal axes. The result is an
     array of shape (2,).
@@ -295,12 +1080,285 @@ def principal_elast_sect_mod(points):
     ----------
     points : array
         An array of (x, y) coordinates of shape (N, 2).
+    index : :class:`.HullIndex`
+        A prebuilt index of the boundary points, such that its convex hull
+        may be reused across calls. If None, the points are scanned directly.
     """
     i = principal_inertias(points)[:2]
-    c = principal_extreme_fibers(points)
+    c = principal_extreme_fibers(points, index)
     return i / c
 
 
+def plast_sect_mod(points):
+    """
+    Returns the plastic section modulii about the x and y axes. The result
+    is an array of shape (2,).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    """
+    return axis_plast_sect_mod(points, 0)[0]
+
+
+def batch_plast_sect_mod(points, offsets=None):
+    """
+    Returns the plastic section modulii about the x and y axes for many
+    independent boundaries at once. The result is an array of shape (M, 2).
+
+    Parameters
+    ----------
+    points : array
+        Either a stack of boundaries of shape (M, N, 2) or a vertex buffer
+        of shape (K, 2) containing the concatenated points of all boundaries,
+        such as returned by :func:`pack_points`.
+    offsets : array
+        An array of shape (M + 1,) of boundary offsets into the vertex buffer.
+        If None, the points are assumed to be a stack of boundaries.
+    """
+    p, offsets = _check_offsets(points, offsets)
+    o = np.zeros((len(offsets) - 1, 2))
+    return _segment_plastic(p, offsets, o, [0, 0.5*np.pi])[1]
+
+
+def plastic_neutral_axes(points, angles=0):
+    """
+    Returns the offsets of the plastic neutral axes from centroidal (u, v)
+    axes rotated counterclockwise from the x and y axes by the input angles.
+    The first column is the offset of the neutral axis parallel to the u-axis,
+    measured in the v direction, and the second is the offset of the neutral
+    axis parallel to the v-axis, measured in the u direction. The result is
+    an array of shape (K, 2).
+
+    The neutral axes divide the section into equal areas. They are located
+    by a sweep over the sorted vertex heights, during which the section width
+    is accumulated as a piecewise linear function, at a cost of O(N log N).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+
+    Examples
+    --------
+    >>> plastic_neutral_axes(angle_points(8, 8, 1))
+    array([[-1.429..., -1.429...]])
+    """
+    angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+    p = np.asarray(points, dtype='float')
+    return _axis_plastic(p, [0, p.shape[0]], centroid(p), angles)[0]
+
+
+def axis_inertias(points, angles):
+    """
+    Returns the area moment of inertias about centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. The result
+    is an array of shape (K, 4).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+
+    Returns
+    -------
+    inertia_u : array
+        The moment of inertias about the u-axis.
+    inertia_v : array
+        The moment of inertias about the v-axis.
+    inertia_j : array
+        The polar moment of inertias.
+    inertia_uv : array
+        The products of inertia.
+    """
+    angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+    m = moments(points)
+    iu, iv, iuv = _rotate_inertias(m[3], m[4], m[5], angles)
+    return np.column_stack([iu, iv, iu + iv, iuv])
+
+
+def axis_gyradii(points, angles):
+    """
+    Returns the radii of gyration about centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. The result
+    is an array of shape (K, 2).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    """
+    a = moments(points)[0]
+    i = axis_inertias(points, angles)[:,:2]
+    return np.sqrt(i / a)
+
+
+def axis_extreme_fibers(points, angles, index=None):
+    """
+    Returns the extreme fibers from centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. The first
+    column is the distance from the u-axis and the second is the distance
+    from the v-axis. The result is an array of shape (K, 2).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    index : :class:`.HullIndex`
+        A prebuilt index of the boundary points, such that its convex hull
+        may be reused across calls. If None, an index is created.
+    """
+    if index is None:
+        index = HullIndex(points)
+
+    return index.extreme_fibers(angles, centroid(points))
+
+
+def axis_elast_sect_mod(points, angles, index=None):
+    """
+    Returns the section modulii about centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. The result
+    is an array of shape (K, 2).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    index : :class:`.HullIndex`
+        A prebuilt index of the boundary points, such that its convex hull
+        may be reused across calls. If None, an index is created.
+    """
+    i = axis_inertias(points, angles)[:,:2]
+    c = axis_extreme_fibers(points, angles, index)
+    return i / c
+
+
+def axis_plast_sect_mod(points, angles):
+    """
+    Returns the plastic section modulii about (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. The result
+    is an array of shape (K, 2).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    """
+    angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+    p = np.asarray(points, dtype='float')
+    return _axis_plastic(p, [0, p.shape[0]], centroid(p), angles)[1]
+
+
+def _axis_summary(a, i, angles, fibers, plastic):
+    """
+    Returns a dictionary of axis sweep properties.
+
+    Parameters
+    ----------
+    a : float
+        The cross sectional area.
+    i : tuple
+        The (inertia_x, inertia_y, inertia_xy) about the centroidal axes.
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,).
+    fibers : array
+        An array of extreme fibers from the u and v axes of shape (K, 2).
+    plastic : tuple
+        The plastic neutral axis offsets and plastic section modulii about
+        the u and v axes, each an array of shape (K, 2).
+    """
+    iu, iv, iuv = _rotate_inertias(i[0], i[1], i[2], angles)
+    fu, fv = fibers[:,0], fibers[:,1]
+
+    summary = dict(
+        angle=angles,
+        inertia_u=iu, inertia_v=iv, inertia_uv=iuv,
+        gyradius_u=np.sqrt(iu / a), gyradius_v=np.sqrt(iv / a),
+        extreme_fiber_u=fu, extreme_fiber_v=fv,
+        elast_sect_mod_u=iu / fu, elast_sect_mod_v=iv / fv,
+        plastic_axis_u=plastic[0][:,0], plastic_axis_v=plastic[0][:,1],
+        plast_sect_mod_u=plastic[1][:,0], plast_sect_mod_v=plastic[1][:,1]
+    )
+
+    return summary
+
+
+def axis_summary(points, angles, index=None):
+    """
+    Returns a dictionary of cross sectional property arrays about centroidal
+    (u, v) axes rotated counterclockwise from the x and y axes by each of
+    the input angles. The moments are calculated once, after which the
+    second moment tensor is transformed in closed form for all angles.
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    index : :class:`.HullIndex`
+        A prebuilt index of the boundary points, such that its convex hull
+        may be reused across calls. If None, an index is created.
+
+    Returns
+    -------
+    angle : array
+        The input angles.
+    inertia_u, inertia_v : array
+        The moment of inertias about the u and v axes.
+    inertia_uv : array
+        The products of inertia.
+    gyradius_u, gyradius_v : array
+        The radii of gyration about the u and v axes.
+    extreme_fiber_u, extreme_fiber_v : array
+        The extreme fibers from the u and v axes.
+    elast_sect_mod_u, elast_sect_mod_v : array
+        The elastic section modulii about the u and v axes.
+    plastic_axis_u, plastic_axis_v : array
+        The offsets of the plastic neutral axes parallel to the u and v axes,
+        as returned by :func:`plastic_neutral_axes`.
+    plast_sect_mod_u, plast_sect_mod_v : array
+        The plastic section modulii about the u and v axes.
+
+    Examples
+    --------
+    >>> angles = np.linspace(0, np.pi, 181)
+    >>> odict = axis_summary(angle_points(8, 6, 1), angles)
+    >>> np.degrees(angles[np.argmin(odict['elast_sect_mod_u'])])
+    111.0
+    """
+    angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+    p = np.asarray(points, dtype='float')
+    m = moments(p)
+
+    if index is None:
+        index = HullIndex(p)
+
+    fibers = index.extreme_fibers(angles, m[1:3])
+    plastic = _axis_plastic(p, [0, p.shape[0]], m[1:3], angles)
+    return _axis_summary(m[0], m[3:6], angles, fibers, plastic)
+
+
 def plot_section(points, ax=None, title='', symbols={}):
     """
     Plots the cross section defined by the input boundary points.
@@ -323,6 +1381,7 @@ def plot_section(points, ax=None, title='', symbols={}):
         * `principal_axes`: The pricipal axes lines, default is 'm-.'
     """
     if ax is None:
+        import matplotlib.pyplot as plt
         fig = plt.figure()
         ax = fig.add_subplot(111,
             title=title,
@@ -340,17 +1399,17 @@ def plot_section(points, ax=None, title='', symbols={}):
     sym.update(symbols)
 
     # Plot boundary
-    p = close_points(points)
+    p = close_points(tessellate(points))
     ax.plot(p[:,0], p[:,1], sym['boundary'])
 
     # Plot centroid
-    o = centroid(p)
+    o = centroid(points)
     if sym['centroid'] not in {'', None}:
         ax.plot(o[0], o[1], sym['centroid'])
 
     # Plot axes
-    ang = principal_angles(p)
-    c = [extreme_fibers(p), principal_extreme_fibers(p)]
+    ang = principal_angles(points)
+    c = [extreme_fibers(points), principal_extreme_fibers(points)]
     c = 1.25 * max(map(np.max, c))
 
     if sym['primary_axes'] not in {'', None}:
@@ -372,7 +1431,7 @@ def plot_section(points, ax=None, title='', symbols={}):
     return ax
 
 
-def section_summary(points):
+def section_summary(points, precision=None, plastic=False):
     """
     Returns a dictionary with a summary of cross sectional properties
     for the shape defined by the input boundary points.
@@ -381,6 +1440,13 @@ def section_summary(points):
     ----------
     points : array
         An array of (x, y) coordinates of shape (N, 2).
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. If None, the default mode is used. See
+        :func:`set_precision`.
+    plastic : bool
+        If True, the plastic section modulii are included. Their calculation
+        sorts the boundary edges and so costs several times the remaining
+        properties.
 
     Returns
     -------
@@ -404,27 +1470,52 @@ def section_summary(points):
         The elastic section modulii about the x and y axes.
     elast_sect_mod_z : float
         The elastic section modulus about the weak principal axis.
+    plast_sect_mod_x, plast_sect_mod_y : float
+        The plastic section modulii about the x and y axes. Only included
+        if `plastic` is True.
     """
-    p = close_points(points)
-
-    a = area(p)
-    x, y = centroid(p)
-    w, h = dimensions(p)
+    p = np.asarray(points)
+    summary = batch_section_summary(p, [0, p.shape[0]], precision, plastic)
+    return {k: x[0] for k, x in summary.items()}
 
-    ix, iy, ij, ixy = inertias(p)
-    iz = np.min(principal_inertias(p))
 
-    rx, ry = gyradii(p)
-    rz = np.min(principal_gyradii(p))
+def batch_section_summary(points, offsets=None, precision=None,
+                          plastic=False):
+    """
+    Returns a dictionary of cross sectional property arrays for many
+    independent boundaries at once. The dictionary keys are the same as
+    those returned by :func:`section_summary`, and each value is an array
+    of shape (M,).
 
-    sx, sy = elast_sect_mod(p)
-    sz = np.min(principal_elast_sect_mod(p))
+    Parameters
+    ----------
+    points : array
+        Either a stack of boundaries of shape (M, N, 2) or a vertex buffer
+        of shape (K, 2) containing the concatenated points of all boundaries,
+        such as returned by :func:`pack_points`.
+    offsets : array
+        An array of shape (M + 1,) of boundary offsets into the vertex buffer.
+        If None, the points are assumed to be a stack of boundaries.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. If None, the default mode is used. See
+        :func:`set_precision`.
+    plastic : bool
+        If True, the plastic section modulii are included.
+
+    Examples
+    --------
+    >>> buffer, offsets = pack_points([angle_points(8, 8, 1), round_points(4)])
+    >>> batch_section_summary(buffer, offsets)['area']
+    array([15.  , 12.56...])
+    """
+    precision = _get_precision(precision)
+    p, offsets = _check_offsets(points, offsets, _precision_dtype(precision))
+    s, o, bounds = _segment_moments(p, offsets, precision)
+    m = _raw_to_moments(s, o, bounds)
+    c = _segment_principal_fibers(p, offsets, m)
 
-    summary = dict(
-        area=a, x=x, y=y, width=w, height=h,
-        inertia_x=ix, inertia_y=iy, inertia_j=ij, inertia_xy=ixy, inertia_z=iz,
-        gyradius_x=rx, gyradius_y=ry, gyradius_z=rz,
-        elast_sect_mod_x=sx, elast_sect_mod_y=sy, elast_sect_mod_z=sz
-    )
+    if not plastic:
+        return _summary(m, c)
 
-    return summary
+    _, z = _segment_plastic(p, offsets, m[:,1:3], [0, 0.5*np.pi])
+    return _summary(m, c, z)
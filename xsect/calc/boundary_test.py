@@ -1,8 +1,12 @@
 from __future__ import division
 import numpy as np
+import pytest
 from pytest import approx
 from .boundary import *
 from .angle import angle_points
+from .arc import arc_bulge, tessellate
+from .hull import HullIndex
+from .round import round_points
 
 
 def sample_angles(rand):
@@ -21,6 +25,14 @@ def sample_angles(rand):
     return p1 + p2 + p3 + p4 + p5 + p6 + p7 + p8
 
 
+def test_rotate2():
+    x = np.array([(1, 0), (0, 1), (2, 1)])
+    sol = rotate2(x, np.pi/2, origin=(1, 1))
+    a = np.array([(2, 1), (1, 0), (1, 2)])
+
+    assert approx(sol.ravel()) == a.ravel()
+
+
 def test_dimensions():
     np.random.seed(3894731)
     rand = np.random.uniform(-1000, 1000, (6, 2))
@@ -44,6 +56,65 @@ def test_close_points():
     assert approx(x) == y
 
 
+def test_moments():
+    np.random.seed(4829341)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+
+    points = sample_angles(rand)
+    sol = np.array([moments(x) for x in points])
+
+    a = np.array([16.7, 13, 13, 7.11, 7.11, 0.484] * 8)
+    ix = np.array([98.1, 80.9, 38.8, 47, 8.11, 0.189] * 8)
+    iy = np.array([98.1, 38.8, 80.9, 8.11, 47, 0.189] * 8)
+    mn = np.array([np.min(x, axis=0) for x in points])
+    mx = np.array([np.max(x, axis=0) for x in points])
+
+    assert approx(sol[:,0], 0.01) == a
+    assert approx(sol[:,3], 0.01) == ix
+    assert approx(sol[:,4], 0.01) == iy
+    assert approx(sol[:,6:8].ravel()) == mn.ravel()
+    assert approx(sol[:,8:10].ravel()) == mx.ravel()
+
+    # Orientation and closure should not affect the result
+    p = close_points(points[0])
+    assert approx(moments(p[::-1])) == sol[0]
+    assert approx(moments(p[:-1])) == sol[0]
+
+
+def test_moments_arcs():
+    # Half disk of radius 2 offset from the origin
+    r = 2
+    b = arc_bulge(np.pi)
+    p = np.array([(r, 0, b), (-r, 0, 0)]) + (5, 7, 0)
+    m = moments(p)
+
+    a = 0.5*np.pi*r**2
+    y = 4*r/(3*np.pi)
+    ix = (np.pi/8 - 8/(9*np.pi)) * r**4
+    iy = np.pi/8 * r**4
+
+    assert approx(m[0]) == a
+    assert approx(m[1:3]) == (5, 7 + y)
+    assert approx(m[3:6], abs=1e-12) == (ix, iy, 0)
+    assert approx(m[6:10]) == (3, 7, 7, 9)
+
+    # Clockwise orientation should give the same result
+    q = np.array([(-r, 0, -b), (r, 0, 0)]) + (5, 7, 0)
+    assert approx(moments(q)) == m
+
+    # Compare arbitrary arcs to a fine tessellation
+    p = np.array([(0, 0, 0.3), (4, 1, -0.2), (3, 5, 0), (1, 4, 0.7)])
+    q = tessellate(p, step=1e-4)
+    assert approx(moments(p), rel=1e-6) == moments(q)
+    assert approx(principal_extreme_fibers(p), rel=1e-6) == principal_extreme_fibers(q)
+
+    a = section_summary(p)
+    b = section_summary(q)
+
+    for k, x in a.items():
+        assert approx(x, rel=1e-6) == b[k]
+
+
 def test_area():
     np.random.seed(2983432)
     rand = np.random.uniform(-1000, 1000, (6, 2))
@@ -168,6 +239,154 @@ def test_principal_elast_sect_mod():
     assert approx(a, 0.01) == b
 
 
+def test_principal_extreme_fibers():
+    p = angle_points(8, 6, 1)
+    alpha = principal_angles(p)[0]
+    c = centroid(p)
+
+    a = principal_extreme_fibers(p)
+    q = rotate2(p - c, -alpha)
+    b = np.flip(np.max(np.abs(q), axis=0), axis=0)
+
+    assert approx(a) == b
+
+
+def test_principal_extreme_fibers_rotated():
+    # The fibers are measured from the rotated points, not the centroidal ones
+    p = angle_points(8, 6, 1)
+    a = principal_extreme_fibers(p)
+    b = principal_elast_sect_mod(p)
+    s = section_summary(p)
+
+    assert approx(a, rel=1e-9) == [5.487667147167, 3.031061793436]
+    assert approx(b, rel=1e-9) == [17.914456566793, 7.008338575065]
+    assert approx(s['elast_sect_mod_z'], rel=1e-9) == 7.008338575065
+
+
+def test_plast_sect_mod():
+    np.random.seed(2837410)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+
+    # Rectangle
+    p = np.array([(0, 0), (3, 0), (3, 5), (0, 5)]) + rand[0]
+    a = plast_sect_mod(p)
+    b = np.array([3*5**2/4, 5*3**2/4])
+    assert approx(a) == b
+
+    # Clockwise boundary
+    assert approx(plast_sect_mod(p[::-1])) == b
+
+    # Angle with the neutral axes located in the legs
+    a = plast_sect_mod(angle_points(8, 8, 1))
+    y = 7.5 / 8
+    b = 8*y**2/2 + 8*(1 - y)**2/2 + 7*(7/2 + 1 - y)
+    assert approx(a) == [b, b]
+
+
+def test_plastic_neutral_axes():
+    p = angle_points(8, 6, 1)
+    angles = np.linspace(-np.pi, np.pi, 13)
+    c = centroid(p)
+
+    a = plastic_neutral_axes(p, angles)
+    b = np.array([plastic_neutral_axes(rotate2(p, -x, c), 0)[0] for x in angles])
+    assert approx(a.ravel()) == b.ravel()
+
+    # Neutral axis parallel to the x-axis located in the vertical leg
+    a = plastic_neutral_axes(p)[0,0]
+    assert approx(a) == 1.5 - c[1]
+
+
+def test_axis_plast_sect_mod():
+    p = angle_points(8, 6, 1)
+    angles = np.linspace(-np.pi, np.pi, 13)
+
+    a = axis_plast_sect_mod(p, angles)
+    b = np.array([plast_sect_mod(rotate2(p, -x)) for x in angles])
+    assert approx(a.ravel()) == b.ravel()
+
+    # Plastic modulus is at least the elastic modulus
+    assert (a >= axis_elast_sect_mod(p, angles)).all()
+
+
+def test_batch_plast_sect_mod():
+    np.random.seed(1209843)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+    points = sample_angles(rand)
+
+    buffer, offsets = pack_points(points)
+    sol = batch_plast_sect_mod(buffer, offsets)
+    a = np.array([plast_sect_mod(x) for x in points])
+    assert approx(sol.ravel()) == a.ravel()
+
+    sol = batch_plast_sect_mod(np.array(points))
+    assert approx(sol.ravel()) == a.ravel()
+
+
+def test_axis_inertias():
+    np.random.seed(28374932)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+    angles = np.linspace(-np.pi, np.pi, 25)
+
+    for p in sample_angles(rand):
+        sol = axis_inertias(p, angles)
+        a = np.array([inertias(rotate2(p, -x)) for x in angles])
+        assert approx(sol.ravel(), rel=1e-6, abs=1e-6) == a.ravel()
+
+        # Principal axes
+        alpha = principal_angles(p)[0]
+        sol = axis_inertias(p, alpha)[0]
+        assert approx(sol[:2]) == principal_inertias(p)
+        assert abs(sol[3]) < 1e-6
+
+
+def test_axis_extreme_fibers():
+    np.random.seed(10938433)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+    angles = np.linspace(-np.pi, np.pi, 25)
+
+    for p in sample_angles(rand):
+        sol = axis_extreme_fibers(p, angles)
+        a = np.array([extreme_fibers(rotate2(p, -x)) for x in angles])
+        assert approx(sol.ravel()) == a.ravel()
+
+
+def test_axis_summary():
+    p = angle_points(8, 6, 1)
+    angles = np.linspace(0, np.pi, 7)
+    odict = axis_summary(p, angles)
+
+    assert approx(odict['gyradius_u']) == axis_gyradii(p, angles)[:,0]
+    assert approx(odict['elast_sect_mod_v']) == axis_elast_sect_mod(p, angles)[:,1]
+
+    # X and Y axes
+    odict = axis_summary(p, [0, np.pi/2])
+    assert approx(odict['inertia_u'][0]) == inertias(p)[0]
+    assert approx(odict['inertia_u'][1]) == inertias(p)[1]
+    assert approx(odict['elast_sect_mod_u'][0]) == elast_sect_mod(p)[0]
+    assert approx(odict['elast_sect_mod_v'][0]) == elast_sect_mod(p)[1]
+
+
+def test_hull_index_argument():
+    p = angle_points(8, 6, 1)
+    angles = np.linspace(0, np.pi, 7)
+    index = HullIndex(p)
+
+    a = principal_extreme_fibers(p, index)
+    assert approx(a) == principal_extreme_fibers(p)
+    assert approx(principal_elast_sect_mod(p, index)) == principal_elast_sect_mod(p)
+
+    a = axis_extreme_fibers(p, angles, index)
+    assert approx(a.ravel()) == axis_extreme_fibers(p, angles).ravel()
+
+    a = axis_elast_sect_mod(p, angles, index)
+    assert approx(a.ravel()) == axis_elast_sect_mod(p, angles).ravel()
+
+    a = axis_summary(p, angles, index)
+    b = axis_summary(p, angles)
+    assert approx(a['extreme_fiber_u']) == b['extreme_fiber_u']
+
+
 def test_plot_section():
     points = angle_points(8, 6, 1)
     plot_section(points, symbols=dict(centroid='r+'))
@@ -176,3 +395,138 @@ def test_plot_section():
 def test_section_summary():
     points = angle_points(8, 6, 1)
     section_summary(points)
+
+
+def test_pack_points():
+    points = [angle_points(8, 8, 1), angle_points(4, 4, 0.5)[:-1]]
+    buffer, offsets = pack_points(points)
+
+    assert buffer.shape == (13, 2)
+    assert (offsets == [0, 7, 13]).all()
+    assert approx(buffer[7:].ravel()) == points[1].ravel()
+
+    # Boundaries without arc edges are padded with zero bulges
+    arc = np.array([(0, 0, 1), (1, 0, 1)])
+    buffer, offsets = pack_points(points + [arc])
+
+    assert buffer.shape == (15, 3)
+    assert (buffer[:13,2] == 0).all()
+    assert (buffer[13:] == arc).all()
+    assert approx(batch_moments(buffer, offsets)[:,0]) == [15, 3.75, np.pi/4]
+
+
+def test_batch_moments():
+    np.random.seed(2309482)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+    points = sample_angles(rand)
+
+    # Ragged collection
+    buffer, offsets = pack_points(points)
+    sol = batch_moments(buffer, offsets)
+    a = np.array([moments(x) for x in points])
+    assert (sol == a).all()
+
+    # Uniform stack
+    sol = batch_moments(np.array(points))
+    assert (sol == a).all()
+
+    # Bad offsets
+    with pytest.raises(ValueError):
+        batch_moments(buffer, offsets[:-1])
+
+    with pytest.raises(ValueError):
+        batch_moments(buffer)
+
+
+def test_batch_moments_blocks(monkeypatch):
+    # Boundaries longer than the block size are summed in runs, such that
+    # the moments of a boundary do not depend on its position in the buffer
+    from . import boundary
+    monkeypatch.setattr(boundary, 'EDGE_BLOCK_SIZE', 64)
+
+    points = [angle_points(8, 6, 1), round_points(10, 1, step=0.02),
+              angle_points(6, 4, 0.5), round_points(5, step=0.05)]
+    buffer, offsets = pack_points(points)
+    sol = batch_moments(buffer, offsets)
+
+    for i, x in enumerate(points):
+        m = moments(x)
+        assert (sol[i] == m).all()
+        assert area(x) == m[0]
+        assert (centroid(x) == m[1:3]).all()
+
+    m = batch_moments(buffer, offsets, 'compensated')
+    assert approx(m) == sol
+
+
+def test_batch_section_summary():
+    np.random.seed(12380943)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+    points = sample_angles(rand)
+
+    buffer, offsets = pack_points(points)
+    sol = batch_section_summary(buffer, offsets)
+
+    for i, x in enumerate(points):
+        odict = section_summary(x)
+        for k, v in odict.items():
+            assert sol[k][i] == v
+
+    # The plastic section modulii are only calculated on request
+    assert 'plast_sect_mod_x' not in sol
+    odict = batch_section_summary(buffer, offsets, plastic=True)
+    assert approx(odict['plast_sect_mod_x']) == batch_plast_sect_mod(
+        buffer, offsets)[:,0]
+
+
+def test_batch_section_summary_ragged():
+    # Small sections batched with a large section. The events of each
+    # section are sorted and summed separately, so memory does not scale
+    # with the number of sections times the largest section
+    points = [angle_points(6, 4, t) for t in np.linspace(0.25, 1, 300)]
+    points.insert(150, round_points(300))
+    points.append(round_points(20, 2))
+
+    buffer, offsets = pack_points(points)
+    sol = batch_section_summary(buffer, offsets, plastic=True)
+
+    for i in [0, 149, 150, 151, 300, 301]:
+        odict = section_summary(points[i], plastic=True)
+        for k, v in odict.items():
+            assert sol[k][i] == v
+
+    z = 300**3 / 6
+    assert approx(sol['plast_sect_mod_x'][150], rel=1e-6) == z
+    assert approx(sol['plast_sect_mod_y'][150], rel=1e-6) == z
+
+
+def test_precision():
+    p = round_points(10, step=1e-4)
+    sol = moments(p)
+    q = p + 1e6
+
+    m = moments(q, precision='compensated')
+    assert m.dtype == np.dtype('float')
+    assert approx(m[:6], rel=1e-10) == sol[:6] + [0, 1e6, 1e6, 0, 0, 0]
+
+    m = moments(p, precision='single')
+    assert m.dtype == np.dtype('float32')
+    assert approx(m[:6], rel=1e-3, abs=1e-3) == sol[:6]
+
+    buffer, offsets = pack_points([p, q, angle_points(8, 6, 1)])
+    sol = batch_moments(buffer, offsets)
+    m = batch_moments(buffer, offsets, 'compensated')
+    assert approx(m) == sol
+
+    prev = set_precision('single')
+
+    try:
+        assert get_precision() == 'single'
+        assert batch_section_summary(buffer, offsets)['area'].dtype == np.dtype('float32')
+    finally:
+        set_precision(prev)
+
+    assert get_precision() == 'double'
+
+    with pytest.raises(ValueError):
+        moments(p, precision='half')
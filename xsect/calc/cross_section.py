@@ -1,7 +1,8 @@
 from __future__ import division
 import numpy as np
 from ..data import query_aisc
-from .multi import multi_section_summary
+from .multi import CompositeSection
+from .torsion import multi_torsion_constant
 
 __all__ = ['CrossSection']
 
@@ -99,9 +100,14 @@ class CrossSection():
 
     @classmethod
     def from_points(cls, name, add, subtract=[], is_round=False,
-                    include_meta=True, **kwargs):
+                    include_meta=True, mesh_size=None, weights=None,
+                    densities=None, torsion=False, **kwargs):
         """
-        Initializes a cross section from boundary points.
+        Initializes a cross section from boundary points. If `torsion` is
+        True or a `mesh_size` is specified, the torsional moment of inertia
+        is calculated by :func:`.multi_torsion_constant` unless it is
+        specified in the keyword arguments. Since the calculation requires
+        a finite element solution, it is not performed by default.
 
         Parameters
         ----------
@@ -119,6 +125,22 @@ class CrossSection():
             dictionary. Otherwise, no values will be written to the meta
             dictionary. This saves memory if data from the meta dictionary
             is not needed.
+        mesh_size : float
+            The target edge length of the mesh used to calculate the torsional
+            moment of inertia. If specified, the torsional moment of inertia
+            is calculated. If None and `torsion` is True, a default based
+            on the mean wall thickness is used.
+        weights : array
+            An array of weight factors, such as the modular ratios of the
+            component materials, for the added shapes followed by the
+            subtracted shapes. If specified, the transformed section
+            properties, excluding the torsional moment of inertia, are
+            calculated. See :class:`.CompositeSection`.
+        densities : float or array
+            The unit weights or densities of the component materials. If
+            specified, the unit weight of the cross section is calculated.
+        torsion : bool
+            If True, the torsional moment of inertia is calculated.
 
         Examples
         --------
@@ -127,7 +149,11 @@ class CrossSection():
         >>> CrossSection.from_points('4L8x8x1.125', add)
         CrossSection(name='4L8x8x1.125', ...)
         """
-        odict = multi_section_summary(add, subtract)
+        section = CompositeSection(add, subtract, weights, densities)
+        odict = section.summary()
+
+        if (torsion or mesh_size is not None) and 'inertia_t' not in kwargs:
+            odict['inertia_t'] = multi_torsion_constant(add, subtract, mesh_size)
 
         # Set additional properties
         odict['name'] = name
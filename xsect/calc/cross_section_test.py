@@ -12,9 +12,19 @@ def test_repr():
 
 def test_from_points():
     add = cruciform_points(8, 8, 1.125)
-    CrossSection.from_points('4L8x8x1.125', add)
+    xsect = CrossSection.from_points('4L8x8x1.125', add)
     CrossSection.from_points('4L8x8x1.125', add, include_meta=False)
 
+    assert xsect.plast_sect_mod_x > xsect.elast_sect_mod_x
+    assert xsect.plast_sect_mod_y > xsect.elast_sect_mod_y
+
+    # Torsion is only solved on request
+    assert xsect.inertia_t is None
+    xsect = CrossSection.from_points('4L8x8x1.125', add, torsion=True)
+    assert 0 < xsect.inertia_t < xsect.inertia_j
+    xsect = CrossSection.from_points('4L8x8x1.125', add, mesh_size=0.5)
+    assert 0 < xsect.inertia_t < xsect.inertia_j
+
 
 def test_from_aisc_latest():
     # Latest version, Imperial
@@ -1,8 +1,11 @@
 from __future__ import division
-from .angle import angle_points
-from .multi import multi_section_summary
+import numpy as np
+from .angle import angle_points, angle_moments
+from .angle import _angle_sums, _angle_rects, _angle_hull
+from .boundary import _broadcast_params, _stack_points, _shape_summary
+from .plastic import _rectangle_plastic
 
-__all__ = ['cruciform_points', 'cruciform_summary']
+__all__ = ['cruciform_points', 'cruciform_moments', 'cruciform_summary']
 
 
 def cruciform_points(leg1, leg2, thickness1, thickness2=None, separation=0):
@@ -31,23 +34,61 @@ def cruciform_points(leg1, leg2, thickness1, thickness2=None, separation=0):
     return a, b, c, d
 
 
+def cruciform_moments(leg1, leg2, thickness1, thickness2=None, separation=0):
+    """
+    Returns the :class:`.SectionMoments` of cruciforms. The moments are
+    built from those of a single angle, which is translated and mirrored,
+    so the separation may be varied without recalculating the angle. The
+    dimensions may be arrays, in which case they are broadcast against one
+    another. See :func:`cruciform_points` for the parameters.
+    """
+    x = 0.5*np.asarray(separation)
+    a = angle_moments(leg1, leg2, thickness1, thickness2).translate(x, x)
+    a = a + a.mirror('y')
+    return a + a.mirror('x')
+
+
 def cruciform_summary(leg1, leg2, thickness1, thickness2=None, separation=0):
     """
     Returns a dictionary with a summary of cruciform properties.
 
+    The properties are calculated in closed form, and the dimensions may be
+    arrays, in which case they are broadcast against one another and each
+    property is returned as an array of the broadcast shape.
+
     Parameters
     ----------
-    leg1 : float
+    leg1 : float or array
         The length of the legs in the vertical direction.
-    leg2 : float
+    leg2 : float or array
         The length of the legs in the horizontal direction.
-    thickness1 : float
+    thickness1 : float or array
         The thickness of `leg1`.
-    thickness2 : float
+    thickness2 : float or array
         The thickness of `leg2`. If None, the thickness is assumed the same
         as `thickness1`.
-    separation : float
+    separation : float or array
         The separation distance between connected legs.
     """
-    p = cruciform_points(leg1, leg2, thickness1, thickness2, separation)
-    return multi_section_summary(p)
+    if thickness2 is None:
+        thickness2 = thickness1
+
+    shape, (l1, l2, t1, t2, d) = _broadcast_params(
+        leg1, leg2, thickness1, thickness2, separation)
+
+    x = 0.5 * d
+    g = (l1, l2, t1, t2)
+    s = 0
+    rects = []
+    hull = []
+
+    for sx, sy in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
+        s = s + _angle_sums(*g, x=sx*x, y=sy*x, sx=sx, sy=sy)
+        rects.extend(_angle_rects(*g, x=sx*x, y=sy*x, sx=sx, sy=sy))
+        hull.extend(_angle_hull(*g, x=sx*x, y=sy*x, sx=sx, sy=sy))
+
+    bounds = np.column_stack([-x - l2, -x - l1, x + l2, x + l1])
+    plastic = _rectangle_plastic(rects)
+    hull = _stack_points(hull)
+
+    return _shape_summary(shape, s, bounds, plastic, hull)
@@ -1,5 +1,7 @@
 from __future__ import division
 import pytest
+import numpy as np
+from .multi import multi_section_summary
 from ..data import query_aisc
 from .cruciform import *
 
@@ -10,3 +12,14 @@ def test_cruciform_points():
 
 def test_cruciform_summary():
     cruciform_summary(12, 12, 1+3/8, separation=3/4)
+
+
+def test_cruciform_summary_array():
+    s = np.array([0, 3/4])
+    a = cruciform_summary(12, 8, 1+3/8, 1, s)
+
+    for i, x in enumerate(s):
+        b = multi_section_summary(cruciform_points(12, 8, 1+3/8, 1, x))
+
+        for k, v in b.items():
+            assert pytest.approx(a[k][i], rel=1e-9, abs=1e-9) == v
@@ -1,8 +1,15 @@
 from __future__ import division
-from .angle import angle_points
-from .multi import multi_section_summary
+import numpy as np
+from .angle import angle_points, angle_moments
+from .angle import _angle_sums, _angle_rects, _angle_hull
+from .boundary import _broadcast_params, _stack_points, _shape_summary
+from .plastic import _rectangle_plastic
 
-__all__ = ['double_angle_points', 'double_angle_summary']
+__all__ = [
+    'double_angle_points',
+    'double_angle_moments',
+    'double_angle_summary'
+]
 
 
 def double_angle_points(leg1, leg2, thickness1, thickness2=None, separation=0):
@@ -29,23 +36,58 @@ def double_angle_points(leg1, leg2, thickness1, thickness2=None, separation=0):
     return a, b
 
 
+def double_angle_moments(leg1, leg2, thickness1, thickness2=None,
+                         separation=0):
+    """
+    Returns the :class:`.SectionMoments` of double angles. The moments are
+    built from those of a single angle, which is translated and mirrored,
+    so the separation may be varied without recalculating the angle. The
+    dimensions may be arrays, in which case they are broadcast against one
+    another. See :func:`double_angle_points` for the parameters.
+    """
+    a = angle_moments(leg1, leg2, thickness1, thickness2)
+    a = a.translate(0.5*np.asarray(separation), 0)
+    return a + a.mirror('y')
+
+
 def double_angle_summary(leg1, leg2, thickness1, thickness2=None, separation=0):
     """
     Returns a dictionary with a summary of double angle properties.
 
+    The properties are calculated in closed form, and the dimensions may be
+    arrays, in which case they are broadcast against one another and each
+    property is returned as an array of the broadcast shape.
+
     Parameters
     ----------
-    leg1 : float
+    leg1 : float or array
         The length of the connected legs in the vertical direction.
-    leg2 : float
+    leg2 : float or array
         The length of the legs in the horizontal direction.
-    thickness1 : float
+    thickness1 : float or array
         The thickness of `leg1`.
-    thickness2 : float
+    thickness2 : float or array
         The thickness of `leg2`. If None, the thickness is assumed the same
         as `thickness1`.
-    separation : float
+    separation : float or array
         The separation distance between connected legs.
     """
-    p = double_angle_points(leg1, leg2, thickness1, thickness2, separation)
-    return multi_section_summary(p)
+    if thickness2 is None:
+        thickness2 = thickness1
+
+    shape, (l1, l2, t1, t2, d) = _broadcast_params(
+        leg1, leg2, thickness1, thickness2, separation)
+
+    x = 0.5 * d
+    z = np.zeros_like(l1)
+    g = (l1, l2, t1, t2)
+
+    s = _angle_sums(*g, x=x, y=z) + _angle_sums(*g, x=-x, y=z, sx=-1)
+
+    bounds = np.column_stack([-x - l2, z, x + l2, l1])
+    plastic = _rectangle_plastic(_angle_rects(*g, x=x, y=z)
+                                 + _angle_rects(*g, x=-x, y=z, sx=-1))
+    hull = _stack_points(_angle_hull(*g, x=x, y=z)
+                         + _angle_hull(*g, x=-x, y=z, sx=-1))
+
+    return _shape_summary(shape, s, bounds, plastic, hull)
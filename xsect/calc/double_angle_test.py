@@ -1,5 +1,7 @@
 from __future__ import division
 import pytest
+import numpy as np
+from .multi import multi_section_summary
 from ..data import query_aisc
 from .double_angle import *
 
@@ -16,3 +18,14 @@ def test_double_angle_summary():
 
     for k, x in a.items():
         assert pytest.approx(x, 0.02) == b[k]
+
+
+def test_double_angle_summary_array():
+    s = np.array([0, 3/4])
+    a = double_angle_summary(12, 8, 1+3/8, 1, s)
+
+    for i, x in enumerate(s):
+        b = multi_section_summary(double_angle_points(12, 8, 1+3/8, 1, x))
+
+        for k, v in b.items():
+            assert pytest.approx(a[k][i], rel=1e-9, abs=1e-9) == v
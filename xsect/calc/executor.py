@@ -0,0 +1,463 @@
+from __future__ import division
+import threading
+import functools
+import multiprocessing
+import numpy as np
+from .arena import VertexArena, _shared_array, _attach_array
+from .boundary import pack_points, batch_moments, batch_section_summary
+from .cross_section import CrossSection
+from .multi import multi_section_summary
+
+__all__ = ['BatchExecutor']
+
+
+def _summary_chunk(points, plastic=False):
+    """
+    Returns a list of section summaries for a chunk of boundaries, which
+    are packed and calculated in a single pass by
+    :func:`.batch_section_summary`.
+
+    Parameters
+    ----------
+    points : list
+        A list of arrays of boundary points.
+    plastic : bool
+        If True, the plastic section modulii are included.
+    """
+    summary = batch_section_summary(*pack_points(points), plastic=plastic)
+    return [{k: x[i] for k, x in summary.items()} for i in range(len(points))]
+
+
+def _multi_summary_chunk(sections):
+    """
+    Returns a list of composite section summaries for a chunk of sections.
+
+    Parameters
+    ----------
+    sections : list
+        A list of dictionaries of keyword arguments to
+        :func:`.multi_section_summary`.
+    """
+    return [multi_section_summary(**x) for x in sections]
+
+
+def _cross_section_chunk(sections):
+    """
+    Returns a list of cross sections for a chunk of sections.
+
+    Parameters
+    ----------
+    sections : list
+        A list of dictionaries of keyword arguments to
+        :meth:`.CrossSection.from_points`.
+    """
+    return [CrossSection.from_points(**x) for x in sections]
+
+
+def _arena_chunk(kind, handle, out, keys, i, j):
+    """
+    Calculates the properties of a range of boundaries or sections of an
+    arena and writes them into the rows of a shared result array.
+
+    Parameters
+    ----------
+    kind : {'moments', 'summary', 'plastic', 'multi'}
+        The kind of calculation. For `moments`, the moments of the boundaries,
+        as returned by :func:`.batch_moments`, are written. For `summary`,
+        the section properties of the boundaries, as returned by
+        :func:`.batch_section_summary`, are written. For `plastic`, the
+        section properties are written including the plastic section modulii.
+        For `multi`, the section properties of the composite sections, as
+        returned by :func:`.multi_section_summary`, are written.
+    handle : tuple
+        The handle of the :class:`.VertexArena`.
+    out : tuple
+        A tuple of the name and shape of the shared result array.
+    keys : list
+        The names of the result columns.
+    i, j : int
+        The start and stop indices of the boundaries or sections.
+    """
+    arena = VertexArena.attach(handle)
+    shm, a = _attach_array(*out)
+
+    try:
+        if kind == 'multi':
+            for k in range(i, j):
+                odict = multi_section_summary(**arena.section(k))
+                a[k] = [odict[x] for x in keys]
+        else:
+            p, offsets = arena.boundaries(i, j)
+
+            if kind == 'moments':
+                a[i:j] = batch_moments(p, offsets)
+            else:
+                odict = batch_section_summary(p, offsets,
+                                              plastic=(kind == 'plastic'))
+                a[i:j] = np.column_stack([odict[x] for x in keys])
+
+            del p
+    finally:
+        del a
+        shm.close()
+        arena.close()
+
+
+def _summary_keys(kind):
+    """
+    Returns the list of names of the section properties calculated for
+    the input kind of calculation.
+
+    Parameters
+    ----------
+    kind : {'summary', 'plastic', 'multi'}
+        The kind of calculation. See :func:`_arena_chunk`.
+    """
+    p = np.array([(0, 0), (1, 0), (0, 1), (0, 0)], dtype='float')
+
+    if kind == 'multi':
+        return list(multi_section_summary(add=[p]))
+
+    plastic = kind == 'plastic'
+    return list(batch_section_summary(*pack_points([p]), plastic=plastic))
+
+
+def _section_size(section):
+    """
+    Returns the number of boundary points of a dictionary of keyword
+    arguments for a composite section.
+
+    Parameters
+    ----------
+    section : dict
+        A dictionary containing the added and optional subtracted boundaries.
+    """
+    add = section['add']
+    subtract = section.get('subtract', [])
+    return sum(len(x) for x in add) + sum(len(x) for x in subtract)
+
+
+class BatchExecutor():
+    """
+    A class for calculating the properties of many sections over a pool of
+    worker processes. The sections are split into chunks of roughly equal
+    vertex counts, such that each task carries a similar amount of work,
+    and the results are returned in the order of the input sections. The
+    pool is started on first use and kept alive between calls until
+    :meth:`close` is called, or the executor is used as a context manager.
+
+    A calculation may be cancelled from another thread, or from the progress
+    callback, by calling :meth:`cancel`, in which case pending chunks are
+    discarded and a :class:`concurrent.futures.CancelledError` is raised.
+    If no calculation is running, the next calculation is cancelled.
+
+    Parameters
+    ----------
+    processes : int
+        The number of worker processes. If None, the number of CPUs is used.
+    chunk_size : int
+        The maximum number of boundary points in each chunk. Chunks are made
+        smaller if required to provide at least four chunks per process.
+
+    Examples
+    --------
+    >>> points = [angle_points(8, 8, t) for t in np.linspace(0.5, 1, 100)]
+    >>> with BatchExecutor(2) as executor:
+    ...     summaries = executor.section_summaries(points)
+    """
+    def __init__(self, processes=None, chunk_size=100000):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._cancel = threading.Event()
+
+    def __repr__(self):
+        return '{}(processes={}, chunk_size={})'.format(type(self).__name__,
+            self.processes, self.chunk_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def pool(self):
+        """
+        Returns the process pool, starting it if it is not running.
+        """
+        # Imported on use since concurrent.futures requires Python 3.2 or
+        # later, or the futures backport on Python 2.7
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.processes)
+        return self._pool
+
+    def close(self):
+        """
+        Shuts down the process pool. The pool is restarted if the executor
+        is used again.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def cancel(self):
+        """
+        Cancels the running calculation, or the next calculation if none
+        is running.
+        """
+        self._cancel.set()
+
+    def chunks(self, sizes):
+        """
+        Returns an array of offsets of shape (C + 1,) splitting items of the
+        input sizes into chunks, where the items of chunk `i` are located at
+        `items[offsets[i]:offsets[i+1]]`.
+
+        Parameters
+        ----------
+        sizes : array
+            An array of the number of boundary points of each item.
+        """
+        sizes = np.asarray(sizes, dtype='int')
+
+        if len(sizes) == 0:
+            return np.zeros(1, dtype='int')
+
+        total = np.cumsum(sizes)
+        size = min(self.chunk_size, total[-1] / (4 * self.processes))
+        size = max(size, 1)
+
+        # Break where the cumulative size crosses a multiple of the chunk size
+        k = np.floor((total - sizes) / size).astype('int')
+        i = np.nonzero(np.diff(k))[0] + 1
+
+        return np.concatenate([[0], i, [len(sizes)]])
+
+    def map(self, func, items, sizes, progress=None):
+        """
+        Applies a chunk function to the items over the process pool and
+        returns the list of results in the order of the input items.
+
+        Parameters
+        ----------
+        func : function
+            A picklable function accepting a list of items and returning
+            a list of results of the same length.
+        items : list
+            A list of items.
+        sizes : array
+            An array of the number of boundary points of each item.
+        progress : function
+            A function called with the number of completed and total items
+            each time a chunk completes.
+        """
+        items = list(items)
+        offsets = self.chunks(sizes)
+        tasks = [(func, (items[i:j],))
+                 for i, j in zip(offsets[:-1], offsets[1:])]
+        results = self._run(tasks, offsets, progress)
+        return [x for r in results for x in r]
+
+    def _run(self, tasks, offsets, progress=None):
+        """
+        Submits tasks to the process pool and returns the list of their
+        results in the order of the tasks.
+
+        Parameters
+        ----------
+        tasks : list
+            A list of tuples of a picklable function and its arguments.
+        offsets : array
+            An array of item offsets of shape (len(tasks) + 1,), where task
+            `i` processes the items from `offsets[i]` to `offsets[i+1]`.
+        progress : function
+            A function called with the number of completed and total items
+            each time a task completes.
+        """
+        from concurrent.futures import CancelledError, FIRST_COMPLETED, wait
+
+        pool = self.pool()
+        futures = {}
+
+        try:
+            # A cancellation requested before the run applies to this run
+            if self._cancel.is_set():
+                raise CancelledError('Calculation cancelled.')
+
+            for k, (func, args) in enumerate(tasks):
+                futures[pool.submit(func, *args)] = k
+
+            results = [None] * len(tasks)
+            pending = set(futures)
+            done = 0
+
+            while pending:
+                complete, pending = wait(pending, 0.1, FIRST_COMPLETED)
+
+                for f in complete:
+                    k = futures[f]
+                    results[k] = f.result()
+                    done += offsets[k+1] - offsets[k]
+
+                    if progress is not None:
+                        progress(done, offsets[-1])
+
+                if self._cancel.is_set():
+                    raise CancelledError('Calculation cancelled.')
+
+            return results
+        finally:
+            # Discard the chunks not yet started if the run failed
+            for f in futures:
+                f.cancel()
+            self._cancel.clear()
+
+    def _run_arena(self, kind, arena, keys, sizes, progress=None):
+        """
+        Calculates the properties of the boundaries or sections of an arena
+        over the process pool. The workers attach to the arena and write
+        their results into a shared result array, which is returned.
+
+        Parameters
+        ----------
+        kind : {'moments', 'summary', 'multi'}
+            The kind of calculation. See :func:`_arena_chunk`.
+        arena : :class:`.VertexArena`
+            The arena.
+        keys : list
+            The names of the result columns.
+        sizes : array
+            An array of the number of boundary points of each item.
+        progress : function
+            A function called with the number of completed and total items
+            each time a chunk completes.
+        """
+        offsets = self.chunks(sizes)
+        shm, out = _shared_array((len(sizes), len(keys)))
+
+        try:
+            handle = (shm.name, out.shape)
+            tasks = [(_arena_chunk, (kind, arena.handle(), handle, keys, i, j))
+                     for i, j in zip(offsets[:-1], offsets[1:])]
+            self._run(tasks, offsets, progress)
+            return np.array(out)
+        finally:
+            del out
+            shm.close()
+            shm.unlink()
+
+    def arena_moments(self, arena, progress=None):
+        """
+        Returns an array of shape (M, 10) of the moments, as returned by
+        :func:`.batch_moments`, for each of the boundaries in the arena.
+
+        Parameters
+        ----------
+        arena : :class:`.VertexArena`
+            The arena containing the boundaries.
+        progress : function
+            A function called with the number of completed and total
+            boundaries each time a chunk completes.
+        """
+        sizes = np.diff(arena.offsets)
+        return self._run_arena('moments', arena, list(range(10)), sizes,
+                               progress)
+
+    def arena_summaries(self, arena, progress=None, plastic=False):
+        """
+        Returns a dictionary of arrays of section properties, as returned by
+        :func:`.batch_section_summary`, for each of the boundaries in the
+        arena.
+
+        Parameters
+        ----------
+        arena : :class:`.VertexArena`
+            The arena containing the boundaries.
+        progress : function
+            A function called with the number of completed and total
+            boundaries each time a chunk completes.
+        plastic : bool
+            If True, the plastic section modulii are included.
+        """
+        kind = 'plastic' if plastic else 'summary'
+        keys = _summary_keys(kind)
+        sizes = np.diff(arena.offsets)
+        a = self._run_arena(kind, arena, keys, sizes, progress)
+        return {k: a[:,i] for i, k in enumerate(keys)}
+
+    def arena_multi_summaries(self, arena, progress=None):
+        """
+        Returns a dictionary of arrays of section properties, as returned by
+        :func:`.multi_section_summary`, for each of the composite sections
+        in an arena created by :meth:`.VertexArena.from_sections`.
+
+        Parameters
+        ----------
+        arena : :class:`.VertexArena`
+            The arena containing the composite sections.
+        progress : function
+            A function called with the number of completed and total sections
+            each time a chunk completes.
+        """
+        keys = _summary_keys('multi')
+        sizes = arena.offsets[arena.groups]
+        sizes = np.diff(sizes)
+        a = self._run_arena('multi', arena, keys, sizes, progress)
+        return {k: a[:,i] for i, k in enumerate(keys)}
+
+    def section_summaries(self, points, progress=None, plastic=False):
+        """
+        Returns a list of dictionaries of section properties, as returned by
+        :func:`.section_summary`, for each of the input boundaries.
+
+        Parameters
+        ----------
+        points : list
+            A list of arrays of boundary points of shape (N, 2), or of shape
+            (N, 3) if the boundary contains arc edges.
+        progress : function
+            A function called with the number of completed and total sections
+            each time a chunk completes.
+        plastic : bool
+            If True, the plastic section modulii are included.
+        """
+        points = [np.asarray(x, dtype='float') for x in points]
+        sizes = [len(x) for x in points]
+        func = functools.partial(_summary_chunk, plastic=plastic)
+        return self.map(func, points, sizes, progress)
+
+    def multi_section_summaries(self, sections, progress=None):
+        """
+        Returns a list of dictionaries of section properties, as returned by
+        :func:`.multi_section_summary`, for each of the input sections.
+
+        Parameters
+        ----------
+        sections : list
+            A list of dictionaries of keyword arguments to
+            :func:`.multi_section_summary`.
+        progress : function
+            A function called with the number of completed and total sections
+            each time a chunk completes.
+        """
+        sizes = [_section_size(x) for x in sections]
+        return self.map(_multi_summary_chunk, sections, sizes, progress)
+
+    def cross_sections(self, sections, progress=None):
+        """
+        Returns a list of :class:`.CrossSection` for each of the input
+        sections.
+
+        Parameters
+        ----------
+        sections : list
+            A list of dictionaries of keyword arguments to
+            :meth:`.CrossSection.from_points`.
+        progress : function
+            A function called with the number of completed and total sections
+            each time a chunk completes.
+        """
+        sizes = [_section_size(x) for x in sections]
+        return self.map(_cross_section_chunk, sections, sizes, progress)
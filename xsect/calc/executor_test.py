@@ -0,0 +1,107 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .angle import angle_points
+from .boundary import section_summary
+from .cruciform import cruciform_points
+from .multi import multi_section_summary
+from .round import round_points
+from .executor import *
+
+futures = pytest.importorskip('concurrent.futures')
+
+
+def failing_chunk(items):
+    raise ValueError('Chunk failed.')
+
+
+def test_chunks():
+    executor = BatchExecutor(2, chunk_size=10)
+    offsets = executor.chunks([4, 4, 4, 4, 20, 1, 1])
+
+    assert offsets[0] == 0 and offsets[-1] == 7
+    assert (np.diff(offsets) > 0).all()
+    assert len(offsets) > 2
+
+    assert list(executor.chunks([])) == [0]
+
+
+def test_section_summaries():
+    points = [angle_points(8, 6, t) for t in np.linspace(0.5, 1, 20)]
+    points.append(round_points(10, 1))
+
+    with BatchExecutor(2, chunk_size=50) as executor:
+        result = executor.section_summaries(points)
+        plastic = executor.section_summaries(points, plastic=True)
+
+    for p, odict, z in zip(points, result, plastic):
+        sol = section_summary(p)
+        for k, x in sol.items():
+            assert approx(odict[k]) == x
+
+        sol = section_summary(p, plastic=True)
+        assert 'plast_sect_mod_x' not in odict
+        assert approx(z['plast_sect_mod_x']) == sol['plast_sect_mod_x']
+
+
+def test_multi_section_summaries():
+    sections = [dict(add=cruciform_points(8, 8, t)) for t in (0.5, 0.75, 1)]
+    done = []
+
+    with BatchExecutor(2) as executor:
+        result = executor.multi_section_summaries(sections,
+            progress=lambda i, n: done.append((i, n)))
+
+    assert done[-1] == (3, 3)
+
+    for s, odict in zip(sections, result):
+        assert approx(odict['area']) == multi_section_summary(**s)['area']
+
+
+def test_cross_sections():
+    sections = [dict(name=str(t), add=[angle_points(8, 6, t)])
+                for t in (0.5, 1)]
+
+    with BatchExecutor(2) as executor:
+        result = executor.cross_sections(sections)
+
+    assert [x.name for x in result] == ['0.5', '1']
+
+
+def test_cancel():
+    points = [angle_points(8, 6, t) for t in np.linspace(0.5, 1, 20)]
+    executor = BatchExecutor(2, chunk_size=10)
+
+    with pytest.raises(futures.CancelledError):
+        executor.section_summaries(points,
+            progress=lambda i, n: executor.cancel())
+
+    result = executor.section_summaries(points)
+    executor.close()
+
+    assert len(result) == 20
+
+
+def test_cancel_before_run():
+    points = [angle_points(8, 6, t) for t in np.linspace(0.5, 1, 4)]
+
+    with BatchExecutor(2) as executor:
+        executor.cancel()
+
+        with pytest.raises(futures.CancelledError):
+            executor.section_summaries(points)
+
+        result = executor.section_summaries(points)
+
+    assert len(result) == 4
+
+
+def test_failed_run():
+    with BatchExecutor(2, chunk_size=1) as executor:
+        with pytest.raises(ValueError):
+            executor.map(failing_chunk, range(20), [1] * 20)
+
+        result = executor.section_summaries([angle_points(8, 6, 1)])
+
+    assert len(result) == 1
@@ -0,0 +1,302 @@
+from __future__ import division
+import numpy as np
+from .arc import _segment_arcs, _arc_extent
+
+__all__ = ['convex_hull', 'HullIndex']
+
+FILTER_DIRECTIONS = 64 # Number of directions used to prefilter hull points
+
+
+def _prefilter(p, n=FILTER_DIRECTIONS):
+    """
+    Returns the input points excluding those strictly inside the polygon
+    formed by the extreme points in `n` evenly spaced directions. This is
+    the Akl-Toussaint heuristic and typically removes the majority of interior
+    points, such as the inner ring of a pipe, in O(N) time.
+
+    Parameters
+    ----------
+    p : array
+        An array of (x, y) coordinates of shape (N, 2).
+    n : int
+        The number of directions for which extreme points are found.
+    """
+    ang = np.linspace(0, 2*np.pi, n, endpoint=False)
+    d = np.column_stack([np.cos(ang), np.sin(ang)])
+    i = [np.argmax(np.dot(p, x)) for x in d]
+
+    # Remove consecutive duplicates, which are in counterclockwise order
+    i = np.array(i)
+    i = i[i != np.roll(i, 1)]
+
+    if len(i) < 3:
+        return p
+
+    q = p[i]
+    o = np.mean(q, axis=0)
+
+    # Locate the sector of the polygon containing each point
+    qa = np.arctan2(q[:,1] - o[1], q[:,0] - o[0])
+    qa = qa[0] + np.mod(qa - qa[0], 2*np.pi)
+    pa = np.arctan2(p[:,1] - o[1], p[:,0] - o[0])
+    pa = qa[0] + np.mod(pa - qa[0], 2*np.pi)
+    k = np.searchsorted(qa, pa, side='right') - 1
+
+    a, b = q[k], q[np.mod(k + 1, len(q))]
+    cross = ((b[:,0] - a[:,0]) * (p[:,1] - a[:,1])
+             - (b[:,1] - a[:,1]) * (p[:,0] - a[:,0]))
+
+    return p[cross <= 0]
+
+
+def _half_hull(p, sign):
+    """
+    Returns the half hull for the input points, which must be sorted by their
+    x and y coordinates. Points not making a strict turn in the direction
+    specified by the sign are removed simultaneously until none remain.
+    Hull vertices always make a strict turn with any neighbors in the sorted
+    chain, so they are never removed.
+
+    Parameters
+    ----------
+    p : array
+        An array of sorted (x, y) coordinates of shape (N, 2).
+    sign : {1, -1}
+        Use 1 for the lower hull and -1 for the upper hull.
+    """
+    while len(p) > 2:
+        a, b, c = p[:-2], p[1:-1], p[2:]
+        cross = ((b[:,0] - a[:,0]) * (c[:,1] - a[:,1])
+                 - (b[:,1] - a[:,1]) * (c[:,0] - a[:,0]))
+        keep = sign * cross > 0
+
+        if keep.all():
+            break
+
+        keep = np.concatenate([[True], keep, [True]])
+        p = p[keep]
+
+    return p
+
+
+def convex_hull(points):
+    """
+    Returns the vertices of the convex hull of the input points in
+    counterclockwise order. The result is an array of shape (H, 2).
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    """
+    p = np.asarray(points, dtype='float')
+
+    if len(p) > 2 * FILTER_DIRECTIONS:
+        p = _prefilter(p)
+
+    # Sort and remove duplicate points
+    p = p[np.lexsort((p[:,1], p[:,0]))]
+    p = p[np.concatenate([[True], np.any(p[1:] != p[:-1], axis=1)])]
+
+    if len(p) < 3:
+        return p
+
+    lower = _half_hull(p, 1)
+    upper = _half_hull(p, -1)
+
+    return np.concatenate([lower[:-1], upper[:0:-1]])
+
+
+class HullIndex():
+    """
+    An index of the convex hull of a set of boundary points, used to
+    efficiently query the extreme points of a section in any direction.
+    The hull is calculated once when the index is created, after which the
+    outward normal angles of its edges are stored in sorted order. Each
+    query then locates the supporting vertex with a binary search over those
+    angles, in the manner of a rotating caliper, at a cost of O(log H)
+    rather than O(N).
+
+    Boundaries containing circular arc edges are supported exactly. The arcs
+    are stored alongside the hull, and each query checks whether the
+    direction lies within the sweep of any arc, at a cost of O(A) for
+    A arcs.
+
+    Parameters
+    ----------
+    points : array
+        An array of boundary points of shape (N, 2), or of shape (N, 3) if
+        the boundary contains arc edges.
+    offsets : array
+        An array of offsets of shape (M + 1,) if the points are a vertex buffer
+        containing multiple boundaries. This is only required to locate arc
+        edges. If None, the points are assumed to be a single boundary.
+
+    Examples
+    --------
+    >>> index = HullIndex(round_points(1000, 20))
+    >>> index
+    HullIndex(vertices=314160)
+    >>> index.extreme_fibers(np.linspace(0, np.pi, 5))[:,0]
+    array([500., 500., 500., 500., 500.])
+    """
+    def __init__(self, points, offsets=None):
+        p = np.asarray(points, dtype='float')
+
+        if offsets is None:
+            offsets = np.array([0, len(p)])
+
+        self.hull = convex_hull(p[:,:2])
+        self.arcs = _segment_arcs(p, offsets)
+        self._normals = None
+
+    def __repr__(self):
+        return '{}(vertices={})'.format(type(self).__name__, len(self.hull))
+
+    @classmethod
+    def from_multi(cls, add):
+        """
+        Initializes an index for a composite section from the boundary points
+        of its added shapes. Subtracted shapes are assumed to lie within the
+        added shapes and so do not affect the hull.
+
+        Parameters
+        ----------
+        add : list
+            A list of (x, y) boundary coordinates for shapes included in the
+            cross section. Each set of boundary coordinates should be of the
+            shape (N, 2).
+        """
+        add = [np.asarray(x, dtype='float') for x in add]
+        n = max(x.shape[1] for x in add)
+
+        if n > 2:
+            add = [np.column_stack([x, np.zeros((len(x), n - x.shape[1]))])
+                   for x in add]
+
+        offsets = np.cumsum([0] + [len(x) for x in add])
+        return cls(np.concatenate(add), offsets)
+
+    def normals(self):
+        """
+        Returns the sorted outward normal angles of the hull edges. Edge `i`
+        spans from hull vertex `i` to vertex `i + 1`. The angles are
+        calculated on the first call and cached thereafter.
+        """
+        if self._normals is None:
+            h = self.hull
+            d = np.roll(h, -1, axis=0) - h
+            ang = np.arctan2(d[:,1], d[:,0]) - 0.5*np.pi
+
+            # Unwrap such that the angles increase from the first edge
+            ang = ang[0] + np.mod(ang - ang[0], 2*np.pi)
+            self._normals = ang
+
+        return self._normals
+
+    def support(self, angles):
+        """
+        Returns the hull vertices farthest in the directions located at the
+        input angles from the x-axis. The result is an array of shape (K, 2).
+
+        Parameters
+        ----------
+        angles : array
+            An array of counterclockwise angles from the x-axis of shape
+            (K,), in radians.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        h = self.hull
+
+        if len(h) < 3:
+            d = np.column_stack([np.cos(angles), np.sin(angles)])
+            p = h[np.argmax(np.dot(d, h.T), axis=1)]
+
+            if self.arcs is not None:
+                p = self._arc_support(p, angles)
+
+            return p
+
+        ang = self.normals()
+        x = ang[0] + np.mod(angles - ang[0], 2*np.pi)
+        i = np.searchsorted(ang, x, side='right')
+        p = h[np.mod(i, len(h))]
+
+        if self.arcs is not None:
+            p = self._arc_support(p, angles)
+
+        return p
+
+    def _arc_support(self, p, angles):
+        """
+        Replaces the input support points with points on the arcs where
+        an arc extends farther in the query direction.
+
+        Parameters
+        ----------
+        p : array
+            An array of support points of shape (K, 2).
+        angles : array
+            An array of the query angles of shape (K,).
+        """
+        center, radius, start, sweep, _ = self.arcs
+        c, s = np.cos(angles), np.sin(angles)
+
+        e = _arc_extent(center[:,np.newaxis], radius[:,np.newaxis],
+                        start[:,np.newaxis], sweep[:,np.newaxis], angles)
+        i = np.argmax(e, axis=0)
+        e = e[i, np.arange(len(angles))]
+
+        mask = e > p[:,0]*c + p[:,1]*s
+        r = radius[i][mask]
+        p = p.copy()
+        p[mask] = center[i][mask] + r[:,np.newaxis] * np.column_stack([c[mask], s[mask]])
+
+        return p
+
+    def extent(self, angles, origin=(0, 0)):
+        """
+        Returns the maximum and minimum projected distances of the hull
+        from the origin in the directions located at the input angles.
+        The result is an array of shape (K, 2).
+
+        Parameters
+        ----------
+        angles : array
+            An array of counterclockwise angles from the x-axis of shape
+            (K,), in radians.
+        origin : array
+            The (x, y) origin from which distances are measured.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        d = np.column_stack([np.cos(angles), np.sin(angles)])
+        o = np.asarray(origin, dtype='float')
+
+        pmax = self.support(angles) - o
+        pmin = self.support(angles + np.pi) - o
+
+        dmax = np.einsum('ij,ij->i', pmax, d)
+        dmin = np.einsum('ij,ij->i', pmin, d)
+
+        return np.column_stack([dmax, dmin])
+
+    def extreme_fibers(self, angles, origin=(0, 0)):
+        """
+        Returns the extreme fibers from the (u, v) axes passing through the
+        origin, where the u-axis is located at the input angles from the
+        x-axis. The first column is the distance from the u-axis and the
+        second is the distance from the v-axis. The result is an array of
+        shape (K, 2).
+
+        Parameters
+        ----------
+        angles : array
+            An array of counterclockwise angles from the x-axis to the u-axis
+            of shape (K,), in radians.
+        origin : array
+            The (x, y) origin of the axes.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        v = np.abs(self.extent(angles + 0.5*np.pi, origin))
+        u = np.abs(self.extent(angles, origin))
+        return np.column_stack([np.max(v, axis=1), np.max(u, axis=1)])
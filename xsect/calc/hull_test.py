@@ -0,0 +1,67 @@
+from __future__ import division
+import numpy as np
+from pytest import approx
+from .hull import *
+from .angle import angle_points
+from .arc import tessellate
+from .round import round_points, round_arc_points
+
+
+def test_convex_hull():
+    p = np.array([(0, 0), (2, 0), (1, 1), (2, 2), (1, 2), (0, 2), (0, 1),
+                  (2, 0), (1, 0.5)])
+    h = convex_hull(p)
+    a = np.array([(0, 0), (2, 0), (2, 2), (0, 2)])
+    assert approx(h.ravel()) == a.ravel()
+
+    # Pipe
+    p = round_points(10, 1)
+    h = convex_hull(p)
+    r = np.linalg.norm(h, axis=1)
+    assert approx(r) == 5
+    assert len(h) < len(p)
+
+
+def test_support():
+    np.random.seed(2938473)
+    ang = np.random.uniform(-10, 10, 50)
+    d = np.column_stack([np.cos(ang), np.sin(ang)])
+
+    for n in [1, 2, 3, 10, 100, 1000]:
+        p = np.random.normal(0, 10, (n, 2))
+        index = HullIndex(p)
+        s = index.support(ang)
+
+        a = np.einsum('ij,ij->i', s, d)
+        b = np.max(np.dot(d, p.T), axis=1)
+        assert approx(a) == b
+
+
+def test_support_arcs():
+    p = round_arc_points(10, 1, 0.5, 4) + (3, 2, 0)
+    q = tessellate(p, step=1e-4)
+    ang = np.linspace(-np.pi, np.pi, 37)
+
+    a = HullIndex(p).extent(ang)
+    b = HullIndex(q).extent(ang)
+    assert approx(a.ravel(), rel=1e-7) == b.ravel()
+
+    a = HullIndex.from_multi([p, np.array([(0, 0), (1, 0), (1, 1)])]).extent(ang)
+    b = HullIndex.from_multi([q, np.array([(0, 0), (1, 0), (1, 1)])]).extent(ang)
+    assert approx(a.ravel(), rel=1e-7) == b.ravel()
+
+
+def test_extreme_fibers():
+    p = angle_points(8, 6, 1)
+    o = np.array([2, 3])
+    ang = np.linspace(-np.pi, np.pi, 25)
+    index = HullIndex.from_multi([p, p + (10, 0)])
+
+    a = index.extreme_fibers(ang, o)
+
+    q = np.concatenate([p, p + (10, 0)]) - o
+    u = np.abs(np.dot(q, [np.cos(ang), np.sin(ang)]))
+    v = np.abs(np.dot(q, [-np.sin(ang), np.cos(ang)]))
+    b = np.column_stack([np.max(v, axis=0), np.max(u, axis=0)])
+
+    assert approx(a.ravel()) == b.ravel()
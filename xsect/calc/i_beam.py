@@ -1,8 +1,11 @@
 from __future__ import division
 import numpy as np
-from .boundary import section_summary
+from .boundary import _broadcast_params, _rectangle_sums, _stack_points
+from .boundary import _shape_summary
+from .plastic import _rectangle_plastic
+from .section_moments import SectionMoments
 
-__all__ = ['i_beam_points', 'i_beam_summary']
+__all__ = ['i_beam_points', 'i_beam_moments', 'i_beam_summary']
 
 
 def i_beam_points(height, width, flange_thickness, web_thickness):
@@ -32,20 +35,71 @@ def i_beam_points(height, width, flange_thickness, web_thickness):
     return np.array(p, dtype='float')
 
 
+def _i_beam_rects(h, b, tf, tw):
+    """
+    Returns a list of the (xmin, ymin, xmax, ymax) bounds of the rectangles
+    composing the flanges and web of I-beams. See :func:`i_beam_points` for the
+    parameters.
+    """
+    z = np.zeros_like(h)
+    x1 = 0.5*(b - tw)
+    x2 = x1 + tw
+    y1 = h - tf
+
+    return [(z, z, b, tf), (x1, tf, x2, y1), (z, y1, b, h)]
+
+
+def i_beam_moments(height, width, flange_thickness, web_thickness):
+    """
+    Returns the :class:`.SectionMoments` of I-beams. The moments are
+    calculated in closed form, and the dimensions may be arrays, in which
+    case they are broadcast against one another. See :func:`i_beam_points`
+    for the parameters.
+    """
+    shape, (h, b, tf, tw) = _broadcast_params(
+        height, width, flange_thickness, web_thickness)
+
+    z = np.zeros_like(h)
+    s = sum(_rectangle_sums(*x) for x in _i_beam_rects(h, b, tf, tw))
+    bounds = np.column_stack([z, z, b, h])
+
+    return SectionMoments._from_sums(shape, s, bounds)
+
+
 def i_beam_summary(height, width, flange_thickness, web_thickness):
     """
     Returns a dictionary with a summary of I-beam section properties.
 
+    The properties are calculated in closed form, and the dimensions may be
+    arrays, in which case they are broadcast against one another and each
+    property is returned as an array of the broadcast shape.
+
     Parameters
     ----------
-    height : float
+    height : float or array
         The height of the section.
-    width : float
+    width : float or array
         The width of the section and flanges.
-    flange_thickness : float
+    flange_thickness : float or array
         The flange thickness.
-    web_thickness : float
+    web_thickness : float or array
         The web thickness.
+
+    Examples
+    --------
+    >>> h = np.linspace(10, 40, 1000000)
+    >>> i_beam_summary(h, 12, 0.5, 0.3)['elast_sect_mod_x'].shape
+    (1000000,)
     """
-    p = i_beam_points(height, width, flange_thickness, web_thickness)
-    return section_summary(p)
+    shape, (h, b, tf, tw) = _broadcast_params(
+        height, width, flange_thickness, web_thickness)
+
+    r = _i_beam_rects(h, b, tf, tw)
+    z = np.zeros_like(h)
+    s = sum(_rectangle_sums(*x) for x in r)
+
+    bounds = np.column_stack([z, z, b, h])
+    plastic = _rectangle_plastic(r)
+    hull = _stack_points([(z, z), (b, z), (b, h), (z, h)])
+
+    return _shape_summary(shape, s, bounds, plastic, hull)
@@ -1,5 +1,7 @@
 from __future__ import division
 import pytest
+import numpy as np
+from .boundary import section_summary
 from ..data import query_aisc
 from .i_beam import *
 
@@ -16,3 +18,16 @@ def test_i_beam_summary():
 
     for k, x in a.items():
         assert pytest.approx(x, 0.01) == b[k]
+
+
+def test_i_beam_summary_array():
+    h = np.array([[10], [44]])
+    b = np.array([8, 15.9, 30])
+    a = i_beam_summary(h, b, 1.77, 1.03)
+    assert a['area'].shape == (2, 3)
+
+    for i, j in np.ndindex(2, 3):
+        b0 = section_summary(i_beam_points(h[i,0], b[j], 1.77, 1.03))
+
+        for k, v in b0.items():
+            assert pytest.approx(a[k][i,j], rel=1e-9, abs=1e-9) == v
@@ -1,9 +1,15 @@
 from __future__ import division
 import numpy as np
-import matplotlib.pyplot as plt
-from .boundary import TOL, area, centroid, inertias, close_points, rotate2
+from .arc import tessellate
+from .boundary import TOL, batch_moments, close_points, pack_points
+from .boundary import _principal_angles, _get_precision, _pairwise_sum
+from .boundary import _rotate_inertias, _axis_summary
+from .hull import HullIndex
+from .plastic import _axis_plastic
+from .section_moments import SectionMoments
 
 __all__ = [
+    'CompositeSection',
     'multi_dimensions',
     'multi_area',
     'multi_centroid',
@@ -16,11 +22,539 @@ __all__ = [
     'multi_principal_extreme_fibers',
     'multi_elast_sect_mod',
     'multi_principal_elast_sect_mod',
+    'multi_plast_sect_mod',
+    'multi_plastic_neutral_axes',
+    'multi_axis_inertias',
+    'multi_axis_gyradii',
+    'multi_axis_extreme_fibers',
+    'multi_axis_elast_sect_mod',
+    'multi_axis_plast_sect_mod',
+    'multi_axis_summary',
     'multi_plot_section',
+    'multi_section_moments',
     'multi_section_summary'
 ]
 
 
+def _pack_multi(add, subtract=[], weights=None):
+    """
+    Packs the added and subtracted boundaries of a composite section into
+    a single vertex buffer. Returns a tuple of the buffer, the boundary
+    offsets, and the signed boundary weights, which are positive for added
+    and negative for subtracted boundaries. If any boundary contains arc
+    edges, all boundaries are padded with a column of zero bulges.
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section.
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section.
+    weights : array
+        An array of weight factors for the added boundaries followed by the
+        subtracted boundaries. If None, all weights are taken as 1.
+    """
+    p, offsets = pack_points(list(add) + list(subtract))
+    sign = np.repeat([1.0, -1.0], [len(add), len(subtract)])
+
+    if weights is not None:
+        weights = np.asarray(weights, dtype='float')
+
+        if weights.shape != sign.shape:
+            raise ValueError('Weights must be of shape {}.'.format(sign.shape))
+
+        sign = sign * weights
+
+    return p, offsets, sign
+
+
+def _multi_moments(m, weights, origin=None, precision='double'):
+    """
+    Returns the weighted area, centroid, and moment of inertias of a
+    composite section by reducing the moments of its boundaries, calculated
+    in a single pass by :func:`.batch_moments`, with dot products against
+    the weights. Returns a tuple of the area, the centroid of shape (2,),
+    and an array of the (ix, iy, ixy) inertias.
+
+    Parameters
+    ----------
+    m : array
+        An array of boundary moments of shape (R, 10), as returned by
+        :func:`.batch_moments`.
+    weights : array
+        An array of signed boundary weights of shape (R,), as returned by
+        :func:`_pack_multi`.
+    origin : array
+        The (x, y) origin about which the moment of inertias are calculated.
+        If None, the centroid of the section is used.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. In compensated mode, the first moments are taken
+        about the center of the section bounds and the reductions use
+        compensated pairwise summation. See :func:`.set_precision`.
+    """
+    if precision == 'compensated':
+        offsets = [0, m.shape[0]]
+        o = 0.5 * (np.min(m[:,6:8], axis=0) + np.max(m[:,8:10], axis=0))
+        wa = weights * m[:,0]
+        a, = _pairwise_sum(wa, offsets)
+        c = o + _pairwise_sum(wa[:,np.newaxis] * (m[:,1:3] - o), offsets)[0] / a
+        d = m[:,1:3] - (c if origin is None else origin)
+
+        i = _pairwise_sum(np.column_stack([
+            weights * m[:,3] + wa * d[:,1]**2,
+            weights * m[:,4] + wa * d[:,0]**2,
+            weights * m[:,5] + wa * d[:,0]*d[:,1]
+        ]), offsets)[0]
+
+        return a, c, i
+
+    wa = weights * m[:,0]
+    a = np.sum(wa)
+    c = np.dot(wa, m[:,1:3]) / a
+
+    # Transfer to the origin using the parallel axis theorem
+    d = m[:,1:3] - (c if origin is None else origin)
+
+    i = np.array([
+        np.dot(weights, m[:,3]) + np.dot(wa, d[:,1]**2),
+        np.dot(weights, m[:,4]) + np.dot(wa, d[:,0]**2),
+        np.dot(weights, m[:,5]) + np.dot(wa, d[:,0]*d[:,1])
+    ])
+
+    return a, c, i
+
+
+class CompositeSection():
+    """
+    A class representing a composite section composed of multiple added and
+    subtracted shapes defined by boundary points. The properties of the
+    section are calculated on demand, with the moments of all boundaries
+    calculated in a single pass, and each property is cached after its first
+    calculation such that properties depending on one another, such as the
+    centroid, are calculated only once. If the boundary points or weights
+    are modified in place, :meth:`clear` must be called to discard the
+    cached properties.
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2), or of shape (N, 3) if the boundary contains arc edges.
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    densities : float or array
+        The unit weights or densities of the component materials, either
+        as a single value or as an array for the added shapes followed by the
+        subtracted shapes. Only required to calculate the unit weight.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode of the moment calculations. If None, the default
+        mode at the time of construction is used. See :func:`.set_precision`.
+
+    Examples
+    --------
+    >>> section = CompositeSection(cruciform_points(8, 8, 1.125))
+    >>> section
+    CompositeSection(add=4, subtract=0)
+    >>> summary = section.summary()
+    """
+    def __init__(self, add, subtract=[], weights=None, densities=None,
+                 precision=None):
+        self.add = list(add)
+        self.subtract = list(subtract)
+        self.weights = weights
+        self.densities = densities
+        self.precision = _get_precision(precision)
+        self.clear()
+
+    def __repr__(self):
+        return '{}(add={}, subtract={})'.format(type(self).__name__,
+            len(self.add), len(self.subtract))
+
+    def clear(self):
+        """
+        Discards all cached properties, such that they are recalculated from
+        the current boundary points and weights on their next access.
+        """
+        self._cache = {}
+
+    def _cached(self, key, func):
+        """
+        Returns the cached value for the input key, calling the input
+        function to calculate it on the first access.
+
+        Parameters
+        ----------
+        key : str
+            The name of the cached property.
+        func : function
+            A function with no arguments calculating the property.
+        """
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+
+    def packed(self):
+        """
+        Returns a tuple of the vertex buffer, the boundary offsets, and the
+        signed boundary weights of the section. See :func:`_pack_multi`.
+        """
+        return self._cached('packed', lambda: _pack_multi(self.add,
+            self.subtract, self.weights))
+
+    def boundary_moments(self):
+        """
+        Returns an array of shape (R, 10) of the moments, as described by
+        :func:`.moments`, for each of the added and subtracted boundaries.
+        """
+        def func():
+            p, offsets = self.packed()[:2]
+            return batch_moments(p, offsets, self.precision)
+
+        return self._cached('boundary_moments', func)
+
+    def hull(self):
+        """
+        Returns the :class:`.HullIndex` of the added shapes.
+        """
+        def func():
+            p, offsets = self.packed()[:2]
+            n = len(self.add)
+            return HullIndex(p[:offsets[n]], offsets[:n+1])
+
+        return self._cached('hull', func)
+
+    def _moments(self):
+        """
+        Returns the weighted area, centroid, and centroidal moment of inertias
+        as returned by :func:`_multi_moments`.
+        """
+        return self._cached('moments', lambda: _multi_moments(
+            self.boundary_moments(), self.packed()[2], None, self.precision))
+
+    def dimensions(self):
+        """
+        Returns the width and height of the section.
+        """
+        mn, mx = self._bounds()
+        return mx - mn
+
+    def _bounds(self):
+        """
+        Returns the minimum and maximum (x, y) coordinates of the added shapes.
+        """
+        def func():
+            m = self.boundary_moments()[:len(self.add)]
+            return np.min(m[:,6:8], axis=0), np.max(m[:,8:10], axis=0)
+
+        return self._cached('bounds', func)
+
+    def area(self):
+        """
+        Returns the total cross sectional area.
+        """
+        return self._moments()[0]
+
+    def unit_weight(self):
+        """
+        Returns the weight per unit length of the section based on the
+        densities of its components.
+        """
+        def func():
+            if self.densities is None:
+                raise ValueError('Densities must be specified to calculate '
+                    'the unit weight.')
+
+            sign = np.repeat([1.0, -1.0], [len(self.add), len(self.subtract)])
+            rho = sign * np.asarray(self.densities, dtype='float')
+            return np.sum(rho * self.boundary_moments()[:,0])
+
+        return self._cached('unit_weight', func)
+
+    def centroid(self):
+        """
+        Returns the centroid of the section. The result is an array of
+        shape (2,).
+        """
+        return self._moments()[1]
+
+    def inertias(self, origin=None):
+        """
+        Returns the moment of inertias of the section as an array of
+        (inertia_x, inertia_y, inertia_j, inertia_xy) of shape (4,).
+
+        Parameters
+        ----------
+        origin : array
+            The (x, y) origin about which the moment of inertias will be
+            calculated. If None, the centroid of the section is used.
+        """
+        if origin is None:
+            def func():
+                ix, iy, ixy = self._moments()[2]
+                return np.array([ix, iy, ix + iy, ixy])
+
+            return self._cached('inertias', func)
+
+        m, weights = self.boundary_moments(), self.packed()[2]
+        ix, iy, ixy = _multi_moments(m, weights, origin, self.precision)[2]
+        return np.array([ix, iy, ix + iy, ixy])
+
+    def principal_inertias(self):
+        """
+        Returns the principal moment of inertias. The result is an array of
+        shape (2,).
+        """
+        def func():
+            ix, iy, ij, ixy = self.inertias()
+            avg = 0.5*ij
+            diff = 0.5*(ix - iy)
+            diff = (diff**2 + ixy**2)**0.5
+            return np.array([avg + diff, avg - diff])
+
+        return self._cached('principal_inertias', func)
+
+    def principal_angles(self):
+        """
+        Returns the angles from the x-axis to the principal axes. The result
+        is an array of shape (2,).
+        """
+        def func():
+            ix, iy, _, ixy = self.inertias()
+            alpha = _principal_angles(np.array([0, 0, 0, ix, iy, ixy]))
+            return np.array([alpha, alpha + np.pi/2])
+
+        return self._cached('principal_angles', func)
+
+    def gyradii(self):
+        """
+        Returns the radii of gyration about the x and y axes. The result is
+        an array of shape (2,).
+        """
+        return np.sqrt(self.inertias()[:2] / self.area())
+
+    def principal_gyradii(self):
+        """
+        Returns the radii of gyration about the principal axes. The result
+        is an array of shape (2,).
+        """
+        return np.sqrt(self.principal_inertias() / self.area())
+
+    def extreme_fibers(self):
+        """
+        Returns the extreme fibers from the x and y axes. The result is an
+        array of shape (2,).
+        """
+        def func():
+            o = self.centroid()
+            mn, mx = self._bounds()
+            c = np.maximum(o - mn, mx - o)
+            return np.flip(c, axis=0)
+
+        return self._cached('extreme_fibers', func)
+
+    def principal_extreme_fibers(self):
+        """
+        Returns the extreme fibers from the principal axes. The result is an
+        array of shape (2,).
+        """
+        return self._cached('principal_extreme_fibers',
+            lambda: self.axis_extreme_fibers(self.principal_angles()[0])[0])
+
+    def elast_sect_mod(self):
+        """
+        Returns the elastic section modulii about the x and y axes. The
+        result is an array of shape (2,).
+        """
+        return self.inertias()[:2] / self.extreme_fibers()
+
+    def principal_elast_sect_mod(self):
+        """
+        Returns the elastic section modulii about the principal axes. The
+        result is an array of shape (2,).
+        """
+        return self.principal_inertias() / self.principal_extreme_fibers()
+
+    def plast_sect_mod(self):
+        """
+        Returns the plastic section modulii about the x and y axes. The
+        result is an array of shape (2,).
+        """
+        return self._cached('plast_sect_mod',
+            lambda: self.axis_plast_sect_mod(0)[0])
+
+    def plastic_neutral_axes(self, angles=0):
+        """
+        Returns the offsets of the plastic neutral axes from centroidal (u, v)
+        axes rotated counterclockwise from the x and y axes by the input
+        angles. See :func:`multi_plastic_neutral_axes`.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        return self._axis_plastic(angles)[0]
+
+    def _axis_plastic(self, angles):
+        """
+        Returns the plastic neutral axis offsets and plastic section modulii
+        about the input angles. See :func:`.plastic._axis_plastic`.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        p, offsets, weights = self.packed()
+        return _axis_plastic(p, offsets, self.centroid(), angles, weights)
+
+    def axis_inertias(self, angles=0):
+        """
+        Returns the moment of inertias about centroidal (u, v) axes rotated
+        counterclockwise from the x and y axes by the input angles. See
+        :func:`multi_axis_inertias`.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        ix, iy, _, ixy = self.inertias()
+        iu, iv, iuv = _rotate_inertias(ix, iy, ixy, angles)
+        return np.column_stack([iu, iv, iu + iv, iuv])
+
+    def axis_gyradii(self, angles=0):
+        """
+        Returns the radii of gyration about centroidal (u, v) axes rotated
+        counterclockwise from the x and y axes by the input angles.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        return np.sqrt(self.axis_inertias(angles)[:,:2] / self.area())
+
+    def axis_extreme_fibers(self, angles=0):
+        """
+        Returns the extreme fibers from centroidal (u, v) axes rotated
+        counterclockwise from the x and y axes by the input angles. See
+        :func:`multi_axis_extreme_fibers`.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        return self.hull().extreme_fibers(angles, self.centroid())
+
+    def axis_elast_sect_mod(self, angles=0):
+        """
+        Returns the elastic section modulii about centroidal (u, v) axes
+        rotated counterclockwise from the x and y axes by the input angles.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        i = self.axis_inertias(angles)[:,:2]
+        return i / self.axis_extreme_fibers(angles)
+
+    def axis_plast_sect_mod(self, angles=0):
+        """
+        Returns the plastic section modulii about (u, v) axes rotated
+        counterclockwise from the x and y axes by the input angles.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        return self._axis_plastic(angles)[1]
+
+    def axis_summary(self, angles=0):
+        """
+        Returns a dictionary of cross sectional property arrays about
+        centroidal (u, v) axes rotated counterclockwise from the x and y axes
+        by each of the input angles. See :func:`.axis_summary` for the
+        returned keys.
+
+        Parameters
+        ----------
+        angles : array
+            An array of angles from the x-axis to the u-axis of shape (K,),
+            in radians.
+        """
+        angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+        ix, iy, _, ixy = self.inertias()
+        c = self.axis_extreme_fibers(angles)
+        plastic = self._axis_plastic(angles)
+        return _axis_summary(self.area(), (ix, iy, ixy), angles, c, plastic)
+
+    def section_moments(self):
+        """
+        Returns the :class:`.SectionMoments` of the section, with the bounds
+        of the added shapes.
+        """
+        def func():
+            a, c, i = self._moments()
+            mn, mx = self._bounds()
+            return SectionMoments(np.concatenate([[a], c, i, mn, mx]))
+
+        return self._cached('section_moments', func)
+
+    def summary(self):
+        """
+        Returns a dictionary with a summary of cross sectional properties.
+        See :func:`multi_section_summary` for the returned keys.
+        """
+        def func():
+            a = self.area()
+            x, y = self.centroid()
+            w, h = self.dimensions()
+            ix, iy, ij, ixy = self.inertias()
+            rx, ry = self.gyradii()
+            sx, sy = self.elast_sect_mod()
+            zx, zy = self.plast_sect_mod()
+
+            summary = dict(
+                area=a, x=x, y=y, width=w, height=h,
+                inertia_x=ix, inertia_y=iy, inertia_j=ij, inertia_xy=ixy,
+                inertia_z=np.min(self.principal_inertias()),
+                gyradius_x=rx, gyradius_y=ry,
+                gyradius_z=np.min(self.principal_gyradii()),
+                elast_sect_mod_x=sx, elast_sect_mod_y=sy,
+                elast_sect_mod_z=np.min(self.principal_elast_sect_mod()),
+                plast_sect_mod_x=zx, plast_sect_mod_y=zy
+            )
+
+            if self.densities is not None:
+                summary['unit_weight'] = self.unit_weight()
+
+            return summary
+
+        return dict(self._cached('summary', func))
+
+
 def multi_dimensions(add):
     """
     Returns the width and height of the section defined by the input boundary
@@ -31,13 +565,10 @@ def multi_dimensions(add):
     add : array
         An array of (x, y) coordinates of shape (N, 2).
     """
-    mn = np.array([np.min(x, axis=0) for x in add])
-    mx = np.array([np.max(x, axis=0) for x in add])
-    mn, mx = np.min(mn, axis=0), np.max(mx, axis=0)
-    return mx - mn
+    return CompositeSection(add).dimensions()
 
 
-def multi_area(add, subtract=[]):
+def multi_area(add, subtract=[], weights=None):
     """
     Returns the total cross sectional area for multiple shapes.
 
@@ -51,13 +582,15 @@ def multi_area(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    a_add = sum(area(x) for x in add)
-    a_sub = sum(area(x) for x in subtract)
-    return a_add - a_sub
+    return CompositeSection(add, subtract, weights).area()
 
 
-def multi_centroid(add, subtract=[]):
+def multi_centroid(add, subtract=[], weights=None):
     """
     Returns the centroid for cross sections including multiple shapes.
     Returns an array of shape (2,).
@@ -72,28 +605,15 @@ def multi_centroid(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    # Added areas
-    a = np.array([area(x) for x in add])
-    a = np.expand_dims(a, 1)
-    c = np.array([centroid(x) for x in add])
-
-    cx = np.sum(a * c, axis=0)
-    cy = np.sum(a)
+    return CompositeSection(add, subtract, weights).centroid()
 
-    # Subtracted areas
-    if len(subtract) > 0:
-        a = np.array([area(x) for x in subtract])
-        a = np.expand_dims(a, 1)
-        c = np.array([centroid(x) for x in subtract])
 
-        cx -= np.sum(a * c, axis=0)
-        cy -= np.sum(a)
-
-    return cx / cy
-
-
-def multi_inertias(add, subtract=[], origin=None):
+def multi_inertias(add, subtract=[], origin=None, weights=None):
     """
     Calculates the area moment of inertias for cross sections including
     multiple shapes. Returns an array of shape (4,).
@@ -112,6 +632,10 @@ def multi_inertias(add, subtract=[], origin=None):
         The (x, y) origin about which the moment of inertias will be calculated.
         The array should be of the shape (2,). If None, the origin will be
         assumed to be located at the centroid of the section.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
 
     Returns
     -------
@@ -124,22 +648,10 @@ def multi_inertias(add, subtract=[], origin=None):
     inertia_xy : float
         The product of inertia.
     """
-    if origin is None:
-        origin = multi_centroid(add, subtract)
-
-    def inertia(points):
-        if len(points) == 0:
-            return np.zeros(4)
-        i = np.array([inertias(x, origin) for x in points])
-        return np.sum(i, axis=0)
-
-    a = inertia(add)
-    b = inertia(subtract)
-
-    return a - b
+    return CompositeSection(add, subtract, weights).inertias(origin)
 
 
-def multi_principal_inertias(add, subtract=[]):
+def multi_principal_inertias(add, subtract=[], weights=None):
     """
     Calculates the principal area moment of inertias for multiple shapes.
     Returns an array of shape (2,).
@@ -154,16 +666,15 @@ def multi_principal_inertias(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    ix, iy, ij, ixy = multi_inertias(add, subtract)
-    avg = 0.5*ij
-    diff = 0.5*(ix - iy)
-    diff = (diff**2 + ixy**2)**0.5
-    iu, iv = avg + diff, avg - diff
-    return np.array([iu, iv])
+    return CompositeSection(add, subtract, weights).principal_inertias()
 
 
-def multi_principal_angles(add, subtract=[]):
+def multi_principal_angles(add, subtract=[], weights=None):
     """
     Calculates the angles from the x-axis to the principal axes. Returns
     array of shape (2,).
@@ -178,20 +689,15 @@ def multi_principal_angles(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    ix, iy, _, ixy = multi_inertias(add, subtract)
-    diff = ix - iy
+    return CompositeSection(add, subtract, weights).principal_angles()
 
-    if abs(ixy) < TOL and abs(diff) < TOL:
-        alpha = 0
-    else:
-        alpha = 0.5*np.arctan2(-ixy, 0.5*diff)
 
-    beta = alpha + np.pi/2
-    return np.array([alpha, beta])
-
-
-def multi_gyradii(add, subtract=[]):
+def multi_gyradii(add, subtract=[], weights=None):
     """
     Calculates the radii of gyrations about the x and y axes. Returns
     an array of shape (2,).
@@ -206,13 +712,15 @@ def multi_gyradii(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    a = multi_area(add, subtract)
-    i = multi_inertias(add, subtract)[:2]
-    return np.sqrt(i / a)
+    return CompositeSection(add, subtract, weights).gyradii()
 
 
-def multi_principal_gyradii(add, subtract=[]):
+def multi_principal_gyradii(add, subtract=[], weights=None):
     """
     Calculates the radii of gyrations about the principal axes. Returns
     an array of shape (2,).
@@ -227,13 +735,15 @@ def multi_principal_gyradii(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    a = multi_area(add, subtract)
-    i = multi_principal_inertias(add, subtract)[:2]
-    return np.sqrt(i / a)
+    return CompositeSection(add, subtract, weights).principal_gyradii()
 
 
-def multi_extreme_fibers(add, subtract=[]):
+def multi_extreme_fibers(add, subtract=[], weights=None):
     """
     Calculates the extreme fibers from the x and y axes. Returns an array
     of shape (2,).
@@ -248,14 +758,15 @@ def multi_extreme_fibers(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    c = multi_centroid(add, subtract)
-    c = np.array([np.max(np.abs(x - c), axis=0) for x in add])
-    c = np.max(c, axis=0)
-    return np.flip(c, axis=0)
+    return CompositeSection(add, subtract, weights).extreme_fibers()
 
 
-def multi_principal_extreme_fibers(add, subtract=[]):
+def multi_principal_extreme_fibers(add, subtract=[], weights=None):
     """
     Calculates the extreme fibers from the principal axes. Returns an array
     of shape (2,).
@@ -270,15 +781,16 @@ def multi_principal_extreme_fibers(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    alpha, _ = multi_principal_angles(add, subtract)
-    c = multi_centroid(add, subtract)
-    c = [np.max(np.abs(rotate2(x - c, alpha)), axis=0) for x in add]
-    c = np.max(np.array(c), axis=0)
-    return np.flip(c, axis=0)
+    section = CompositeSection(add, subtract, weights)
+    return section.principal_extreme_fibers()
 
 
-def multi_elast_sect_mod(add, subtract=[]):
+def multi_elast_sect_mod(add, subtract=[], weights=None):
     """
     Calculates the section modulii about the x and y axes. Returns an array
     of shape (2,).
@@ -293,13 +805,15 @@ def multi_elast_sect_mod(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
-    i = multi_inertias(add, subtract)[:2]
-    c = multi_extreme_fibers(add, subtract=[])
-    return i / c
+    return CompositeSection(add, subtract, weights).elast_sect_mod()
 
 
-def multi_principal_elast_sect_mod(add, subtract=[]):
+def multi_principal_elast_sect_mod(add, subtract=[], weights=None):
     """
     Calculates the section modulii about the principal axes. Returns an array
     of shape (2,).
@@ -314,13 +828,248 @@ def multi_principal_elast_sect_mod(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    section = CompositeSection(add, subtract, weights)
+    return section.principal_elast_sect_mod()
+
+
+def multi_plast_sect_mod(add, subtract=[], weights=None):
+    """
+    Calculates the plastic section modulii about the x and y axes. Returns
+    an array of shape (2,).
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    return CompositeSection(add, subtract, weights).plast_sect_mod()
+
+
+def multi_plastic_neutral_axes(add, subtract=[], angles=0, weights=None):
+    """
+    Calculates the offsets of the plastic neutral axes from centroidal (u, v)
+    axes rotated counterclockwise from the x and y axes by the input angles.
+    The first column is the offset of the neutral axis parallel to the u-axis,
+    measured in the v direction, and the second is the offset of the neutral
+    axis parallel to the v-axis, measured in the u direction. Returns an
+    array of shape (K, 2).
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    section = CompositeSection(add, subtract, weights)
+    return section.plastic_neutral_axes(angles)
+
+
+def multi_axis_inertias(add, subtract=[], angles=0, weights=None):
     """
-    i = multi_principal_inertias(add, subtract)
-    c = multi_principal_extreme_fibers(add, subtract)
-    return i / c
+    Calculates the area moment of inertias about centroidal (u, v) axes
+    rotated counterclockwise from the x and y axes by the input angles.
+    Returns an array of shape (K, 4).
 
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
 
-def multi_plot_section(add, subtract=[], ax=None, title='', symbols={}):
+    Returns
+    -------
+    inertia_u : array
+        The moment of inertias about the u-axis.
+    inertia_v : array
+        The moment of inertias about the v-axis.
+    inertia_j : array
+        The polar moment of inertias.
+    inertia_uv : array
+        The products of inertia.
+    """
+    return CompositeSection(add, subtract, weights).axis_inertias(angles)
+
+
+def multi_axis_gyradii(add, subtract=[], angles=0, weights=None):
+    """
+    Calculates the radii of gyration about centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. Returns an
+    array of shape (K, 2).
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    return CompositeSection(add, subtract, weights).axis_gyradii(angles)
+
+
+def multi_axis_extreme_fibers(add, subtract=[], angles=0, weights=None):
+    """
+    Calculates the extreme fibers from centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. The first
+    column is the distance from the u-axis and the second is the distance
+    from the v-axis. Returns an array of shape (K, 2).
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    section = CompositeSection(add, subtract, weights)
+    return section.axis_extreme_fibers(angles)
+
+
+def multi_axis_elast_sect_mod(add, subtract=[], angles=0, weights=None):
+    """
+    Calculates the section modulii about centroidal (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. Returns an
+    array of shape (K, 2).
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    section = CompositeSection(add, subtract, weights)
+    return section.axis_elast_sect_mod(angles)
+
+
+def multi_axis_plast_sect_mod(add, subtract=[], angles=0, weights=None):
+    """
+    Calculates the plastic section modulii about (u, v) axes rotated
+    counterclockwise from the x and y axes by the input angles. Returns an
+    array of shape (K, 2).
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    section = CompositeSection(add, subtract, weights)
+    return section.axis_plast_sect_mod(angles)
+
+
+def multi_axis_summary(add, subtract=[], angles=0, weights=None):
+    """
+    Returns a dictionary of cross sectional property arrays about centroidal
+    (u, v) axes rotated counterclockwise from the x and y axes by each of
+    the input angles. See :func:`.axis_summary` for the returned keys.
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,),
+        in radians.
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    """
+    return CompositeSection(add, subtract, weights).axis_summary(angles)
+
+
+def multi_plot_section(add, subtract=[], ax=None, title='', symbols={},
+                       weights=None):
     """
     Plots a cross section consisting of multiple shapes.
 
@@ -347,8 +1096,13 @@ def multi_plot_section(add, subtract=[], ax=None, title='', symbols={}):
         * `centroid`: The centroid point, default is 'r+'.
         * `primary_axes`: The primary axes lines, default is 'g-.'
         * `principal_axes`: The pricipal axes lines, default is 'm-.'
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
     """
     if ax is None:
+        import matplotlib.pyplot as plt
         fig = plt.figure()
         ax = fig.add_subplot(111,
             title=title,
@@ -368,22 +1122,22 @@ def multi_plot_section(add, subtract=[], ax=None, title='', symbols={}):
 
     # Plot boundary
     for x in add:
-        x = close_points(x)
+        x = close_points(tessellate(x))
         ax.plot(x[:,0], x[:,1], sym['add'])
 
     for x in subtract:
-        x = close_points(x)
+        x = close_points(tessellate(x))
         ax.plot(x[:,0], x[:,1], sym['subtract'])
 
     # Plot centroid
-    o = multi_centroid(add, subtract)
+    section = CompositeSection(add, subtract, weights)
+    o = section.centroid()
     if sym['centroid'] not in {'', None}:
         ax.plot(o[0], o[1], sym['centroid'])
 
     # Plot axes
-    ang = multi_principal_angles(add, subtract)
-    c = [multi_extreme_fibers(add, subtract),
-         multi_principal_extreme_fibers(add, subtract)]
+    ang = section.principal_angles()
+    c = [section.extreme_fibers(), section.principal_extreme_fibers()]
     c = 1.25 * max(map(np.max, c))
 
     if sym['primary_axes'] not in {'', None}:
@@ -405,7 +1159,36 @@ def multi_plot_section(add, subtract=[], ax=None, title='', symbols={}):
     return ax
 
 
-def multi_section_summary(add, subtract=[]):
+def multi_section_moments(add, subtract=[], weights=None, precision=None):
+    """
+    Returns the :class:`.SectionMoments` for cross sections including
+    multiple shapes. The moments may be combined with those of other parts
+    and transformed without recalculation from the boundary points.
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. If None, the default mode is used. See
+        :func:`.set_precision`.
+    """
+    section = CompositeSection(add, subtract, weights, precision=precision)
+    return section.section_moments()
+
+
+def multi_section_summary(add, subtract=[], weights=None, densities=None,
+                          precision=None):
     """
     Returns a dictionary with a summary of cross sectional properties
     for the composite shape.
@@ -420,6 +1203,18 @@ def multi_section_summary(add, subtract=[]):
         A list of (x, y) boundary coordinates for cut out shapes to be
         subtracted from the cross section. Each set of boundary coordinates
         should be of the shape (N, 2).
+    weights : array
+        An array of weight factors, such as the modular ratios of the
+        component materials, for the added shapes followed by the subtracted
+        shapes. If None, all weights are taken as 1.
+    densities : float or array
+        The unit weights or densities of the component materials, either
+        as a single value or as an array for the added shapes followed by the
+        subtracted shapes. If specified, the weight per unit length of the
+        section is included in the summary.
+    precision : {'double', 'single', 'compensated'}
+        The precision mode. If None, the default mode is used. See
+        :func:`.set_precision`.
 
     Returns
     -------
@@ -443,25 +1238,11 @@ def multi_section_summary(add, subtract=[]):
         The elastic section modulii about the x and y axes.
     elast_sect_mod_z : float
         The elastic section modulus about the weak principal axis.
+    plast_sect_mod_x, plast_sect_mod_y : float
+        The plastic section modulii about the x and y axes.
+    unit_weight : float
+        The weight per unit length of the section. Only included if the
+        densities are specified.
     """
-    add = [close_points(x) for x in add]
-    subtract = [close_points(x) for x in subtract]
-
-    a = multi_area(add, subtract)
-    x, y = multi_centroid(add, subtract)
-    w, h = multi_dimensions(add)
-    ix, iy, ij, ixy = multi_inertias(add, subtract)
-    iz = np.min(multi_principal_inertias(add, subtract))
-    rx, ry = multi_gyradii(add, subtract)
-    rz = np.min(multi_principal_gyradii(add, subtract))
-    sx, sy = multi_elast_sect_mod(add, subtract)
-    sz = np.min(multi_principal_elast_sect_mod(add, subtract))
-
-    summary = dict(
-        area=a, x=x, y=y, width=w, height=h,
-        inertia_x=ix, inertia_y=iy, inertia_j=ij, inertia_xy=ixy, inertia_z=iz,
-        gyradius_x=rx, gyradius_y=ry, gyradius_z=rz,
-        elast_sect_mod_x=sx, elast_sect_mod_y=sy, elast_sect_mod_z=sz
-    )
-
-    return summary
+    section = CompositeSection(add, subtract, weights, densities, precision)
+    return section.summary()
@@ -1,7 +1,11 @@
 from __future__ import division
 import numpy as np
 from pytest import approx
+from .angle import angle_points
+from .boundary import axis_summary, plastic_neutral_axes, rotate2
+from .arc import tessellate
 from .cruciform import cruciform_points
+from .round import round_arc_points, round_points
 from .multi import *
 
 
@@ -37,8 +41,169 @@ def test_multi_centroid():
     assert approx(sol.ravel(), 0.01) == c.ravel()
 
 
+def test_multi_principal_extreme_fibers():
+    add = [angle_points(8, 6, 1), angle_points(4, 4, 0.5) + (6, 6)]
+    p = np.concatenate(add)
+    alpha = multi_principal_angles(add)[0]
+    c = multi_centroid(add)
+
+    a = multi_principal_extreme_fibers(add)
+    q = rotate2(p - c, -alpha)
+    b = np.flip(np.max(np.abs(q), axis=0), axis=0)
+
+    assert approx(a) == b
+
+
+def test_multi_elast_sect_mod_hole():
+    # The extreme fibers are measured from the centroid of the net section
+    add = [round_points(10)]
+    subtract = [round_points(4) + (2, 0)]
+    a = multi_elast_sect_mod(add, subtract)
+
+    cx = 8/21
+    ix = np.pi*(10**4 - 4**4)/64
+    iy = np.pi*(10**4/64 + 25*cx**2 - 4**4/64 - 4*(2 + cx)**2)
+    b = np.array([ix / 5, iy / (5 + cx)])
+
+    assert approx(a, rel=1e-4) == b
+
+
+def test_multi_plast_sect_mod():
+    # Pipe from an added and a subtracted round
+    add = [round_arc_points(4) + (10, -5, 0)]
+    subtract = [round_arc_points(2) + (10, -5, 0)]
+    a = multi_plast_sect_mod(add, subtract)
+    assert approx(a, rel=1e-5) == (4**3 - 2**3) / 6
+
+    # Separated shapes bend about a common neutral axis
+    add = [angle_points(8, 6, 1), angle_points(4, 4, 0.5) + (6, 6)]
+    angles = np.linspace(0, np.pi, 7)
+
+    a = multi_axis_plast_sect_mod(add, angles=angles)
+    b = multi_axis_elast_sect_mod(add, angles=angles)
+    assert (a >= b).all()
+
+    # A single shape should match the boundary functions
+    p = angle_points(8, 6, 1)
+    a = multi_plastic_neutral_axes([p], angles=angles)
+    b = plastic_neutral_axes(p, angles)
+    assert approx(a.ravel()) == b.ravel()
+
+
+def test_multi_axis_summary():
+    add = cruciform_points(8, 6, 1, 1, 0.5)
+    p = angle_points(8, 6, 1)
+    angles = np.linspace(0, np.pi, 13)
+    odict = multi_axis_summary(add, angles=angles)
+
+    # Each leg of the cruciform is symmetric about the centroid
+    a = multi_axis_inertias(add, angles=angles)
+    assert approx(odict['inertia_u']) == a[:,0]
+    assert approx(odict['inertia_uv'], abs=1e-8) == a[:,3]
+
+    a = multi_axis_gyradii(add, angles=angles)
+    assert approx(odict['gyradius_v']) == a[:,1]
+
+    a = multi_axis_elast_sect_mod(add, angles=angles)
+    assert approx(odict['elast_sect_mod_u']) == a[:,0]
+
+    # Rotating a single shape should match the boundary function
+    a = multi_axis_summary([p], angles=angles)
+    b = axis_summary(p, angles)
+
+    for k, x in a.items():
+        assert approx(x, abs=1e-8) == b[k]
+
+
+def test_multi_section_summary_arcs():
+    rect = np.array([(0, 0), (150, 0), (150, 60), (0, 60), (0, 0)])
+    circ1 = round_arc_points(60, start=-np.pi/2, stop=np.pi/2) + (150, 30, 0)
+    circ2 = round_arc_points(30) + (150, 30, 0)
+
+    a = multi_section_summary([rect, circ1], [circ2])
+    b = multi_section_summary([rect, tessellate(circ1, 1e-3)], [tessellate(circ2, 1e-3)])
+
+    for k, x in a.items():
+        assert approx(x, rel=1e-7, abs=1e-3) == b[k]
+
+    assert approx(a['width']) == 180
+    assert approx(a['height']) == 60
+
+
 def test_multi_plot_section():
     rect = np.array([(0, 0), (330, 0), (330, 280), (0, 280), (0, 0)])
     tri = np.array([(0, 0), (210, 0), (0, 210), (0, 0)]) + (50, 40)
 
     multi_plot_section(add=[rect], subtract=[tri], symbols=dict(centroid='r+'))
+
+    circ = round_arc_points(30) + (150, 30, 0)
+    multi_plot_section(add=[rect], subtract=[circ])
+
+
+def test_multi_section_summary_weights():
+    # Steel I-shape with a concrete slab transformed by a modular ratio of 1/8
+    slab = np.array([(-24, 10), (24, 10), (24, 16), (-24, 16)], dtype='float')
+    web = np.array([(-0.5, -10), (0.5, -10), (0.5, 10), (-0.5, 10)], dtype='float')
+    hole = np.array([(-2, 12), (2, 12), (2, 14), (-2, 14)], dtype='float')
+
+    odict = multi_section_summary([slab, web], [hole], weights=[1/8, 1, 1/8],
+                                  densities=[150/144**2, 490/144**2, 150/144**2])
+
+    # Equivalent section with the slab and hole widths divided by 8
+    slab_t = slab * [1/8, 1]
+    hole_t = hole * [1/8, 1]
+    sol = multi_section_summary([slab_t, web], [hole_t])
+
+    for k in ('area', 'x', 'y', 'inertia_x', 'inertia_xy',
+              'plast_sect_mod_x'):
+        assert approx(odict[k]) == sol[k]
+
+    c = max(16 - sol['y'], sol['y'] + 10)
+    assert approx(odict['elast_sect_mod_x']) == sol['inertia_x'] / c
+    assert approx(odict['unit_weight']) == (280*150 + 20*490) / 144**2
+
+
+def test_multi_weights_unit():
+    np.random.seed(193814)
+    rand = np.random.uniform(-1000, 1000, (6, 2))
+    points = sample_cruciform(rand)
+
+    for x in points:
+        w = np.ones(len(x))
+        assert approx(multi_inertias(x, weights=2*w)) == 2*multi_inertias(x)
+        assert approx(multi_centroid(x, weights=w)) == multi_centroid(x)
+
+
+def test_composite_section():
+    add = cruciform_points(8, 8, 1.125, 1.125, 0.5)
+    section = CompositeSection(add)
+
+    summary = section.summary()
+    assert summary == multi_section_summary(add)
+    assert section.summary() is not section.summary()
+    assert section.centroid() is section.centroid()
+
+    # Moving the shapes in place requires the cache to be cleared
+    for x in section.add:
+        x += (1, 2)
+
+    assert approx(section.centroid()) == (0, 0)
+    section.clear()
+    assert approx(section.centroid()) == (1, 2)
+    assert approx(section.summary()['inertia_x']) == summary['inertia_x']
+
+
+def test_multi_precision():
+    add = [np.array([(0, 0), (4, 0), (4, 1), (0, 1)]) + 1e6,
+           np.array([(1.5, 1), (2.5, 1), (2.5, 7), (1.5, 7)]) + 1e6]
+    sol = multi_section_summary([x - 1e6 for x in add])
+    odict = multi_section_summary(add, precision='compensated')
+
+    assert approx(odict['x'] - 1e6) == sol['x']
+    assert approx(odict['y'] - 1e6) == sol['y']
+
+    for k in ('area', 'inertia_x', 'inertia_y', 'inertia_xy'):
+        assert approx(odict[k], abs=1e-9) == sol[k]
+
+    odict = multi_section_summary(add, precision='single')
+    assert approx(odict['area'], rel=1e-5) == sol['area']
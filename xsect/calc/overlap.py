@@ -0,0 +1,552 @@
+from __future__ import division
+import numpy as np
+from .arc import tessellate
+from .boundary import batch_moments
+from .multi import _pack_multi
+
+__all__ = [
+    'overlap_pairs',
+    'resolve_overlaps'
+]
+
+OVERLAP_RTOL = 1e-9 # Relative area below which intersections are ignored
+TESSELLATE_RTOL = 1e-6 # Relative error of arcs tessellated for intersections
+PERTURB_RTOL = 1e-9 # Relative shift of rings which touch at intersections
+PERTURB_TRIES = 8 # Maximum number of shifts tried for touching rings
+
+
+def _sweep_pairs(boxes):
+    """
+    Returns an array of index pairs of shape (P, 2) for the input bounding
+    boxes which overlap or touch. The pairs are found by sorting the boxes
+    by their minimum x coordinate and sweeping each box over the boxes
+    starting within its x extent, so only O(N log N + P) comparisons are
+    made rather than O(N^2).
+
+    Parameters
+    ----------
+    boxes : array
+        An array of (xmin, ymin, xmax, ymax) bounds of shape (N, 4).
+    """
+    order = np.argsort(boxes[:,0], kind='mergesort')
+    b = boxes[order]
+
+    # Range of sorted boxes starting within the x extent of each box
+    hi = np.searchsorted(b[:,0], b[:,2], side='right')
+    n = np.maximum(hi - np.arange(len(b)) - 1, 0)
+
+    i = np.repeat(np.arange(len(b)), n)
+    j = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n) + i + 1
+
+    mask = (b[i,1] <= b[j,3]) & (b[j,1] <= b[i,3])
+    i, j = order[i[mask]], order[j[mask]]
+
+    pairs = np.column_stack([np.minimum(i, j), np.maximum(i, j)])
+    return pairs[np.lexsort(pairs.T[::-1])]
+
+
+def overlap_pairs(points, offsets=None):
+    """
+    Returns an array of index pairs of shape (P, 2) for the boundaries whose
+    bounding boxes overlap or touch. The pairs are found by a sort and sweep
+    over the bounding boxes and are the candidates which may intersect one
+    another. Each pair is ordered with its lowest index first.
+
+    Parameters
+    ----------
+    points : array
+        Either a stack of boundaries of shape (M, N, 2) or a vertex buffer
+        of shape (K, 2) containing the concatenated points of all boundaries,
+        such as returned by :func:`.pack_points`. Arc edges, as described by
+        :func:`.arc_bulge`, are included in the bounding boxes.
+    offsets : array
+        An array of shape (M + 1,) of boundary offsets into the vertex buffer.
+        If None, the points are assumed to be a stack of boundaries.
+    """
+    m = batch_moments(points, offsets)
+    return _sweep_pairs(m[:,6:10])
+
+
+def _signed_area(p):
+    """
+    Returns the signed area of the polygon with the input vertices.
+
+    Parameters
+    ----------
+    p : array
+        An array of (x, y) polygon vertices of shape (N, 2).
+    """
+    q = np.roll(p, -1, axis=0)
+    return 0.5 * np.sum(p[:,0]*q[:,1] - q[:,0]*p[:,1])
+
+
+def _ring(points):
+    """
+    Returns the counterclockwise vertices of the polygon for the input
+    boundary, with any arc edges tessellated and repeated vertices removed.
+
+    Parameters
+    ----------
+    points : array
+        An array of boundary points of shape (N, 2) or (N, 3).
+    """
+    p = tessellate(points, rtol=TESSELLATE_RTOL)
+    p = p[np.any(p != np.roll(p, 1, axis=0), axis=1)]
+
+    if len(p) > 2 and _signed_area(p) < 0:
+        p = p[::-1]
+
+    return p
+
+
+def _turns(p):
+    """
+    Returns the cross products of the consecutive edges at each vertex of
+    the input polygon.
+
+    Parameters
+    ----------
+    p : array
+        An array of (x, y) polygon vertices of shape (N, 2).
+    """
+    d = np.roll(p, -1, axis=0) - p
+    e = np.roll(d, 1, axis=0)
+    return e[:,0]*d[:,1] - e[:,1]*d[:,0]
+
+
+def _is_convex(p):
+    """
+    Returns True if the input counterclockwise polygon is convex.
+
+    Parameters
+    ----------
+    p : array
+        An array of counterclockwise polygon vertices of shape (N, 2).
+    """
+    span = np.max(np.ptp(p, axis=0))
+    return bool(np.all(_turns(p) >= -OVERLAP_RTOL * span**2))
+
+
+def _contains(p, x):
+    """
+    Returns True if the input point is inside of the polygon by the even-odd
+    rule.
+
+    Parameters
+    ----------
+    p : array
+        An array of polygon vertices of shape (N, 2).
+    x : array
+        The (x, y) coordinates of the point.
+    """
+    q = np.roll(p, -1, axis=0)
+    c = (p[:,1] > x[1]) != (q[:,1] > x[1])
+    p, q = p[c], q[c]
+    xi = p[:,0] + (x[1] - p[:,1]) * (q[:,0] - p[:,0]) / (q[:,1] - p[:,1])
+    return np.count_nonzero(xi > x[0]) % 2 == 1
+
+
+def _crossings(p, q, eps):
+    """
+    Returns the proper crossings of the edges of two polygons as a tuple of
+    the crossing edge indices and parameters along the edges of `p` and `q`,
+    along with a flag which is True if any edges touch at a vertex or
+    overlap along a line, in which case the crossings are not reliable.
+    Candidate edge pairs are found from the edge bounding boxes by
+    :func:`_sweep_pairs`.
+
+    Parameters
+    ----------
+    p, q : array
+        Arrays of polygon vertices of shape (N, 2) and (M, 2).
+    eps : float
+        The distance within which edges are considered to touch.
+    """
+    pn, qn = np.roll(p, -1, axis=0), np.roll(q, -1, axis=0)
+    boxes = np.concatenate([
+        np.column_stack([np.minimum(p, pn), np.maximum(p, pn)]),
+        np.column_stack([np.minimum(q, qn), np.maximum(q, qn)])
+    ])
+    boxes[:,:2] -= eps
+    boxes[:,2:] += eps
+
+    n = len(p)
+    pairs = _sweep_pairs(boxes)
+    pairs = pairs[(pairs[:,0] < n) & (pairs[:,1] >= n)]
+    i, j = pairs[:,0], pairs[:,1] - n
+
+    d, e = pn[i] - p[i], qn[j] - q[j]
+    w = q[j] - p[i]
+    den = d[:,0]*e[:,1] - d[:,1]*e[:,0]
+    ld, le = np.hypot(*d.T), np.hypot(*e.T)
+    par = np.abs(den) <= OVERLAP_RTOL * ld * le
+
+    # Parallel edges with overlapping boxes touch if they are collinear
+    dist = np.abs(w[:,0]*d[:,1] - w[:,1]*d[:,0]) / np.where(ld > 0, ld, 1)
+    degenerate = np.any(par & (dist <= eps))
+
+    den = np.where(par, 1, den)
+    t = (w[:,0]*e[:,1] - w[:,1]*e[:,0]) / den
+    u = (w[:,0]*d[:,1] - w[:,1]*d[:,0]) / den
+    et, eu = eps / np.where(ld > 0, ld, 1), eps / np.where(le > 0, le, 1)
+
+    hit = ~par & (t >= -et) & (t <= 1 + et) & (u >= -eu) & (u <= 1 + eu)
+    end = (t <= et) | (t >= 1 - et) | (u <= eu) | (u >= 1 - eu)
+    degenerate |= np.any(hit & end)
+    hit &= ~end
+
+    return i[hit], t[hit], j[hit], u[hit], degenerate
+
+
+def _between(i0, i1, wrap, n):
+    """
+    Returns the indices of the polygon vertices passed when moving forward
+    from a point on edge `i0` to the next point on edge `i1`.
+
+    Parameters
+    ----------
+    i0, i1 : int
+        The edge indices.
+    wrap : bool
+        True if the move passes the start of the polygon, in which case a
+        move along the same edge passes all vertices.
+    n : int
+        The number of polygon vertices.
+    """
+    k = (i1 - i0) % n
+
+    if k == 0 and wrap:
+        k = n
+
+    return (i0 + 1 + np.arange(k)) % n
+
+
+def _clip_rings(p, q):
+    """
+    Returns a list of the polygons forming the intersection of two simple
+    counterclockwise polygons, which need not be convex, by Greiner-Hormann
+    clipping. The boundaries are traced forward along `p` from each point
+    at which it enters `q` to the point at which it exits, and then forward
+    along `q` to the next entry, so the cost is that of finding the edge
+    crossings. Where the boundaries touch or overlap, `q` is translated by
+    a small multiple of the polygon size until the crossings are proper.
+
+    Parameters
+    ----------
+    p, q : array
+        Arrays of counterclockwise polygon vertices of shape (N, 2) and
+        (M, 2).
+    """
+    span = max(np.max(np.ptp(p, axis=0)), np.max(np.ptp(q, axis=0)))
+    eps = 1e-3 * PERTURB_RTOL * span
+    q0 = q
+
+    for k in range(PERTURB_TRIES):
+        i, t, j, u, degenerate = _crossings(p, q, eps)
+
+        if not degenerate:
+            break
+
+        a = 2.399963 * (k + 1)
+        q = q0 + PERTURB_RTOL * span * np.array([np.cos(a), np.sin(a)])
+
+    if len(i) == 0:
+        if _contains(q, p[0]):
+            return [p]
+        if _contains(p, q[0]):
+            return [q]
+        return []
+
+    d = np.roll(p, -1, axis=0)[i] - p[i]
+    e = np.roll(q, -1, axis=0)[j] - q[j]
+    x = p[i] + t[:,np.newaxis] * d
+    enter = e[:,0]*d[:,1] - e[:,1]*d[:,0] > 0
+
+    # Next crossing and rank of each crossing along each polygon. Crossings
+    # at the same point, such as those of seams, are ordered such that the
+    # entries and exits alternate
+    def walk(i, t, flag):
+        order = np.lexsort((t, i))
+
+        for k in range(1, len(order)):
+            a, b = order[k-1], order[k]
+
+            if flag[a] != flag[b]:
+                continue
+
+            for m in range(k + 1, len(order)):
+                c = order[m]
+
+                if np.hypot(*(x[c] - x[b])) > eps:
+                    break
+
+                if flag[c] != flag[a]:
+                    order[k], order[m] = c, b
+                    break
+
+        nxt, rank = np.empty_like(order), np.empty_like(order)
+        nxt[order] = np.roll(order, -1)
+        rank[order] = np.arange(len(order))
+        return nxt, rank
+
+    nxt_p, rank_p = walk(i, t, enter)
+    nxt_q, rank_q = walk(j, u, enter)
+
+    visited = np.zeros(len(i), dtype='bool')
+    result = []
+
+    for c0 in np.nonzero(enter)[0]:
+        if visited[c0]:
+            continue
+
+        ring, c = [], c0
+
+        while True:
+            # Along p from the entry into q to the exit
+            a = nxt_p[c]
+            visited[[c, a]] = True
+            ring.append(x[c:c+1])
+            ring.append(p[_between(i[c], i[a], rank_p[a] <= rank_p[c],
+                                   len(p))])
+
+            # Along q from the exit to the next entry
+            c = nxt_q[a]
+            ring.append(x[a:a+1])
+            ring.append(q[_between(j[a], j[c], rank_q[c] <= rank_q[a],
+                                   len(q))])
+
+            if c == c0 or visited[c]:
+                break
+
+        result.append(np.concatenate(ring))
+
+    return result
+
+
+def _cut_edges(q, p):
+    """
+    Returns the indices of the edges of convex polygon `q` which have any
+    vertices of polygon `p` strictly outside of them.
+
+    Parameters
+    ----------
+    q : array
+        An array of counterclockwise convex polygon vertices of shape (M, 2).
+    p : array
+        An array of polygon vertices of shape (N, 2).
+    """
+    e = np.roll(q, -1, axis=0) - q
+    n = np.column_stack([e[:,1], -e[:,0]])
+    d = np.einsum('ij,ij->i', n, q)
+
+    # Support of the vertices along the outward normals, in chunks of edges
+    s = np.concatenate([np.max(np.dot(p, x.T), axis=0)
+                        for x in np.array_split(n, len(n) // 256 + 1)])
+
+    return np.nonzero(s > d)[0]
+
+
+def _clip(p, q):
+    """
+    Returns the intersection of two convex counterclockwise polygons by
+    Sutherland-Hodgman clipping. The result may be empty or degenerate.
+
+    Parameters
+    ----------
+    p : array
+        An array of subject polygon vertices of shape (N, 2).
+    q : array
+        An array of clip polygon vertices of shape (M, 2).
+    """
+    # Only the edges with vertices of the other polygon outside of them
+    # affect the result, so clip by the polygon with the fewest such edges
+    cut_q, cut_p = _cut_edges(q, p), _cut_edges(p, q)
+
+    if len(cut_p) < len(cut_q):
+        p, q, cut_q = q, p, cut_p
+
+    for a, b in zip(q[cut_q], q[(cut_q + 1) % len(q)]):
+        if len(p) == 0:
+            break
+
+        e = b - a
+        d = e[0]*(p[:,1] - a[1]) - e[1]*(p[:,0] - a[0])
+
+        keep = d >= 0
+
+        if keep.all():
+            continue
+
+        pn, dn = np.roll(p, -1, axis=0), np.roll(d, -1)
+        cross = keep != (dn >= 0)
+        t = np.where(cross, d / np.where(cross, d - dn, 1), 0)
+
+        # Each vertex contributes itself and its edge crossing, in order
+        v = np.stack([p, p + t[:,np.newaxis] * (pn - p)], axis=1)
+        mask = np.column_stack([keep, cross])
+        p = v[mask]
+
+    return p
+
+
+def _bounds(p):
+    """
+    Returns the (xmin, ymin, xmax, ymax) bounds of the input polygon.
+
+    Parameters
+    ----------
+    p : array
+        An array of polygon vertices of shape (N, 2).
+    """
+    return np.concatenate([np.min(p, axis=0), np.max(p, axis=0)])
+
+
+def _intersect(pieces, parts, tol):
+    """
+    Returns the intersections of the input lists of polygons, each with
+    non-overlapping interiors, along with the total intersection area.
+    Intersections with areas less than the tolerance are ignored. Pairs of
+    convex polygons are intersected by :func:`_clip`, and other pairs by
+    :func:`_clip_rings`.
+
+    Parameters
+    ----------
+    pieces, parts : list
+        The lists of counterclockwise polygons to be intersected.
+    tol : float
+        The area below which intersections are ignored.
+    """
+    b = np.array([_bounds(x) for x in parts])
+    result, total = [], 0.0
+
+    for p in pieces:
+        c = _bounds(p)
+        hit = (b[:,0] <= c[2]) & (c[0] <= b[:,2]) & (b[:,1] <= c[3]) & (c[1] <= b[:,3])
+
+        for k in np.nonzero(hit)[0]:
+            if _is_convex(p) and _is_convex(parts[k]):
+                rings = [_clip(p, parts[k])]
+            else:
+                rings = _clip_rings(p, parts[k])
+
+            for r in rings:
+                if len(r) < 3:
+                    continue
+
+                a = _signed_area(r)
+
+                if a > tol:
+                    result.append(r)
+                    total += a
+
+    return result, total
+
+
+def resolve_overlaps(add, subtract=[]):
+    """
+    Returns a tuple of lists of added and subtracted boundaries describing
+    the region covered by the union of the added shapes less the union of
+    the subtracted shapes. The results account for overlaps between any
+    of the input shapes and may be passed directly to the multi-boundary
+    functions, such as :func:`.multi_section_summary`, which otherwise
+    assume that the added shapes do not overlap and that each subtracted
+    shape lies inside a single added shape.
+
+    Candidate overlaps are found from the bounding boxes of the shapes by
+    :func:`overlap_pairs`, so exact intersections are only calculated for
+    shapes which are near one another. The region is then built by
+    inclusion-exclusion over each group of mutually intersecting shapes
+    that includes an added shape, with the intersections of odd sized groups
+    added and those of even sized groups subtracted. Shapes which do not
+    overlap any others are returned unchanged, and where an intersection is
+    an entire input shape, such as a hole, that shape is returned in place
+    of the intersection. Other intersections are returned as polygons, with
+    any arc edges of the intersected shapes tessellated. Shapes are clipped
+    against one another directly, so the cost of each intersection is that
+    of finding the crossings of the shape boundaries.
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2), or of shape (N, 3) if the boundary contains arc edges.
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        add, subtract = resolve_overlaps(add, subtract)
+        summary = multi_section_summary(add, subtract)
+    """
+    shapes = [np.asarray(x, dtype='float') for x in list(add) + list(subtract)]
+    n_add = len(add)
+
+    if len(shapes) == 0:
+        return [], []
+
+    p, offsets, _ = _pack_multi(add, subtract)
+    m = batch_moments(p, offsets)
+    areas = m[:,0]
+    pairs = _sweep_pairs(m[:,6:10])
+
+    # Tessellated rings of the shapes with candidate overlaps
+    parts, ring_areas = {}, {}
+
+    for i in np.unique(pairs):
+        q = _ring(shapes[i])
+        parts[i] = [q] if len(q) > 2 else []
+        ring_areas[i] = abs(_signed_area(q)) if len(q) > 2 else 0.0
+
+    # Confirm the candidate pairs by their exact intersection
+    nbrs = {i: set() for i in range(len(shapes))}
+    cache = {}
+
+    for i, j in pairs:
+        if i >= n_add and j >= n_add:
+            # Overlaps between subtracted shapes only matter inside added
+            # shapes and are found from there
+            nbrs[i].add(j)
+            nbrs[j].add(i)
+            continue
+
+        tol = OVERLAP_RTOL * min(areas[i], areas[j])
+        cache[i, j] = _intersect(parts[i], parts[j], tol)
+
+        if cache[i, j][1] > tol:
+            nbrs[i].add(j)
+            nbrs[j].add(i)
+
+    result = ([shapes[i] for i in range(n_add)], [])
+
+    def extend(group, pieces, sign):
+        for j in sorted(nbrs[group[-1]]):
+            if j <= group[-1] or not all(j in nbrs[k] for k in group):
+                continue
+
+            g = group + [j]
+            tol = OVERLAP_RTOL * min(areas[k] for k in g)
+
+            if len(g) == 2 and (g[0], j) in cache:
+                r, a = cache[g[0], j]
+            else:
+                r, a = _intersect(pieces, parts[j], tol)
+
+            if a <= tol:
+                continue
+
+            # Use an exact input shape where it is the entire intersection
+            rtol = 10 * TESSELLATE_RTOL
+            full = [k for k in g if abs(a - ring_areas[k]) <= rtol * ring_areas[k]]
+            result[sign < 0].extend([shapes[full[0]]] if full else r)
+            extend(g, r, -sign)
+
+    for i in range(n_add):
+        if i in parts:
+            extend([i], parts[i], -1)
+
+    return result
+
@@ -0,0 +1,95 @@
+from __future__ import division
+import time
+import numpy as np
+from pytest import approx
+from .multi import multi_area, multi_centroid, multi_inertias
+from .angle import angle_points
+from .round import round_arc_points, round_area, round_points
+from .overlap import *
+
+
+def rect(x, y, w, h):
+    return np.array([(x, y), (x+w, y), (x+w, y+h), (x, y+h)], dtype='float')
+
+
+def test_overlap_pairs():
+    np.random.seed(4928137)
+    x = np.random.uniform(0, 100, (300, 2))
+    p = np.stack([rect(a, b, *np.random.uniform(0, 5, 2)) for a, b in x])
+
+    b = np.column_stack([p.min(axis=1), p.max(axis=1)])
+    sol = [(i, j) for i in range(len(b)) for j in range(i+1, len(b))
+           if b[i,0] <= b[j,2] and b[j,0] <= b[i,2]
+           and b[i,1] <= b[j,3] and b[j,1] <= b[i,3]]
+
+    pairs = overlap_pairs(p)
+    assert [tuple(x) for x in pairs] == sol
+
+
+def test_resolve_overlaps_disjoint():
+    add = [rect(0, 0, 1, 1), rect(1, 0, 1, 1), rect(5, 5, 1, 2)]
+    a, s = resolve_overlaps(add)
+
+    assert len(a) == 3
+    assert len(s) == 0
+    assert all((x == y).all() for x, y in zip(a, add))
+
+
+def test_resolve_overlaps_union():
+    add = [rect(0, 0, 2, 2), rect(1, 1, 2, 2), rect(1.5, 0, 1, 3)]
+    a, s = resolve_overlaps(add)
+
+    assert approx(multi_area(a, s)) == 7.5
+    assert approx(multi_centroid(a, s)) == [1.55, 1.43333333]
+    assert approx(multi_inertias(a, s)) == [5.09166667, 4.85625, 9.94791667, 1.65]
+
+
+def test_resolve_overlaps_hole():
+    add = [round_arc_points(10)]
+    subtract = [round_arc_points(8)]
+    a, s = resolve_overlaps(add, subtract)
+
+    assert s[0] is subtract[0] or (s[0] == subtract[0]).all()
+    assert approx(multi_area(a, s), rel=1e-12) == round_area(10, 1)
+
+
+def test_resolve_overlaps_subtract():
+    # Overlapping holes, one of which extends past the edge of the plate
+    add = [rect(0, 0, 10, 2)]
+    subtract = [rect(1, 0.5, 2, 1), rect(2, 0.5, 2, 1), rect(9, 0.5, 2, 1)]
+    a, s = resolve_overlaps(add, subtract)
+
+    assert approx(multi_area(a, s)) == 20 - 3 - 1
+    assert approx(multi_centroid(a, s)) == [5.1875, 1]
+
+
+def test_resolve_overlaps_angles():
+    # Non-convex shapes sharing part of their edges
+    add = [angle_points(8, 6, 1), angle_points(8, 8, 0.5)]
+    a, s = resolve_overlaps(add)
+
+    assert approx(multi_area(a, s), rel=1e-6) == 14
+
+
+def lens_area(r1, r2, d):
+    # Area of the intersection of two circles a distance d apart
+    x = (d**2 + r1**2 - r2**2) / (2*d)
+    h = np.sqrt(r1**2 - x**2)
+    return (r1**2 * np.arccos(x / r1) + r2**2 * np.arccos((d - x) / r2)
+            - d * h)
+
+
+def test_resolve_overlaps_pipe():
+    # Pipe rings with many vertices are clipped without triangulation
+    add = [round_points(10, 1), round_points(4) + (5, 0)]
+
+    start = time.time()
+    a, s = resolve_overlaps(add)
+    assert time.time() - start < 2
+    assert len(s) <= 4
+
+    # Pipe wall plus the parts of the disk inside and outside of the wall
+    wall = np.pi * (5**2 - 4**2)
+    disk = np.pi * 2**2
+    area = wall + lens_area(4, 2, 5) + disk - lens_area(5, 2, 5)
+    assert approx(multi_area(a, s), rel=1e-4) == area
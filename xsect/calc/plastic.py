@@ -0,0 +1,380 @@
+from __future__ import division
+import numpy as np
+from .arc import tessellate
+
+__all__ = []
+
+PLASTIC_RTOL = 1e-6 # Relative tolerance for the tessellation of arc edges
+PARALLEL_TOL = 1e-10 # Relative tolerance for edges parallel to the bending axis
+SEGMENT_LOOP_SIZE = 4096 # Minimum length of segments summed individually
+
+
+def _tessellate_buffer(p, offsets, rtol=PLASTIC_RTOL):
+    """
+    Returns the input vertex buffer and offsets with any circular arc edges
+    replaced by straight segments. Buffers without arc edges are returned
+    with only their (x, y) columns.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    rtol : float
+        The relative tolerance for the tessellation. See :func:`.arc_segments`.
+    """
+    if p.shape[1] < 3 or not p[:,2].any():
+        return p[:,:2], offsets
+
+    rings = [tessellate(p[i:j], rtol=rtol)
+             for i, j in zip(offsets[:-1], offsets[1:])]
+
+    offsets = np.zeros(len(rings) + 1, dtype='int')
+    np.cumsum([len(x) for x in rings], out=offsets[1:])
+
+    return np.concatenate(rings), offsets
+
+
+def _segment_cumsum(x, start, n):
+    """
+    Returns the cumulative sums of an array restarting at the start of each
+    contiguous segment. The sums of each segment are accumulated in the same
+    order as a cumulative sum of the segment alone, such that the results do
+    not depend on the other segments. Segments of at least
+    `SEGMENT_LOOP_SIZE` values are summed in turn, and shorter segments are
+    summed together in blocks of segments padded to the next power of two
+    length, such that the padding at most doubles the block size.
+
+    Parameters
+    ----------
+    x : array
+        The array of values of shape (N,).
+    start : array
+        The increasing start indices of the segments, which together cover
+        the array.
+    n : array
+        The number of values in each segment.
+    """
+    c = np.empty_like(x)
+    long = n >= SEGMENT_LOOP_SIZE
+
+    for i, k in zip(start[long], n[long]):
+        np.cumsum(x[i:i+k], out=c[i:i+k])
+
+    start, n = start[~long], n[~long]
+    size = np.ceil(np.log2(np.maximum(n, 1))).astype('int')
+
+    for b in np.unique(size):
+        i = size == b
+        col = np.arange(2**b)
+        mask = col < n[i,np.newaxis]
+        idx = (start[i,np.newaxis] + col)[mask]
+        a = np.zeros(mask.shape)
+        a[mask] = x[idx]
+        c[idx] = np.cumsum(a, axis=1)[mask]
+
+    return c
+
+
+def _plastic_axes(p, offsets, origin, angles, weights=None, groups=None):
+    """
+    Returns the offsets of the plastic neutral axes and the plastic section
+    modulii for sections bending about axes passing through the input origins
+    at the input angles. The offsets are measured from the origins
+    perpendicular to the axes, in the direction of the axes rotated 90
+    degrees counterclockwise.
+
+    The width of a section parallel to an axis is a piecewise linear function
+    of the perpendicular coordinate, with breaks at the vertex coordinates.
+    The edges are entered and exited in sorted order while accumulating
+    the coefficients of the width function, from which the area and first
+    moment of each interval are integrated exactly. The neutral axis is then
+    solved in the interval at which the cumulative area reaches half of the
+    total area. The cost is O(N log N) for N vertices.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) without arc edges.
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (R + 1,).
+    origin : array
+        An array of (x, y) origins of shape (M, 2), one per section.
+    angles : array
+        An array of angles from the x-axis to the bending axes of shape (M,).
+    weights : array
+        An array of boundary weights of shape (R,), where 1 adds and -1
+        subtracts the boundary from its section. If None, all boundaries
+        are added.
+    groups : array
+        An array of shape (R,) of the section to which each boundary belongs.
+        If None, each boundary is its own section.
+    """
+    r = len(offsets) - 1
+    m = len(origin)
+
+    if weights is None:
+        weights = np.ones(r)
+
+    if groups is None:
+        groups = np.arange(r)
+
+    start = offsets[:-1]
+    n = np.diff(offsets)
+    g = np.repeat(groups, n)
+
+    # Transform to the (u, v) axes of the section, with v perpendicular
+    # to the bending axis
+    c, s = np.cos(angles)[g], np.sin(angles)[g]
+    q = p - origin[g]
+    u = q[:,0]*c + q[:,1]*s
+    v = q[:,1]*c - q[:,0]*s
+
+    nxt = np.arange(1, p.shape[0] + 1)
+    nxt[offsets[1:] - 1] = start
+    u1, v1 = u[nxt], v[nxt]
+
+    # Orient the boundaries such that added areas are positive
+    a2 = np.add.reduceat(u*v1 - u1*v, start)
+    w = np.repeat(weights * np.sign(a2), n)
+
+    # Edges parallel to the axis do not contribute to the width. Edges that
+    # are parallel to within round off are also dropped, since their large
+    # slopes would otherwise swamp the accumulated width coefficients
+    scale = np.maximum.reduceat(np.abs(q).max(axis=1), start)
+    dv = v1 - v
+    k = np.abs(dv) > PARALLEL_TOL * np.repeat(scale, n)
+    u, v, u1, v1, dv, w, g = u[k], v[k], u1[k], v1[k], dv[k], w[k], g[k]
+
+    slope = (u1 - u) / dv
+    sign = w * np.sign(dv)
+    va, vb = np.minimum(v, v1), np.maximum(v, v1)
+    ua = np.where(v < v1, u, u1)
+    del q, u, v, u1, v1, dv, w
+
+    # Width function coefficients of the active edges, width = a * t + b
+    a = sign * slope
+    b = sign * (ua - slope * va)
+    del slope, sign, ua
+
+    # Sort the entry and exit events of the edges by section and then by
+    # height, such that each section occupies a contiguous segment
+    h = np.concatenate([va, vb])
+    del va, vb
+    gh = np.concatenate([g, g])
+    i = np.lexsort((h, gh))
+    h, gh = h[i], gh[i]
+    ca = np.concatenate([a, -a])[i]
+    cb = np.concatenate([b, -b])[i]
+    del a, b, i
+
+    count = np.bincount(gh, minlength=m)
+    sections = np.nonzero(count)[0]
+    n = count[sections]
+    start = np.cumsum(n) - n
+    stop = start + n - 1
+    del gh
+
+    # Coefficients on the interval following each event
+    ca = _segment_cumsum(ca, start, n)
+    cb = _segment_cumsum(cb, start, n)
+
+    # Integrate the area and first moment of the interval following each
+    # event. The intervals following the last events of the sections are
+    # empty. The products are accumulated in place to limit temporaries
+    dh = np.append(h[1:], 0)
+    dh[stop] = h[stop]
+    dh -= h
+    wl = ca * h
+    wl += cb
+    wr = ca * dh
+    wr += wl
+
+    # First moment, dh / 6 * (2*h0*wl + h0*wr + h1*wl + 2*h1*wr) with
+    # h1 = h0 + dh
+    tq = wl + wr
+    tq *= 3 * h
+    tq += dh * (wl + 2*wr)
+    tq *= dh / 6
+
+    # Area, (wl + wr) / 2 * dh
+    ta = wl + wr
+    ta *= 0.5 * dh
+    del wl, wr
+
+    ta = _segment_cumsum(ta, start, n)
+    tq = _segment_cumsum(tq, start, n)
+    area, qtot = ta[stop], tq[stop]
+
+    # Locate the first interval of each section containing half of the area
+    cross = ta >= np.repeat(0.5 * area, n)
+    j = np.where(cross, np.arange(len(h)), len(h))
+    del cross
+    j = np.minimum.reduceat(j, start) if len(h) > 0 else j
+    ok = j <= stop
+    k, j, start = sections[ok], j[ok], start[ok]
+    first = j > start
+    before = np.where(first, ta[j - 1], 0)
+    q0 = np.where(first, tq[j - 1], 0)
+
+    # Solve the quadratic area equation within the interval
+    rem = 0.5 * area[ok] - before
+    slope, t0 = ca[j], h[j]
+    w0 = slope*t0 + cb[j]
+    root = np.sqrt(np.maximum(w0**2 + 2*slope*rem, 0))
+    den = w0 + root
+    tau = np.where(den > 0, 2 * rem / np.where(den > 0, den, 1), 0)
+    tau = np.clip(tau, 0, dh[j])
+
+    t1 = t0 + tau
+    w1 = w0 + slope*tau
+    qt = q0 + tau / 6 * (t0*w0 + (t0 + t1)*(w0 + w1) + t1*w1)
+
+    d = np.zeros(m)
+    z = np.zeros(m)
+    d[k] = t1
+    z[k] = qtot[ok] - 2*qt
+
+    return d, z
+
+
+def _segment_plastic(p, offsets, origin, angles, weights=None, groups=None):
+    """
+    Returns the plastic neutral axis offsets and plastic section modulii,
+    as returned by :func:`_plastic_axes`, for each section about each of the
+    input angles. The results are arrays of shape (M, A).
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2), or of shape (K, 3) if the boundaries
+        contain arc edges.
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (R + 1,).
+    origin : array
+        An array of (x, y) origins of shape (M, 2), one per section.
+    angles : array
+        An array of angles from the x-axis to the bending axes of shape (A,).
+    weights, groups : array
+        The boundary weights and sections. See :func:`_plastic_axes`.
+    """
+    p, offsets = _tessellate_buffer(p, np.asarray(offsets))
+    angles = np.atleast_1d(np.asarray(angles, dtype='float'))
+
+    m, na = len(origin), len(angles)
+    r = len(offsets) - 1
+
+    if weights is None:
+        weights = np.ones(r)
+
+    if groups is None:
+        groups = np.arange(r)
+
+    d = np.zeros((m, na))
+    z = np.zeros((m, na))
+
+    # The angles are solved in turn, such that the memory of the event
+    # arrays is bounded by the size of the vertex buffer
+    for i, x in enumerate(angles):
+        d[:,i], z[:,i] = _plastic_axes(p, offsets, origin, np.full(m, x),
+                                       weights, groups)
+
+    return d, z
+
+
+def _strip_plastic(t0, t1, w):
+    """
+    Returns the plastic section modulii of sections composed of rectangles
+    spanning from `t0` to `t1` perpendicular to the bending axis, with the
+    widths `w` parallel to the axis. The inputs are arrays of shape (M, R)
+    and the result is an array of shape (M,).
+
+    The area on one side of the axis is piecewise linear in the axis location,
+    with breaks at the rectangle edges. It is evaluated at every edge, and the
+    neutral axis is interpolated between the edges bracketing half of the
+    area, at a cost of O(R^2) per section.
+
+    Parameters
+    ----------
+    t0, t1 : array
+        The minimum and maximum coordinates of the rectangles perpendicular
+        to the axis.
+    w : array
+        The widths of the rectangles.
+    """
+    h = t1 - t0
+    t = np.concatenate([t0, t1], axis=1)
+    a = np.clip(t[:,:,np.newaxis] - t0[:,np.newaxis], 0, h[:,np.newaxis])
+    a = np.sum(w[:,np.newaxis] * a, axis=2)
+    half = 0.5 * np.sum(w * h, axis=1, keepdims=True)
+
+    r = np.arange(len(t))
+    i = np.argmax(np.where(a <= half, t, -np.inf), axis=1)
+    j = np.argmin(np.where(a >= half, t, np.inf), axis=1)
+    a0, a1 = a[r, i], a[r, j]
+    d0, d1 = t[r, i], t[r, j]
+
+    da = np.where(a1 > a0, a1 - a0, 1)
+    d = d0 + (half[:,0] - a0) * (d1 - d0) / da
+    d = d[:,np.newaxis]
+
+    # Integrate |t - d| over each rectangle
+    def f(x):
+        return 0.5 * x * np.abs(x)
+
+    return np.sum(w * (f(t1 - d) - f(t0 - d)), axis=1)
+
+
+def _rectangle_plastic(rects):
+    """
+    Returns the plastic section modulii about the x and y axes for sections
+    composed of non-overlapping axis aligned rectangles. The result is an
+    array of shape (M, 2).
+
+    Parameters
+    ----------
+    rects : list
+        A list of R tuples of the (xmin, ymin, xmax, ymax) coordinates of
+        the rectangles, each an array of shape (M,).
+    """
+    x0, y0, x1, y1 = [np.column_stack(x) for x in zip(*rects)]
+    zx = _strip_plastic(y0, y1, x1 - x0)
+    zy = _strip_plastic(x0, x1, y1 - y0)
+    return np.column_stack([zx, zy])
+
+
+def _axis_plastic(p, offsets, origin, angles, weights=None):
+    """
+    Returns the plastic neutral axis offsets and plastic section modulii for
+    a single section about (u, v) axes through the input origin, rotated
+    counterclockwise from the x and y axes by the input angles. The first
+    columns apply to the u-axes, with offsets measured in the v direction,
+    and the second columns apply to the v-axes, with offsets measured in
+    the u direction. The results are arrays of shape (K, 2).
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (N, 2), or of shape (N, 3) if the boundaries
+        contain arc edges.
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (R + 1,).
+    origin : array
+        The (x, y) origin of the axes.
+    angles : array
+        An array of angles from the x-axis to the u-axis of shape (K,).
+    weights : array
+        The boundary weights. See :func:`_plastic_axes`.
+    """
+    k = len(angles)
+    origin = np.reshape(origin, (1, 2))
+    groups = np.zeros(len(offsets) - 1, dtype='int')
+
+    ang = np.concatenate([angles, angles + 0.5*np.pi])
+    d, z = _segment_plastic(p, offsets, origin, ang, weights, groups)
+
+    d = np.column_stack([d[0,:k], -d[0,k:]])
+    z = np.column_stack([z[0,:k], z[0,k:]])
+
+    return d, z
@@ -1,8 +1,10 @@
 from __future__ import division
 import numpy as np
-from .boundary import close_points, section_summary
+from .boundary import close_points, _broadcast_params, _shape_summary
+from .plastic import _segment_plastic
+from .section_moments import SectionMoments
 
-__all__ = ['polygon_points', 'polygon_summary']
+__all__ = ['polygon_points', 'polygon_moments', 'polygon_summary']
 
 
 def polygon_points(n, radius, thickness=None, is_inscribed=True):
@@ -45,22 +47,135 @@ def polygon_points(n, radius, thickness=None, is_inscribed=True):
     return close_points(points)
 
 
+def _polygon_sums(n, radius):
+    """
+    Returns the raw moment sums about the center for regular polygons with
+    the input numbers of sides and circumscribing radii. The polygons are
+    divided into `n` triangles about the center, whose inertias sum to an
+    isotropic tensor. The result is an array of shape (M, 6).
+
+    Parameters
+    ----------
+    n : array
+        The number of sides of the polygons.
+    radius : array
+        The radii of the vertices.
+    """
+    t = 2*np.pi / n
+    a = 0.5 * n * radius**2 * np.sin(t)
+    j = n * radius**4 * np.sin(t) * (2 + np.cos(t)) / 12
+    z = np.zeros_like(a)
+    return np.column_stack([2*a, z, z, 6*j, 6*j, z])
+
+
+def _polygon_plastic(n, radius, inner_radius=None):
+    """
+    Returns the plastic section modulii about the x and y axes for regular
+    polygons. The result is an array of shape (M, 2).
+
+    Parameters
+    ----------
+    n : array
+        The number of sides of the polygons.
+    radius : array
+        The outer radii of the vertices.
+    inner_radius : array
+        The inner radii of the vertices. If None, the polygons are solid.
+    """
+    n = np.asarray(n, dtype='int')
+    m = len(n)
+    r = [radius] if inner_radius is None else [radius, inner_radius]
+
+    count = np.tile(n, len(r))
+    offsets = np.zeros(len(count) + 1, dtype='int')
+    np.cumsum(count, out=offsets[1:])
+
+    # Vertex index within each boundary
+    k = np.arange(offsets[-1]) - np.repeat(offsets[:-1], count)
+    ang = 0.5*np.pi + 2*np.pi * k / np.repeat(count, count)
+    ro = np.repeat(np.concatenate(r), count)
+
+    p = np.column_stack([ro * np.cos(ang), ro * np.sin(ang)])
+    w = np.repeat([1.0, -1.0][:len(r)], m)
+    g = np.tile(np.arange(m), len(r))
+    o = np.zeros((m, 2))
+
+    return _segment_plastic(p, offsets, o, [0, 0.5*np.pi], w, g)[1]
+
+
+def _polygon_geometry(n, radius, thickness, is_inscribed):
+    """
+    Returns a tuple of the broadcast shape of the parameters, the raw moment
+    sums, the bounds, the number of sides, and the outer and inner vertex
+    radii of polygon sections. The inner radii are None for solid polygons.
+    See :func:`polygon_summary` for the parameters.
+    """
+    t = 0 if thickness is None else thickness
+    shape, (n, r, t) = _broadcast_params(n, radius, t)
+
+    c = np.cos(np.pi/n)
+
+    if is_inscribed:
+        ro = r
+    else:
+        ro = r / c
+
+    s = _polygon_sums(n, ro)
+    ri = None
+
+    if thickness is not None:
+        if is_inscribed:
+            ri = ro - t / c
+        else:
+            ri = (r - t) / c
+
+        s -= _polygon_sums(n, ri)
+
+    # Vertices are located at angles of pi / 2 + 2 pi k / n. The maximum x is
+    # attained at the vertex nearest the x-axis.
+    k = np.round(0.25*n)
+    xmax = ro * np.cos(2*np.pi * np.abs(k - 0.25*n) / n)
+    ymin = np.where(np.mod(n, 2) == 0, -ro, -ro * c)
+
+    bounds = np.column_stack([-xmax, ymin, xmax, ro])
+
+    return shape, s, bounds, n, ro, ri
+
+
+def polygon_moments(n, radius, thickness=None, is_inscribed=True):
+    """
+    Returns the :class:`.SectionMoments` of polygon sections. The moments
+    are calculated in closed form, and the parameters may be arrays, in
+    which case they are broadcast against one another. See
+    :func:`polygon_summary` for the parameters.
+    """
+    shape, s, bounds = _polygon_geometry(n, radius, thickness, is_inscribed)[:3]
+    return SectionMoments._from_sums(shape, s, bounds)
+
+
 def polygon_summary(n, radius, thickness=None, is_inscribed=True):
     """
     Returns a dictionary with a summary of polygon section properties.
 
+    The properties are calculated in closed form, and the parameters may be
+    arrays, in which case they are broadcast against one another and each
+    property is returned as an array of the broadcast shape.
+
     Parameters
     ----------
-    n : int
+    n : int or array
         The number of sides to the polygon.
-    radius : float
+    radius : float or array
         The radius of the polygon.
-    thickness : float
+    thickness : float or array
         The thickness of the wall. If None, the cross section will be assumed
         to be solid.
     is_inscribed : bool
         If True, an inscribed polygon will be generated for the specified
         radius. Otherwise, a circumscribed polygon will be generated.
     """
-    p = polygon_points(n, radius, thickness, is_inscribed)
-    return section_summary(p)
+    shape, s, bounds, n, ro, ri = _polygon_geometry(
+        n, radius, thickness, is_inscribed)
+    plastic = _polygon_plastic(n, ro, ri)
+
+    return _shape_summary(shape, s, bounds, plastic)
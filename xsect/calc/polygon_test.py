@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from .boundary import section_summary
 from .polygon import *
 
 
@@ -19,3 +20,17 @@ def test_polygon_summary():
     p = polygon_summary(6, 1, 0.1, is_inscribed=False)
     a = 3.4641016151378 - 2.8059223082616
     assert pytest.approx(p['area']) == a
+
+
+def test_polygon_summary_array():
+    n = np.array([3, 4, 5, 6, 7, 8])
+
+    for t in (None, 0.1):
+        for inscribed in (True, False):
+            a = polygon_summary(n, 1, t, inscribed)
+
+            for i, x in enumerate(n):
+                b = section_summary(polygon_points(x, 1, t, inscribed))
+
+                for k, v in b.items():
+                    assert pytest.approx(a[k][i], rel=1e-9, abs=1e-9) == v
@@ -1,9 +1,13 @@
 from __future__ import division
+import warnings
 import numpy as np
+from .arc import arc_bulge, arc_segments, arc_error
 from .boundary import close_points, section_summary
+from .section_moments import SectionMoments
 
 __all__ = ['round_area', 'round_inertia', 'round_gyradius',
-           'round_sect_mod', 'round_points', 'round_summary']
+           'round_sect_mod', 'round_plast_sect_mod', 'round_points', 'round_points_error',
+           'round_arc_points', 'round_moments', 'round_summary']
 
 
 def round_area(diameter, thickness=None):
@@ -84,7 +88,53 @@ def round_sect_mod(diameter, thickness=None):
     return i / c
 
 
-def round_points(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01):
+def round_plast_sect_mod(diameter, thickness=None):
+    """
+    Returns the plastic section modulus for a round or pipe.
+
+    Parameters
+    ----------
+    diameter : float
+        The outside diameter of the round or pipe.
+    thickness : float
+        The thickness of the pipe. If None, the cross section is assumed
+        to be a solid round.
+    """
+    if thickness is None:
+        return diameter**3 / 6
+
+    di = diameter - 2*thickness
+
+    return (diameter**3 - di**3) / 6
+
+
+def _round_segments(diameter, thickness, start, stop, step, tol, rtol):
+    """
+    Returns the number of segments for the outer and inner boundaries of
+    a round. See :func:`round_points` for the parameters.
+    """
+    ro = 0.5 * diameter
+    ri = None if thickness is None else ro - thickness
+    sweep = stop - start
+
+    if tol is None and rtol is None:
+        no = int(np.ceil(abs(ro * sweep / step)))
+        ni = None if ri is None else int(np.ceil(abs(ri * sweep / step)))
+        return max(no - 1, 1), None if ni is None else max(ni - 1, 1)
+
+    # Both boundaries use the same angular step, so that the relative
+    # errors of the outer and inner rings are equal and do not amplify
+    # in the net section
+    n = arc_segments(ro, sweep, tol, rtol)
+
+    if np.isclose(abs(sweep), 2*np.pi):
+        n = max(n, 3)
+
+    return n, None if ri is None else n
+
+
+def round_points(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01,
+                 tol=None, rtol=None):
     """
     Returns an array of boundary points for a round or pipe.
 
@@ -102,31 +152,153 @@ def round_points(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01):
     step : float
         The step interval for point generation. A smaller value will
         provide a boundary closer to that of the ideal shape at the expense
-        of more memory and computation time.
+        of more memory and computation time. Not used if `tol` or `rtol`
+        is specified.
+    tol : float
+        If specified, the fewest points are generated such that the sagitta,
+        the maximum distance between the ideal and generated boundaries,
+        does not exceed this value.
+    rtol : float
+        If specified, the fewest points are generated such that the relative
+        error in the area and moment of inertia of the rings does not exceed
+        this value. May be combined with `tol`. See :func:`round_points_error`
+        for the achieved error.
     """
     ro = 0.5 * diameter
-    n = int(np.ceil(abs(ro * (stop - start) / step)))
-    if n < 2: n = 2
-    ang = np.linspace(start, stop, n)
+    no, ni = _round_segments(diameter, thickness, start, stop, step, tol, rtol)
+
+    ang = np.linspace(start, stop, no + 1)
     points = ro * np.column_stack([np.cos(ang), np.sin(ang)])
 
     if thickness is not None:
         ri = ro - thickness
-        n = int(np.ceil(abs(ri * (stop - start) / step)))
-        if n < 2: n = 2
-        ang = np.linspace(stop, start, n)
+        ang = np.linspace(stop, start, ni + 1)
         p = ri * np.column_stack([np.cos(ang), np.sin(ang)])
         points = np.concatenate([points, p])
 
     return close_points(points)
 
 
-def round_summary(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01):
+def round_points_error(diameter, thickness=None, start=0, stop=2*np.pi,
+                       step=0.01, tol=None, rtol=None):
+    """
+    Returns the maximum sagitta and the maximum relative error in the
+    area and moment of inertia of the rings for the boundary points
+    generated by :func:`round_points` with the same parameters.
+
+    Parameters
+    ----------
+    diameter : float
+        The outside diameter of the round or pipe.
+    thickness : float
+        The wall thickness of the pipe. If None, the cross section will
+        be assumed to be solid.
+    start : float
+        The starting angle for point generation, in radians.
+    stop : float
+        The ending angle for point generation, in radians.
+    step : float
+        The step interval for point generation.
+    tol : float
+        The maximum sagitta.
+    rtol : float
+        The maximum relative error in the area and moment of inertia.
+
+    Examples
+    --------
+    >>> round_points_error(1000, 20, rtol=1e-6)
+    (0.000187..., 9.997...e-07)
+    >>> len(round_points(1000, 20, rtol=1e-6))
+    7259
+    """
+    ro = 0.5 * diameter
+    sweep = stop - start
+    no, ni = _round_segments(diameter, thickness, start, stop, step, tol, rtol)
+    sagitta, error = arc_error(ro, sweep, no)
+
+    if thickness is not None:
+        s, e = arc_error(ro - thickness, sweep, ni)
+        sagitta, error = max(sagitta, s), max(error, e)
+
+    return sagitta, error
+
+
+def round_arc_points(diameter, thickness=None, start=0, stop=2*np.pi):
+    """
+    Returns an array of boundary points of shape (N, 3) for a round or pipe
+    defined by exact circular arc edges. The third column contains the
+    bulge factors of the edges, as described in :func:`.arc_bulge`. Unlike
+    :func:`round_points`, the number of points does not depend on the size
+    of the round.
+
+    Parameters
+    ----------
+    diameter : float
+        The outside diameter of the round or pipe.
+    thickness : float
+        The wall thickness of the pipe. If None, the cross section will
+        be assumed to be solid.
+    start : float
+        The starting angle of the round, in radians.
+    stop : float
+        The ending angle of the round, in radians.
+    """
+    ro = 0.5 * diameter
+    sweep = stop - start
+    full = np.isclose(abs(sweep), 2*np.pi)
+
+    # Use arcs of no more than 90 degrees each
+    n = max(2, int(np.ceil(abs(sweep) / (0.5*np.pi))))
+    ang = np.linspace(start, stop, n + 1)
+    b = np.full(n + 1, arc_bulge(sweep / n))
+    b[-1] = 0
+
+    c = np.column_stack([np.cos(ang), np.sin(ang)])
+
+    if thickness is None:
+        if full:
+            points = np.column_stack([ro * c[:-1], b[:-1]])
+            points[-1,2] = b[0]
+        else:
+            points = np.column_stack([ro * c, b])
+    else:
+        ri = ro - thickness
+        points = np.concatenate([
+            np.column_stack([ro * c, b]),
+            np.column_stack([ri * c[::-1], -b])
+        ])
+
+    return close_points(points)
+
+
+def round_moments(diameter, thickness=None):
+    """
+    Returns the :class:`.SectionMoments` of rounds or pipes centered at the
+    origin. The moments are calculated in closed form, and the parameters
+    may be arrays, in which case they are broadcast against one another.
+
+    Parameters
+    ----------
+    diameter : float or array
+        The outside diameter of the round or pipe.
+    thickness : float or array
+        The wall thickness of the pipe. If None, the cross section is assumed
+        to be a solid round.
+    """
+    d = np.asarray(diameter, dtype='float')
+    a = round_area(diameter, thickness)
+    i = round_inertia(diameter, thickness)
+    a, i, r = np.broadcast_arrays(a, i, 0.5*d)
+    z = np.zeros_like(a)
+
+    return SectionMoments(np.stack([a, z, z, i, i, z, -r, -r, r, r], axis=-1))
+
+
+def round_summary(diameter, thickness=None, start=0, stop=2*np.pi, step=None):
     """
     Returns a dictionary with a summary of cross sectional properties
-    for the round. If the `start` and `stop` angles represent a closed ring,
-    then the values returned are exact. Otherwise, the values will be
-    approximated based on boundary point calculations.
+    for the round. Partial rounds are calculated exactly from boundaries
+    with circular arc edges.
 
     Parameters
     ----------
@@ -140,9 +312,10 @@ def round_summary(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01):
     stop : float
         The ending angle for point generation, in radians.
     step : float
-        The step interval for point generation. A smaller value will
-        provide a boundary closer to that of the ideal shape at the expense
-        of more memory and computation time.
+        Deprecated. If specified, partial rounds are approximated by
+        boundary points generated at this step interval, as returned by
+        :func:`round_points`, instead of exact arc edges, and a
+        :class:`DeprecationWarning` is issued.
 
     Returns
     -------
@@ -166,6 +339,8 @@ def round_summary(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01):
         The elastic section modulii about the x and y axes.
     elast_sect_mod_z : float
         The elastic section modulus about the weak principal axis.
+    plast_sect_mod_x, plast_sect_mod_y : float
+        The plastic section modulii about the x and y axes.
     """
     if start == 0 and stop == 2*np.pi:
         a = round_area(diameter, thickness)
@@ -173,15 +348,24 @@ def round_summary(diameter, thickness=None, start=0, stop=2*np.pi, step=0.01):
         ij = 2 * i
         r = round_gyradius(diameter, thickness)
         s = round_sect_mod(diameter, thickness)
+        z = round_plast_sect_mod(diameter, thickness)
 
         summary = dict(
             area=a, x=0, y=0, width=diameter/2, height=diameter/2,
             inertia_x=i, inertia_y=i, inertia_j=ij, inertia_xy=0, inertia_z=i,
             gyradius_x=r, gyradius_y=r, gyradius_z=r,
-            elast_sect_mod_x=s, elast_sect_mod_y=s, elast_sect_mod_z=s
+            elast_sect_mod_x=s, elast_sect_mod_y=s, elast_sect_mod_z=s,
+            plast_sect_mod_x=z, plast_sect_mod_y=z
         )
 
         return summary
 
-    p = round_points(diameter, thickness, start, stop, step)
+    if step is not None:
+        warnings.warn('The step argument of round_summary is deprecated. '
+            'Partial rounds are calculated exactly when it is omitted.',
+            DeprecationWarning, stacklevel=2)
+        p = round_points(diameter, thickness, start, stop, step)
+    else:
+        p = round_arc_points(diameter, thickness, start, stop)
+
     return section_summary(p)
@@ -1,6 +1,7 @@
 from __future__ import division
 import pytest
 import numpy as np
+from .boundary import section_summary
 from .round import *
 
 
@@ -41,6 +42,16 @@ def test_round_sect_mod():
     assert pytest.approx(round_sect_mod(4, 1), 0.01) == a
 
 
+def test_round_plast_sect_mod():
+    # No thickness
+    assert pytest.approx(round_plast_sect_mod(4)) == 4**3/6
+
+    # With thickness
+    a = section_summary(round_arc_points(4, 1), plastic=True)
+    a = a['plast_sect_mod_x']
+    assert pytest.approx(round_plast_sect_mod(4, 1), 1e-5) == a
+
+
 def test_round_points():
     # No thickness
     round_points(4)
@@ -49,6 +60,47 @@ def test_round_points():
     round_points(4, 1)
 
 
+def test_round_points_tolerance():
+    # Sagitta tolerance
+    p = round_points(1000, 20, tol=0.1)
+    s, e = round_points_error(1000, 20, tol=0.1)
+    assert s <= 0.1
+    assert len(p) < len(round_points(1000, 20))
+
+    # Relative tolerance
+    odict = section_summary(round_points(1000, 20, rtol=1e-6))
+    s, e = round_points_error(1000, 20, rtol=1e-6)
+    assert e <= 1e-6
+    assert pytest.approx(odict['area'], rel=1e-6) == round_area(1000, 20)
+    assert pytest.approx(odict['inertia_x'], rel=1e-6) == round_inertia(1000, 20)
+
+    # Partial round
+    p = round_points(4, start=0, stop=np.pi, rtol=1e-4)
+    assert pytest.approx(p[0]) == (2, 0)
+    assert pytest.approx(p[-2]) == (-2, 0)
+
+
+def test_round_arc_points():
+    # Full rounds should be exact
+    odict = section_summary(round_arc_points(4, 1))
+    assert pytest.approx(odict['area']) == round_area(4, 1)
+    assert pytest.approx(odict['inertia_x']) == round_inertia(4, 1)
+    assert pytest.approx(odict['elast_sect_mod_y']) == round_sect_mod(4, 1)
+    assert pytest.approx(odict['width']) == 4
+
+    odict = section_summary(round_arc_points(4))
+    assert pytest.approx(odict['area']) == round_area(4)
+    assert pytest.approx(odict['inertia_y']) == round_inertia(4)
+
+    # Partial rounds should match a fine tessellation
+    for t in [None, 1]:
+        a = section_summary(round_arc_points(4, t, 0.3, 4))
+        b = section_summary(round_points(4, t, 0.3, 4, step=1e-4))
+
+        for k, x in a.items():
+            assert pytest.approx(x, rel=1e-6, abs=1e-8) == b[k]
+
+
 def test_round_summary():
     # No thickness
     summary = round_summary(4)
@@ -92,3 +144,13 @@ def test_round_summary():
         assert pytest.approx(x, 0.01) == summary[k]
 
     round_summary(4, 1, np.pi/2)
+
+
+def test_round_summary_step():
+    a = round_summary(4, 1, 0, np.pi/2)
+
+    with pytest.warns(DeprecationWarning):
+        b = round_summary(4, 1, 0, np.pi/2, step=0.01)
+
+    assert pytest.approx(a['area'], 1e-3) == b['area']
+    assert a['area'] != b['area']
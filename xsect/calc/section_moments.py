@@ -0,0 +1,436 @@
+from __future__ import division
+import numpy as np
+from .boundary import batch_moments, _raw_to_moments
+from .boundary import _principal_angles, _principal_inertias, _rotate_inertias
+
+__all__ = ['SectionMoments']
+
+
+class SectionMoments():
+    """
+    An immutable value representing the area, centroid, centroidal moment
+    of inertias, and bounds of a section. Section moments may be combined
+    and transformed without reference to the boundary points from which
+    they were calculated, with each operation taking O(1) time:
+
+    * Adding or subtracting moments combines or removes parts by the
+      parallel axis theorem.
+    * Multiplying moments by a factor weights the area and inertias, such
+      as by a modular ratio, without changing the centroid or bounds.
+    * :meth:`translate`, :meth:`rotate`, :meth:`mirror`, and :meth:`scale`
+      transform the section geometrically.
+
+    The bounds of a section rotated by an angle other than a multiple of
+    pi / 2 cannot be derived from its moments, and so are unknown and
+    stored as NaN. The properties derived from the bounds, such as the
+    extreme fibers and elastic section modulii, then raise a ValueError.
+
+    The moments may also be arrays of many sections, in which case the
+    operations are applied element-wise and broadcast against one another.
+
+    Parameters
+    ----------
+    moments : array
+        An array of moments of shape (10,), or of shape (..., 10) for many
+        sections, as returned by :func:`.moments`.
+
+    Examples
+    --------
+    >>> a = angle_moments(6, 4, 0.5).translate(0.25, 0)
+    >>> double = a + a.mirror('y')
+    >>> double.area
+    9.5
+    """
+    def __init__(self, moments):
+        m = np.array(moments, dtype='float')
+
+        if m.shape[-1:] != (10,):
+            raise ValueError('Moments must be of shape (..., 10).')
+
+        m.setflags(write=False)
+        self._m = m
+
+    def __repr__(self):
+        if self._m.ndim == 1:
+            return '{}(area={!r}, x={!r}, y={!r})'.format(type(self).__name__,
+                float(self.area), float(self.x), float(self.y))
+        return '{}(shape={!r})'.format(type(self).__name__, self.shape)
+
+    @classmethod
+    def from_points(cls, points, offsets=None):
+        """
+        Initializes section moments from boundary points.
+
+        Parameters
+        ----------
+        points : array
+            An array of boundary points of shape (N, 2), or of shape (N, 3)
+            if the boundary contains arc edges. If offsets are specified,
+            a vertex buffer containing many boundaries, as returned by
+            :func:`.pack_points`, or a stack of boundaries of shape (M, N, 2).
+        offsets : array
+            An array of shape (M + 1,) of boundary offsets into the vertex
+            buffer. If None and the points are of two dimensions, the points
+            are assumed to be a single boundary.
+        """
+        p = np.asarray(points, dtype='float')
+
+        if offsets is None and p.ndim == 2:
+            return cls(batch_moments(p, [0, len(p)])[0])
+
+        return cls(batch_moments(p, offsets))
+
+    @classmethod
+    def _from_sums(cls, shape, sums, bounds):
+        """
+        Initializes section moments from raw moment sums about the origin, as
+        calculated in closed form for parametric shapes.
+
+        Parameters
+        ----------
+        shape : tuple
+            The broadcast shape of the shape parameters.
+        sums : array
+            An array of raw moment sums about the origin of shape (M, 6).
+        bounds : array
+            An array of (xmin, ymin, xmax, ymax) bounds of shape (M, 4).
+        """
+        m = _raw_to_moments(sums, np.zeros((len(sums), 2)), bounds)
+        return cls(m.reshape(tuple(shape) + (10,)))
+
+    @property
+    def array(self):
+        """The read-only array of moments of shape (..., 10)."""
+        return self._m
+
+    @property
+    def shape(self):
+        """The shape of the array of sections."""
+        return self._m.shape[:-1]
+
+    @property
+    def area(self):
+        """The cross sectional area."""
+        return self._m[...,0]
+
+    @property
+    def x(self):
+        """The x coordinate of the centroid."""
+        return self._m[...,1]
+
+    @property
+    def y(self):
+        """The y coordinate of the centroid."""
+        return self._m[...,2]
+
+    @property
+    def centroid(self):
+        """The (x, y) coordinates of the centroid."""
+        return self._m[...,1:3]
+
+    @property
+    def inertia_x(self):
+        """The moment of inertia about the centroidal x-axis."""
+        return self._m[...,3]
+
+    @property
+    def inertia_y(self):
+        """The moment of inertia about the centroidal y-axis."""
+        return self._m[...,4]
+
+    @property
+    def inertia_xy(self):
+        """The product of inertia about the centroid."""
+        return self._m[...,5]
+
+    @property
+    def bounds(self):
+        """
+        The (xmin, ymin, xmax, ymax) bounds of the section, which are NaN
+        where unknown.
+        """
+        return self._m[...,6:10]
+
+    def _known_bounds(self):
+        """
+        Returns the bounds of the section, raising a ValueError if the bounds
+        of any section are unknown.
+        """
+        b = self._m[...,6:10]
+
+        if np.isnan(b).any():
+            raise ValueError('The bounds of the section are unknown, such as '
+                'after a rotation other than by a multiple of pi / 2.')
+
+        return b
+
+    def _combine(self, other, sign):
+        """
+        Returns the moments of the section combined with the input section,
+        where a sign of 1 adds the other section and -1 removes it. The bounds
+        are united if the section is added and are otherwise unchanged.
+
+        Parameters
+        ----------
+        other : :class:`SectionMoments`
+            The section to add or remove.
+        sign : float
+            The sign of the other section.
+        """
+        m1, m2 = np.broadcast_arrays(self._m, other._m)
+        a1, a2 = m1[...,0], sign * m2[...,0]
+        a = a1 + a2
+        c = a1[...,np.newaxis]*m1[...,1:3] + a2[...,np.newaxis]*m2[...,1:3]
+        c = c / a[...,np.newaxis]
+
+        # Transfer both parts to the combined centroid
+        d1, d2 = m1[...,1:3] - c, m2[...,1:3] - c
+        ix = m1[...,3] + a1*d1[...,1]**2 + sign*m2[...,3] + a2*d2[...,1]**2
+        iy = m1[...,4] + a1*d1[...,0]**2 + sign*m2[...,4] + a2*d2[...,0]**2
+        ixy = (m1[...,5] + a1*d1[...,0]*d1[...,1]
+               + sign*m2[...,5] + a2*d2[...,0]*d2[...,1])
+
+        if sign > 0:
+            mn = np.minimum(m1[...,6:8], m2[...,6:8])
+            mx = np.maximum(m1[...,8:10], m2[...,8:10])
+            bounds = np.concatenate([mn, mx], axis=-1)
+        else:
+            bounds = m1[...,6:10]
+
+        return self.__class__(np.concatenate([a[...,np.newaxis], c,
+            np.stack([ix, iy, ixy], axis=-1), bounds], axis=-1))
+
+    def __add__(self, other):
+        return self._combine(other, 1.0)
+
+    def __sub__(self, other):
+        return self._combine(other, -1.0)
+
+    def __mul__(self, factor):
+        w = np.asarray(factor, dtype='float')[...,np.newaxis]
+        m = np.broadcast_to(self._m, np.broadcast(self._m, w).shape).copy()
+        m[...,[0, 3, 4, 5]] *= w
+        return self.__class__(m)
+
+    __rmul__ = __mul__
+
+    def translate(self, dx, dy):
+        """
+        Returns the moments of the section translated by the input offsets.
+
+        Parameters
+        ----------
+        dx, dy : float or array
+            The offsets in the x and y directions.
+        """
+        d = np.stack(np.broadcast_arrays(dx, dy), axis=-1).astype('float')
+        shape = np.broadcast(self._m[...,:2], d).shape[:-1]
+        m = np.broadcast_to(self._m, shape + (10,)).copy()
+        m[...,1:3] += d
+        m[...,6:8] += d
+        m[...,8:10] += d
+        return self.__class__(m)
+
+    def _transform_bounds(self, f):
+        """
+        Returns the bounds enclosing the transformed corners of the bounding
+        box of the section.
+
+        Parameters
+        ----------
+        f : function
+            A function transforming arrays of x and y coordinates.
+        """
+        b = self._m[...,6:10]
+        x = np.stack([b[...,0], b[...,2], b[...,2], b[...,0]], axis=-1)
+        y = np.stack([b[...,1], b[...,1], b[...,3], b[...,3]], axis=-1)
+        x, y = f(x, y)
+        return np.stack([x.min(axis=-1), y.min(axis=-1),
+                         x.max(axis=-1), y.max(axis=-1)], axis=-1)
+
+    def rotate(self, angle, origin=(0, 0)):
+        """
+        Returns the moments of the section rotated counterclockwise about the
+        input origin. The inertia tensor is rotated exactly. The bounds are
+        rotated if the angle is a multiple of pi / 2, and are otherwise
+        unknown, since they depend on the boundary points.
+
+        Parameters
+        ----------
+        angle : float or array
+            The counterclockwise rotation angle in radians.
+        origin : array
+            The (x, y) coordinates of the center of rotation.
+        """
+        angle = np.asarray(angle, dtype='float')
+        c, s = np.cos(angle), np.sin(angle)
+        ox, oy = origin
+
+        def f(x, y):
+            c1, s1 = c[...,np.newaxis], s[...,np.newaxis]
+            x, y = x - ox, y - oy
+            return ox + c1*x - s1*y, oy + s1*x + c1*y
+
+        m = self._m
+        x, y = m[...,1] - ox, m[...,2] - oy
+        ix, iy, ixy = _rotate_inertias(m[...,3], m[...,4], m[...,5], -angle)
+
+        x, y, ix, iy, ixy, a = np.broadcast_arrays(
+            ox + c*x - s*y, oy + s*x + c*y, ix, iy, ixy, m[...,0])
+
+        # The rotated bounding box only gives the bounds for quarter turns
+        k = angle / (0.5 * np.pi)
+        unknown = ~np.isclose(k, np.round(k), rtol=0, atol=1e-12)
+        bounds = self._transform_bounds(f)
+        bounds[np.broadcast_to(unknown, bounds.shape[:-1])] = np.nan
+
+        return self.__class__(np.concatenate([np.stack([a, x, y, ix, iy, ixy],
+            axis=-1), bounds], axis=-1))
+
+    def scale(self, sx, sy=None, origin=(0, 0)):
+        """
+        Returns the moments of the section scaled about the input origin. For
+        uniform scaling by a factor `s`, the area scales by `s**2` and the
+        inertias by `s**4`. Negative factors mirror the section.
+
+        Parameters
+        ----------
+        sx : float or array
+            The scale factor in the x direction.
+        sy : float or array
+            The scale factor in the y direction. If None, the scale factor
+            in the x direction is used.
+        origin : array
+            The (x, y) coordinates of the fixed point of the scaling.
+        """
+        if sy is None:
+            sy = sx
+
+        sx = np.asarray(sx, dtype='float')
+        sy = np.asarray(sy, dtype='float')
+        ox, oy = origin
+
+        def f(x, y):
+            return (ox + sx[...,np.newaxis]*(x - ox),
+                    oy + sy[...,np.newaxis]*(y - oy))
+
+        m = self._m
+        k = np.abs(sx * sy)
+
+        a, x, y, ix, iy, ixy = np.broadcast_arrays(
+            k * m[...,0],
+            ox + sx*(m[...,1] - ox),
+            oy + sy*(m[...,2] - oy),
+            k * sy**2 * m[...,3],
+            k * sx**2 * m[...,4],
+            k * sx * sy * m[...,5])
+
+        return self.__class__(np.concatenate([np.stack([a, x, y, ix, iy, ixy],
+            axis=-1), self._transform_bounds(f)], axis=-1))
+
+    def mirror(self, axis='y', value=0):
+        """
+        Returns the moments of the section mirrored about a line parallel
+        to the input axis.
+
+        Parameters
+        ----------
+        axis : {'x', 'y'}
+            The axis parallel to the mirror line.
+        value : float
+            The coordinate of the mirror line, that is, the y coordinate
+            if `axis` is 'x' and the x coordinate if `axis` is 'y'.
+        """
+        if axis == 'x':
+            return self.scale(1, -1, (0, value))
+        if axis == 'y':
+            return self.scale(-1, 1, (value, 0))
+        raise ValueError('Axis must be one of {{\'x\', \'y\'}}: {!r}.'.format(axis))
+
+    def inertias(self, origin=None):
+        """
+        Returns the moment of inertias of the section as an array of
+        (inertia_x, inertia_y, inertia_j, inertia_xy) of shape (..., 4).
+
+        Parameters
+        ----------
+        origin : array
+            The (x, y) origin about which the moment of inertias will be
+            calculated. If None, the centroid of the section is used.
+        """
+        m = self._m
+        ix, iy, ixy = m[...,3], m[...,4], m[...,5]
+
+        if origin is not None:
+            # Transfer to the origin using the parallel axis theorem
+            a = m[...,0]
+            dx, dy = m[...,1] - origin[0], m[...,2] - origin[1]
+            ix, iy, ixy = ix + a*dy**2, iy + a*dx**2, ixy + a*dx*dy
+
+        return np.stack([ix, iy, ix + iy, ixy], axis=-1)
+
+    def principal_inertias(self):
+        """
+        Returns the principal moment of inertias as an array of shape (..., 2).
+        """
+        return np.stack(_principal_inertias(self._m), axis=-1)
+
+    def principal_angles(self):
+        """
+        Returns the angles from the x-axis to the principal axes as an array
+        of shape (..., 2).
+        """
+        alpha = _principal_angles(self._m)
+        return np.stack([alpha, alpha + 0.5*np.pi], axis=-1)
+
+    def gyradii(self):
+        """
+        Returns the radii of gyration about the centroidal x and y axes as
+        an array of shape (..., 2).
+        """
+        return np.sqrt(self._m[...,3:5] / self._m[...,0:1])
+
+    def extreme_fibers(self):
+        """
+        Returns the extreme fibers from the centroidal x and y axes, based
+        on the bounds, as an array of shape (..., 2). Raises a ValueError if
+        the bounds are unknown.
+        """
+        m = self._m
+        b = self._known_bounds()
+        c = np.maximum(m[...,1:3] - b[...,:2], b[...,2:] - m[...,1:3])
+        return c[...,::-1]
+
+    def elast_sect_mod(self):
+        """
+        Returns the elastic section modulii about the centroidal x and y axes
+        as an array of shape (..., 2). Raises a ValueError if the bounds are
+        unknown.
+        """
+        return self._m[...,3:5] / self.extreme_fibers()
+
+    def summary(self):
+        """
+        Returns a dictionary of the properties which may be derived from the
+        moments. See :func:`.section_summary` for the keys. The principal
+        section modulus and the plastic section modulii require the boundary
+        points and so are not included. Raises a ValueError if the bounds are
+        unknown.
+        """
+        m = self._m
+        a = m[...,0]
+        ix, iy, ixy = m[...,3], m[...,4], m[...,5]
+        iz = np.minimum(*_principal_inertias(m))
+        cy, cx = np.moveaxis(self.extreme_fibers(), -1, 0)
+
+        return dict(
+            area=a, x=m[...,1], y=m[...,2],
+            width=m[...,8] - m[...,6], height=m[...,9] - m[...,7],
+            inertia_x=ix, inertia_y=iy, inertia_j=ix+iy, inertia_xy=ixy,
+            inertia_z=iz,
+            gyradius_x=np.sqrt(ix / a),
+            gyradius_y=np.sqrt(iy / a),
+            gyradius_z=np.sqrt(iz / a),
+            elast_sect_mod_x=ix / cy,
+            elast_sect_mod_y=iy / cx
+        )
@@ -0,0 +1,134 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .angle import angle_points, angle_moments
+from .boundary import moments, rotate2
+from .cruciform import cruciform_moments, cruciform_summary
+from .double_angle import double_angle_moments, double_angle_summary
+from .i_beam import i_beam_moments, i_beam_summary
+from .multi import multi_section_moments
+from .polygon import polygon_moments, polygon_summary
+from .round import round_moments, round_summary
+from .t_beam import t_beam_moments, t_beam_summary
+from .section_moments import *
+
+
+def rect(x, y, w, h):
+    return np.array([(x, y), (x+w, y), (x+w, y+h), (x, y+h)], dtype='float')
+
+
+def test_from_points():
+    p = angle_points(8, 6, 1)
+    m = SectionMoments.from_points(p)
+
+    assert approx(m.array) == moments(p)
+    assert approx(angle_moments(8, 6, 1).array) == moments(p)
+
+    with pytest.raises(ValueError):
+        m.array[0] = 1
+
+
+def test_add_subtract():
+    a, b, c = rect(0, 0, 4, 1), rect(1.5, 1, 1, 6), rect(2, 0.25, 1, 0.5)
+    ma, mb, mc = (SectionMoments.from_points(x) for x in (a, b, c))
+
+    sol = multi_section_moments([a, b], [c])
+    m = ma + mb - mc
+
+    assert approx(m.array) == sol.array
+    assert approx((m + mc - mb).array[:6]) == ma.array[:6]
+
+
+def test_weights():
+    m = angle_moments(8, 6, 1)
+    w = 0.5 * m
+
+    assert approx(w.area) == 0.5 * m.area
+    assert approx(w.inertias()) == 0.5 * m.inertias()
+    assert approx(w.centroid) == m.centroid
+
+
+def test_translate():
+    p = angle_points(8, 6, 1)
+    m = angle_moments(8, 6, 1).translate(3, -2)
+    assert approx(m.array) == moments(p + (3, -2))
+
+
+def test_rotate():
+    p = angle_points(8, 6, 1)
+    m = angle_moments(8, 6, 1)
+
+    for ang in np.linspace(-np.pi, np.pi, 9):
+        q = rotate2(p, ang, (1, 2))
+        r = m.rotate(ang, (1, 2))
+        assert approx(r.array[:6]) == moments(q)[:6]
+
+        # Bounds are only known for quarter turns
+        if np.isclose(ang % (0.5*np.pi), 0):
+            assert approx(r.bounds, abs=1e-12) == moments(q)[6:10]
+        else:
+            assert np.isnan(r.bounds).all()
+
+    r = m.rotate(0.5*np.pi)
+    assert approx(r.array) == moments(rotate2(p, 0.5*np.pi))
+
+    # Properties derived from unknown bounds raise rather than being wrong
+    r = m.rotate(0.25*np.pi)
+
+    with pytest.raises(ValueError):
+        r.elast_sect_mod()
+
+    with pytest.raises(ValueError):
+        r.summary()
+
+    with pytest.raises(ValueError):
+        (r + m).extreme_fibers()
+
+    assert np.isnan(r.rotate(-0.25*np.pi).bounds).all()
+
+
+def test_mirror_scale():
+    p = angle_points(8, 6, 1)
+    m = angle_moments(8, 6, 1)
+
+    assert approx(m.mirror('y', 1).array) == moments(p * (-1, 1) + (2, 0))
+    assert approx(m.mirror('x').array) == moments(p * (1, -1))
+    assert approx(m.scale(2).array) == moments(2 * p)
+    assert approx(m.scale(2, 0.5, (1, 1)).array) == moments((p - 1) * (2, 0.5) + 1)
+
+    s = m.scale(3)
+    assert approx(s.area) == 9 * m.area
+    assert approx(s.inertias()) == 81 * m.inertias()
+
+
+def test_broadcast():
+    t = np.array([0.5, 0.75, 1])
+    m = angle_moments(8, 6, t).translate(0, [[0], [2]])
+
+    assert m.shape == (2, 3)
+
+    for i, x in enumerate(t):
+        assert approx(m.array[1,i]) == moments(angle_points(8, 6, x) + (0, 2))
+
+
+def test_shape_moments():
+    keys = ['area', 'x', 'y', 'inertia_x', 'inertia_y', 'inertia_xy',
+            'inertia_z', 'gyradius_x', 'gyradius_y', 'elast_sect_mod_x',
+            'elast_sect_mod_y']
+
+    cases = [
+        (double_angle_moments, double_angle_summary, (8, 6, 1, 0.75, 0.5)),
+        (cruciform_moments, cruciform_summary, (8, 6, 1, 0.75, 0.5)),
+        (i_beam_moments, i_beam_summary, (12, 8, 1, 0.5)),
+        (t_beam_moments, t_beam_summary, (12, 8, 1, 0.5)),
+        (polygon_moments, polygon_summary, (6, 4, 0.5)),
+        (round_moments, round_summary, (10, 1)),
+    ]
+
+    for func, summary, args in cases:
+        m = func(*args).summary()
+        sol = summary(*args)
+
+        for k in keys:
+            assert approx(m[k], abs=1e-9) == sol[k]
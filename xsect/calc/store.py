@@ -0,0 +1,258 @@
+from __future__ import division
+import os
+import json
+import numpy as np
+from .boundary import pack_points, batch_section_summary
+
+__all__ = ['VertexStore']
+
+
+class VertexStore():
+    """
+    A class representing an on-disk library of boundaries, stored as a raw
+    file of concatenated vertices and a raw file of boundary offsets, which
+    are opened as memory maps such that libraries larger than the available
+    memory may be processed. Each boundary is identified by a section id,
+    stored one per line as JSON in a third file. Boundaries are appended to
+    the end of the files, so the library may grow without being rewritten.
+
+    Parameters
+    ----------
+    path : str
+        The path to the store directory. If the directory does not contain
+        a store, a new empty store is created.
+    columns : int
+        The number of vertex columns of a new store. Use 3 if the boundaries
+        contain arc edges. For an existing store, the number of columns is
+        read from the store.
+
+    Examples
+    --------
+    >>> store = VertexStore('library')
+    >>> store.append([angle_points(8, 8, 1), angle_points(6, 4, 0.5)],
+    ...              ['L8x8x1', 'L6x4x1/2'])
+    >>> df = store.summaries()
+    >>> df.loc['L8x8x1', 'area']
+    15.0
+    """
+    VERTICES = 'vertices.bin'
+    OFFSETS = 'offsets.bin'
+    IDS = 'ids.jsonl'
+    META = 'meta.json'
+
+    def __init__(self, path, columns=2):
+        self.path = path
+        meta = os.path.join(path, self.META)
+
+        if not os.path.exists(meta):
+            if not os.path.exists(path):
+                os.makedirs(path)
+
+            with open(meta, 'w') as fh:
+                json.dump(dict(columns=columns), fh)
+
+            np.zeros(1, dtype='int64').tofile(self._file(self.OFFSETS))
+            open(self._file(self.VERTICES), 'wb').close()
+            open(self._file(self.IDS), 'w').close()
+
+        with open(meta) as fh:
+            self.columns = json.load(fh)['columns']
+
+        self._ids = None
+        self._index = None
+
+    def __repr__(self):
+        return '{}(path={!r}, boundaries={})'.format(type(self).__name__,
+            self.path, len(self))
+
+    def __len__(self):
+        return os.path.getsize(self._file(self.OFFSETS)) // 8 - 1
+
+    def _file(self, name):
+        """
+        Returns the path to a file in the store directory.
+
+        Parameters
+        ----------
+        name : str
+            The name of the file.
+        """
+        return os.path.join(self.path, name)
+
+    def offsets(self):
+        """
+        Returns a read only memory map of the boundary offsets of shape
+        (M + 1,).
+        """
+        return np.memmap(self._file(self.OFFSETS), dtype='int64', mode='r')
+
+    def vertices(self):
+        """
+        Returns a read only memory map of the vertex buffer of shape (K, C).
+        """
+        k = os.path.getsize(self._file(self.VERTICES)) // (8 * self.columns)
+
+        if k == 0:
+            return np.zeros((0, self.columns))
+
+        return np.memmap(self._file(self.VERTICES), dtype='float', mode='r',
+                         shape=(k, self.columns))
+
+    def ids(self):
+        """
+        Returns the list of section ids of the boundaries.
+        """
+        n = len(self)
+
+        if self._ids is None or len(self._ids) != n:
+            # Ids beyond the offsets belong to an interrupted append
+            with open(self._file(self.IDS)) as fh:
+                ids = [json.loads(x) for x in fh]
+            self._ids, self._index = ids[:n], None
+            self._clean = len(ids) == n
+
+        return self._ids
+
+    def index(self, id):
+        """
+        Returns the index of the boundary with the input section id.
+
+        Parameters
+        ----------
+        id : str or int
+            The section id.
+        """
+        ids = self.ids()
+
+        if self._index is None:
+            self._index = {x: i for i, x in enumerate(ids)}
+
+        return self._index[id]
+
+    def boundary(self, id):
+        """
+        Returns the boundary points for the input section id as a view of
+        the vertex memory map.
+
+        Parameters
+        ----------
+        id : str or int
+            The section id.
+        """
+        i = self.index(id)
+        o = self.offsets()
+        return self.vertices()[o[i]:o[i+1]]
+
+    def append(self, points, ids=None):
+        """
+        Appends boundaries to the end of the store.
+
+        Parameters
+        ----------
+        points : list
+            A list of arrays of (x, y) boundary coordinates of shape (N, 2),
+            or of shape (N, 3) if the boundaries contain arc edges and the
+            store has 3 columns.
+        ids : list
+            A list of unique section ids for the boundaries. If None, the
+            indices of the boundaries in the store are used.
+        """
+        n = len(self.ids())
+
+        if ids is None:
+            ids = list(range(n, n + len(points)))
+        elif len(ids) != len(points):
+            raise ValueError('The number of ids must match the number of '
+                'boundaries.')
+
+        ids = list(ids)
+        seen = set(self.ids())
+
+        for x in ids:
+            if x in seen:
+                raise ValueError('Section id {!r} is not unique.'.format(x))
+            seen.add(x)
+
+        p, offsets = pack_points(points)
+
+        if p.shape[1] > self.columns:
+            raise ValueError('Boundaries have {} columns but the store has {}.'
+                .format(p.shape[1], self.columns))
+
+        if p.shape[1] < self.columns:
+            pad = np.zeros((p.shape[0], self.columns - p.shape[1]))
+            p = np.column_stack([p, pad])
+
+        k = self.offsets()[-1]
+        offsets = offsets[1:] + k
+
+        # The offsets are written last, such that an interrupted append leaves
+        # the store consistent with the existing boundaries. Any vertices or
+        # ids written by an interrupted append are truncated.
+        with open(self._file(self.VERTICES), 'r+b') as fh:
+            fh.truncate(8 * self.columns * k)
+            fh.seek(0, 2)
+            np.ascontiguousarray(p, dtype='float').tofile(fh)
+
+        if self._clean:
+            with open(self._file(self.IDS), 'a') as fh:
+                fh.writelines(json.dumps(x) + '\n' for x in ids)
+        else:
+            with open(self._file(self.IDS), 'w') as fh:
+                fh.writelines(json.dumps(x) + '\n' for x in self._ids + ids)
+
+        with open(self._file(self.OFFSETS), 'ab') as fh:
+            offsets.astype('int64').tofile(fh)
+
+    def chunks(self, chunk_size=1000000):
+        """
+        Iterates sequentially over the store in chunks of whole boundaries,
+        yielding the start and stop boundary indices, the vertex buffer,
+        and the boundary offsets of each chunk. The vertex buffer is a view
+        of the memory map, so only the pages of the current chunk are read.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The target number of vertices in each chunk. Boundaries with more
+            vertices are yielded in their own chunks.
+        """
+        offsets = np.array(self.offsets())
+        vertices = self.vertices()
+        m = len(offsets) - 1
+        i = 0
+
+        while i < m:
+            j = np.searchsorted(offsets, offsets[i] + chunk_size, 'right') - 1
+            j = min(max(j, i + 1), m)
+            o = offsets[i:j+1]
+            yield i, j, vertices[o[0]:o[-1]], o - o[0]
+            i = j
+
+    def summaries(self, chunk_size=1000000, precision=None, plastic=False):
+        """
+        Returns a data frame of the section properties, as returned by
+        :func:`.section_summary`, for all boundaries in the store, indexed
+        by section id. The store is processed sequentially in chunks by
+        :func:`.batch_section_summary`.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The target number of vertices in each chunk.
+        precision : {'double', 'single', 'compensated'}
+            The precision mode. If None, the default mode is used. See
+            :func:`.set_precision`.
+        plastic : bool
+            If True, the plastic section modulii are included.
+        """
+        import pandas as pd
+        df = [pd.DataFrame(batch_section_summary(p, o, precision, plastic))
+              for _, _, p, o in self.chunks(chunk_size)]
+
+        if not df:
+            return pd.DataFrame()
+
+        df = pd.concat(df, ignore_index=True)
+        df.index = pd.Index(self.ids(), name='id')
+        return df
@@ -0,0 +1,86 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .angle import angle_points
+from .boundary import section_summary
+from .round import round_points, round_arc_points
+from .store import *
+
+
+def test_store(tmpdir):
+    path = str(tmpdir.join('library'))
+    store = VertexStore(path)
+
+    assert len(store) == 0
+    assert store.summaries().empty
+
+    points = [angle_points(8, 6, t) for t in (0.5, 0.75, 1)]
+    store.append(points, ['a', 'b', 'c'])
+    store.append([round_points(10, 1)])
+
+    store = VertexStore(path)
+    assert len(store) == 4
+    assert store.ids() == ['a', 'b', 'c', 3]
+    assert (store.boundary('b') == points[1]).all()
+
+    chunks = list(store.chunks(20))
+    assert [x[:2] for x in chunks] == [(0, 2), (2, 3), (3, 4)]
+
+    df = store.summaries(chunk_size=20)
+
+    for k, p in zip(['a', 'b', 'c', 3], points + [round_points(10, 1)]):
+        sol = section_summary(p)
+        assert approx(df.loc[k, 'area']) == sol['area']
+        assert approx(df.loc[k, 'inertia_x']) == sol['inertia_x']
+
+    with pytest.raises(ValueError):
+        store.append([round_arc_points(10, 1)])
+
+
+def test_store_arcs(tmpdir):
+    store = VertexStore(str(tmpdir), columns=3)
+    store.append([round_arc_points(10, 1), angle_points(8, 6, 1)])
+    df = store.summaries()
+
+    assert approx(df['area'].values) == [np.pi/4 * (100 - 64), 13]
+
+
+def test_store_interrupted(tmpdir):
+    store = VertexStore(str(tmpdir))
+    store.append([angle_points(8, 6, 1)], ['a'])
+
+    # Simulate an append interrupted before the offsets were written
+    with open(store._file(store.VERTICES), 'ab') as fh:
+        np.ones((5, 2)).tofile(fh)
+
+    with open(store._file(store.IDS), 'a') as fh:
+        fh.write('"b"\n')
+
+    store = VertexStore(str(tmpdir))
+    assert store.ids() == ['a']
+
+    store.append([round_points(10, 1)], ['c'])
+    assert store.ids() == ['a', 'c']
+    assert (store.boundary('c') == round_points(10, 1)).all()
+
+
+def test_store_unique_ids(tmpdir):
+    store = VertexStore(str(tmpdir))
+    store.append([angle_points(8, 6, 1)], ['a'])
+
+    with pytest.raises(ValueError):
+        store.append([round_points(10, 1)], ['a'])
+
+    with pytest.raises(ValueError):
+        store.append([round_points(10, 1), round_points(12, 1)], ['b', 'b'])
+
+    # The default ids may not collide with existing ids
+    store.append([round_points(10, 1)], [2])
+
+    with pytest.raises(ValueError):
+        store.append([round_points(10, 1), round_points(12, 1)])
+
+    store = VertexStore(str(tmpdir))
+    assert store.ids() == ['a', 2]
+    assert len(store.vertices()) == store.offsets()[-1]
@@ -0,0 +1,300 @@
+from __future__ import division
+import numpy as np
+from .boundary import _edge_moments, _raw_to_moments, _summary
+from .boundary import _hull_principal_fibers, _extreme_fibers
+from .hull import convex_hull
+
+__all__ = [
+    'MomentStream',
+    'stream_moments',
+    'stream_section_summary',
+]
+
+STREAM_CANDIDATES = 32 # Number of trial neutral axes per plastic pass
+STREAM_RTOL = 1e-6 # Relative tolerance of the plastic neutral axis bracket
+
+
+class MomentStream():
+    """
+    A class for accumulating the moments and convex hull of a boundary whose
+    points are supplied in consecutive chunks, such that boundaries too large
+    to be held in memory may be processed. The last point of each chunk is
+    carried over to form the edge to the first point of the next chunk, and
+    the edge from the last point of the boundary back to its first is added
+    when the moments are requested. Memory is bounded by the chunk size and
+    the number of convex hull vertices.
+
+    Only straight edged boundaries are supported. Boundaries containing arc
+    edges should be tessellated, such as by :func:`.tessellate`, before
+    streaming.
+
+    Examples
+    --------
+    >>> stream = MomentStream()
+    >>> for chunk in np.array_split(round_points(10), 8):
+    ...     stream.update(chunk)
+    >>> stream.moments()[0]
+    78.5...
+    """
+    def __init__(self):
+        self.count = 0
+        self._origin = None
+        self._first = None
+        self._last = None
+        self._sums = np.zeros(6)
+        self._bounds = np.array([np.inf, np.inf, -np.inf, -np.inf])
+        self._hull = np.zeros((0, 2))
+
+    def __repr__(self):
+        return '{}(count={})'.format(type(self).__name__, self.count)
+
+    def update(self, chunk):
+        """
+        Adds the next chunk of boundary points to the stream.
+
+        Parameters
+        ----------
+        chunk : array
+            An array of (x, y) coordinates of shape (N, 2).
+        """
+        p = np.asarray(chunk, dtype='float')
+
+        if p.ndim != 2 or p.shape[1] != 2:
+            raise ValueError('Chunks must be of shape (N, 2).')
+
+        if len(p) == 0:
+            return
+
+        # Moments are summed about the first point of the boundary to limit
+        # cancellation, as in the batch calculations
+        if self._origin is None:
+            self._origin = p[0].copy()
+            self._first = p[0] - self._origin
+            self._last = self._first
+
+        q = p - self._origin
+        x = np.concatenate([[self._last[0]], q[:,0]])
+        y = np.concatenate([[self._last[1]], q[:,1]])
+
+        t = _edge_moments(x[:-1], y[:-1], x[1:], y[1:])
+        self._sums += np.sum(t, axis=0)
+        self._last = q[-1]
+
+        self._bounds[:2] = np.minimum(self._bounds[:2], p.min(axis=0))
+        self._bounds[2:] = np.maximum(self._bounds[2:], p.max(axis=0))
+        self._hull = convex_hull(np.concatenate([self._hull, p]))
+        self.count += len(p)
+
+    def _closed_sums(self):
+        """
+        Returns the raw moment sums including the closing edge.
+        """
+        if self._origin is None:
+            raise ValueError('No points have been added to the stream.')
+
+        x, y = self._last[:1], self._last[1:]
+        x1, y1 = self._first[:1], self._first[1:]
+        return self._sums + _edge_moments(x, y, x1, y1)[0]
+
+    def moments(self):
+        """
+        Returns the moments of the boundary, as described by :func:`.moments`.
+        The result is an array of shape (10,).
+        """
+        s = self._closed_sums()
+        return _raw_to_moments(s[np.newaxis], self._origin[np.newaxis],
+                               self._bounds[np.newaxis])[0]
+
+    def hull(self):
+        """
+        Returns the convex hull vertices of the boundary of shape (H, 2).
+        """
+        return self._hull
+
+    def extreme_fibers(self):
+        """
+        Returns the extreme fibers from the centroidal x and y axes. The
+        result is an array of shape (2,).
+        """
+        return np.array(_extreme_fibers(self.moments()))
+
+    def principal_extreme_fibers(self):
+        """
+        Returns the extreme fibers from the centroidal principal axes. The
+        result is an array of shape (2,).
+        """
+        m = self.moments()[np.newaxis]
+        v, u = _hull_principal_fibers(self._hull[np.newaxis], m)
+        return np.array([v[0], u[0]])
+
+
+def stream_moments(chunks):
+    """
+    Returns the moments, as described by :func:`.moments`, of a boundary
+    supplied as an iterable of consecutive chunks of points. The result is
+    an array of shape (10,).
+
+    Parameters
+    ----------
+    chunks : iterable
+        An iterable of arrays of (x, y) coordinates of shape (N, 2), which
+        concatenated form the boundary.
+    """
+    stream = MomentStream()
+
+    for p in chunks:
+        stream.update(p)
+
+    return stream.moments()
+
+
+def _stream_plastic_sums(chunks, origin, trials):
+    """
+    Returns the areas and first moments of a boundary above trial offsets
+    from the centroidal x and y axes, accumulated over a pass of the chunks.
+    The edges above each trial axis are integrated by Green's theorem, for
+    which the segments closing the clipped boundary along the axis do not
+    contribute, so that each edge may be clipped independently. The result
+    is a tuple of arrays of shape (2, T).
+
+    Parameters
+    ----------
+    chunks : iterable
+        An iterable of chunks of the boundary points.
+    origin : array
+        The (x, y) centroid of the boundary.
+    trials : array
+        An array of trial offsets of shape (2, T) for the x and y axes.
+    """
+    area = np.zeros(trials.shape)
+    first = np.zeros(trials.shape)
+    first_point = last = None
+
+    def add(q):
+        for k, (v, u, sign) in enumerate([(1, 0, 1), (0, 1, -1)]):
+            # For the x-axis, A = int(x dy), for the y-axis, A = -int(y dx)
+            v0, v1 = q[:-1,v], q[1:,v]
+            u0, u1 = q[:-1,u], q[1:,u]
+            dv = v1 - v0
+            slope = np.divide(u1 - u0, dv, out=np.zeros_like(dv),
+                              where=(dv != 0))
+
+            for i, t in enumerate(trials[k]):
+                va, vb = np.maximum(v0, t), np.maximum(v1, t)
+                ua = u0 + slope * (va - v0)
+                ub = u0 + slope * (vb - v0)
+                d = vb - va
+                area[k,i] += sign * np.sum(0.5 * (ua + ub) * d)
+                first[k,i] += sign * np.sum(d * (2*ua*va + ua*vb + ub*va
+                                                 + 2*ub*vb)) / 6
+
+    for p in chunks:
+        q = np.asarray(p, dtype='float') - origin
+
+        if len(q) == 0:
+            continue
+
+        if last is None:
+            first_point = q[:1]
+        else:
+            q = np.concatenate([last, q])
+
+        add(q)
+        last = q[-1:]
+
+    add(np.concatenate([last, first_point]))
+
+    return area, first
+
+
+def stream_section_summary(chunks, rtol=STREAM_RTOL, plastic=None):
+    """
+    Returns a dictionary with a summary of cross sectional properties, as
+    returned by :func:`.section_summary`, for a boundary supplied in
+    consecutive chunks of points. The first pass over the chunks accumulates
+    the moments and convex hull of the boundary, from which all properties
+    other than the plastic section modulii are calculated.
+
+    The plastic section modulii require further passes. The plastic neutral
+    axes are bracketed by passes each evaluating the area above a number of
+    trial axes, until the bracket is within the relative tolerance of the
+    section dimensions, after which a final pass integrates the plastic
+    section modulii. Since the plastic section modulii are stationary at the
+    neutral axes, their error is of the order of the square of the tolerance.
+    With the default tolerance, the chunks are typically read 7 times.
+
+    Parameters
+    ----------
+    chunks : function or iterable
+        A function with no arguments returning a new iterable of arrays of
+        (x, y) coordinates of shape (N, 2), which concatenated form the
+        boundary. The function is called once per pass. Alternately, an
+        iterable, such as a generator, which is read in a single pass and
+        for which the plastic section modulii may not be calculated.
+    rtol : float
+        The relative tolerance of the plastic neutral axes.
+    plastic : bool
+        If True, the plastic section modulii are included, which requires
+        `chunks` to be a function. If None, they are included if `chunks`
+        is a function.
+
+    Examples
+    --------
+    >>> p = round_points(10, 1)
+    >>> summary = stream_section_summary(lambda: np.array_split(p, 8))
+    >>> summary = stream_section_summary(iter(np.array_split(p, 8)))
+    """
+    if plastic is None:
+        plastic = callable(chunks)
+
+    if not callable(chunks):
+        if plastic:
+            raise ValueError('The plastic section modulii require multiple '
+                'passes, for which chunks must be a function.')
+        passes = iter(chunks)
+    else:
+        passes = chunks()
+
+    stream = MomentStream()
+
+    for p in passes:
+        stream.update(p)
+
+    m = stream.moments()
+    c = stream.principal_extreme_fibers()
+
+    if not plastic:
+        return {k: x[0] for k, x in _summary(
+            m[np.newaxis], (c[:1], c[1:])).items()}
+
+    origin = m[1:3]
+    sign = np.sign(stream._closed_sums()[0])
+
+    # Bracket the neutral axes relative to the centroid for each axis
+    lo = m[7:5:-1] - origin[::-1]
+    hi = m[9:7:-1] - origin[::-1]
+    size = hi - lo
+    half = 0.5 * m[0]
+    n = STREAM_CANDIDATES
+
+    while np.any(hi - lo > rtol * size):
+        f = np.linspace(0, 1, n)
+        trials = lo[:,np.newaxis] + (hi - lo)[:,np.newaxis] * f
+        a = sign * _stream_plastic_sums(chunks(), origin, trials)[0]
+
+        # The area above the trial axes decreases with the offset
+        i = np.array([np.searchsorted(-x, -half) for x in a])
+        i = np.clip(i, 1, n - 1)
+        k = np.arange(2)
+        lo, hi = trials[k,i-1], trials[k,i]
+
+    t = 0.5 * (lo + hi)
+    a, q = _stream_plastic_sums(chunks(), origin, t[:,np.newaxis])
+    a, q = sign * a[:,0], sign * q[:,0]
+
+    # First moments above and below the neutral axes about the axes, noting
+    # that the total first moment about the centroid is zero
+    z = (q - t * a) - (-q - t * (m[0] - a))
+
+    return {k: x[0] for k, x in _summary(
+        m[np.newaxis], (c[:1], c[1:]), z[np.newaxis]).items()}
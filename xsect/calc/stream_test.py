@@ -0,0 +1,58 @@
+from __future__ import division
+import pytest
+import numpy as np
+from pytest import approx
+from .angle import angle_points
+from .boundary import moments, extreme_fibers, section_summary
+from .boundary import _segment_principal_fibers
+from .round import round_points
+from .stream import *
+
+
+def test_moment_stream():
+    p = angle_points(8, 6, 1) + (100, 50)
+    stream = MomentStream()
+
+    with pytest.raises(ValueError):
+        stream.moments()
+
+    for x in np.array_split(p, 4):
+        stream.update(x)
+
+    assert stream.count == len(p)
+    assert approx(stream.moments()) == moments(p)
+    assert approx(stream_moments(np.array_split(p, 3))) == moments(p)
+
+    m = moments(p)
+    sol = _segment_principal_fibers(p, np.array([0, len(p)]), m[np.newaxis])
+    assert approx(stream.principal_extreme_fibers()) == np.ravel(sol)
+    assert approx(stream.extreme_fibers()) == extreme_fibers(p)
+
+
+def test_stream_section_summary():
+    for p in (round_points(10, 1), angle_points(8, 6, 1)[::-1]):
+        sol = section_summary(p, plastic=True)
+        odict = stream_section_summary(lambda: np.array_split(p, 7))
+
+        for k, x in sol.items():
+            assert approx(odict[k]) == x
+
+
+def test_stream_section_summary_single_pass():
+    p = angle_points(8, 6, 1)
+    sol = section_summary(p)
+    chunks = (x for x in np.array_split(p, 7))
+    odict = stream_section_summary(chunks)
+
+    assert set(odict) == set(sol)
+
+    for k, x in sol.items():
+        assert approx(odict[k]) == x
+
+    with pytest.raises(ValueError):
+        stream_section_summary(iter(np.array_split(p, 7)), plastic=True)
+
+    # A function may also be read in a single pass
+    odict = stream_section_summary(lambda: np.array_split(p, 7),
+                                   plastic=False)
+    assert 'plast_sect_mod_x' not in odict
@@ -0,0 +1,451 @@
+from __future__ import division
+import os
+import sys
+import time
+import numpy as np
+from collections import OrderedDict
+from .angle import angle_summary
+from .cruciform import cruciform_summary
+from .double_angle import double_angle_summary
+from .i_beam import i_beam_summary
+from .polygon import polygon_summary
+from .t_beam import t_beam_summary
+
+__all__ = [
+    'iter_sweep',
+    'sweep',
+    'run_sweep',
+    'NpySink',
+    'CsvSink',
+    'SweepAccessor',
+    'register_accessor'
+]
+
+CHUNK_SIZE = 100000 # Default maximum number of sections evaluated at once
+
+# Summary functions which accept parameter arrays
+BATCHED_SUMMARIES = (
+    angle_summary,
+    cruciform_summary,
+    double_angle_summary,
+    i_beam_summary,
+    polygon_summary,
+    t_beam_summary,
+)
+
+
+def _sweep_params(params, grid, kwargs):
+    """
+    Separates the input sweep parameters into the varying parameters and
+    the constant parameters. Returns the shape of the sweep, a dictionary
+    of varying parameter arrays, and a dictionary of constant parameters.
+
+    Parameters
+    ----------
+    params : dict or :class:`pandas.DataFrame`
+        The sweep parameters.
+    grid : bool
+        If True, the sweep is the Cartesian product of the varying
+        parameters. Otherwise, the varying parameters are broadcast against
+        one another.
+    kwargs : dict
+        Additional constant parameters.
+    """
+    pd = sys.modules.get('pandas')
+
+    if pd is not None and isinstance(params, pd.DataFrame):
+        if grid:
+            raise ValueError('Grid sweeps are not supported for DataFrames.')
+        params = {k: params[k].values for k in params.columns}
+
+    const = dict(kwargs)
+    vary = OrderedDict()
+
+    for k, x in params.items():
+        if x is None or np.ndim(x) == 0:
+            const[k] = x
+        else:
+            vary[k] = np.asarray(x)
+
+    if grid:
+        for k, x in vary.items():
+            if x.ndim != 1:
+                raise ValueError('Grid parameter {!r} must be one '
+                                 'dimensional.'.format(k))
+        shape = tuple(len(x) for x in vary.values())
+    else:
+        shape = np.broadcast(*vary.values()).shape if vary else ()
+
+    return shape, vary, const
+
+
+def iter_sweep(func, params, grid=False, chunk_size=CHUNK_SIZE, **kwargs):
+    """
+    Evaluates a section summary function over a sweep of parameters in
+    chunks, yielding a dictionary of column arrays for each chunk. Each
+    dictionary contains the varying parameters followed by the summary
+    properties. Where a summary property shares the name of a parameter,
+    such as the height of an I-beam, the summary property is returned.
+    Only one chunk of parameters and results is held in memory at a time.
+
+    Parameters
+    ----------
+    func : function
+        A section summary function, such as :func:`.i_beam_summary`.
+        Functions which accept parameter arrays are evaluated once per chunk.
+        Other functions are evaluated once per section.
+    params : dict or :class:`pandas.DataFrame`
+        The parameters passed to the summary function. Scalar values and None
+        are passed to every evaluation, and array values are varied.
+    grid : bool
+        If True, every combination of the varying parameters, which must be
+        one dimensional, is evaluated. Otherwise, the varying parameters are
+        broadcast against one another.
+    chunk_size : int
+        The maximum number of sections evaluated at once.
+    kwargs
+        Additional constant parameters passed to the summary function.
+    """
+    shape, vary, const = _sweep_params(params, grid, kwargs)
+    size = int(np.prod(shape))
+    keys = list(vary)
+
+    if not grid:
+        vary = OrderedDict((k, np.broadcast_to(x, shape))
+                           for k, x in vary.items())
+
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        # A sweep with no varying parameters is a single section
+        idx = np.unravel_index(np.arange(start, stop), shape) if shape else ()
+
+        # Ordered dictionaries keep the column order on Python 2.7
+        if grid:
+            chunk = OrderedDict((k, vary[k][i]) for k, i in zip(keys, idx))
+        else:
+            chunk = OrderedDict((k, vary[k][idx]) for k in keys)
+
+        if func in BATCHED_SUMMARIES:
+            summary = func(**dict(const, **chunk))
+            summary = OrderedDict((k, np.broadcast_to(x, (stop - start,)))
+                                  for k, x in summary.items())
+        else:
+            rows = [func(**dict(const, **{k: x[i] for k, x in chunk.items()}))
+                    for i in range(stop - start)]
+            summary = OrderedDict((k, np.array([x[k] for x in rows]))
+                                  for k in rows[0])
+
+        chunk.update(summary)
+        yield chunk
+
+
+def sweep(func, params, grid=False, chunk_size=CHUNK_SIZE, as_frame=True,
+          **kwargs):
+    """
+    Evaluates a section summary function over a sweep of parameters and
+    returns a table of the parameters and summary properties. See
+    :func:`iter_sweep` for the parameters.
+
+    Parameters
+    ----------
+    as_frame : bool
+        If True, a :class:`pandas.DataFrame` is returned. Otherwise, a
+        structured array is returned.
+
+    Examples
+    --------
+    >>> df = sweep(i_beam_summary, dict(height=[10, 12, 14], width=[6, 8],
+    ...            flange_thickness=0.5, web_thickness=0.3), grid=True)
+    >>> df[['height', 'width', 'area']]
+       height  width  area
+    0    10.0    6.0   8.7
+    1    10.0    8.0  10.7
+    2    12.0    6.0   9.3
+    3    12.0    8.0  11.3
+    4    14.0    6.0   9.9
+    5    14.0    8.0  11.9
+    """
+    chunks = list(iter_sweep(func, params, grid, chunk_size, **kwargs))
+
+    if as_frame:
+        register_accessor()
+
+    if not chunks:
+        columns = {}
+    else:
+        columns = OrderedDict((k, np.concatenate([x[k] for x in chunks]))
+                              for k in chunks[0])
+
+    if as_frame:
+        import pandas as pd
+        return pd.DataFrame(columns, columns=list(columns))
+
+    dtype = [(str(k), x.dtype) for k, x in columns.items()]
+    n = len(next(iter(columns.values()))) if columns else 0
+    result = np.empty(n, dtype=dtype)
+
+    for k, x in columns.items():
+        result[str(k)] = x
+
+    return result
+
+
+class NpySink():
+    """
+    A sweep result sink writing each column to a memory-mapped ``.npy``
+    file in a directory, such that results larger than the available memory
+    may be stored. The files are created with the full size of the sweep
+    when the first chunk is written, and each chunk is written to its rows
+    and flushed. The results may be loaded by :meth:`load`.
+
+    Parameters
+    ----------
+    path : str
+        The path to the output directory, which is created if it does not
+        exist.
+
+    Examples
+    --------
+    >>> params = dict(height=np.linspace(10, 40, 1000), width=[6, 8, 10],
+    ...               flange_thickness=0.5, web_thickness=0.3)
+    >>> stats = run_sweep(i_beam_summary, params, NpySink('results'),
+    ...                   grid=True)
+    >>> NpySink('results').load()['area'].shape
+    (3000,)
+    """
+    def __init__(self, path):
+        self.path = path
+        self._arrays = None
+
+    def __repr__(self):
+        return '{}(path={!r})'.format(type(self).__name__, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self, size):
+        """
+        Prepares the sink for a sweep of the input number of sections.
+
+        Parameters
+        ----------
+        size : int
+            The number of sections in the sweep.
+        """
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        self.size = size
+        self._arrays = {}
+
+    def write(self, start, chunk):
+        """
+        Writes a chunk of results to the rows starting at the input index.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first row of the chunk.
+        chunk : dict
+            A dictionary of column arrays, as yielded by :func:`iter_sweep`.
+        """
+        for k, x in chunk.items():
+            if k not in self._arrays:
+                self._arrays[k] = np.lib.format.open_memmap(
+                    self._file(k), mode='w+', dtype=x.dtype,
+                    shape=(self.size,))
+
+            a = self._arrays[k]
+            a[start:start+len(x)] = x
+            a.flush()
+
+    def close(self):
+        """
+        Closes the memory maps of the sink.
+        """
+        self._arrays = None
+
+    def _file(self, key):
+        """
+        Returns the path to the file for the input column.
+
+        Parameters
+        ----------
+        key : str
+            The column name.
+        """
+        return os.path.join(self.path, '{}.npy'.format(key))
+
+    def load(self, mmap_mode='r'):
+        """
+        Returns a dictionary of the column arrays in the sink directory.
+
+        Parameters
+        ----------
+        mmap_mode : str
+            The memory map mode. See :func:`numpy.load`.
+        """
+        files = sorted(x for x in os.listdir(self.path) if x.endswith('.npy'))
+        return {x[:-4]: np.load(self._file(x[:-4]), mmap_mode=mmap_mode)
+                for x in files}
+
+
+class CsvSink():
+    """
+    A sweep result sink appending each chunk of results to a CSV file.
+
+    Parameters
+    ----------
+    path : str
+        The path to the output file, which is overwritten.
+    kwargs
+        Additional keyword arguments passed to
+        :meth:`pandas.DataFrame.to_csv`.
+    """
+    def __init__(self, path, **kwargs):
+        self.path = path
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return '{}(path={!r})'.format(type(self).__name__, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self, size):
+        """
+        Prepares the sink for a sweep of the input number of sections.
+
+        Parameters
+        ----------
+        size : int
+            The number of sections in the sweep.
+        """
+        self._header = True
+
+    def write(self, start, chunk):
+        """
+        Appends a chunk of results to the file.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first row of the chunk.
+        chunk : dict
+            A dictionary of column arrays, as yielded by :func:`iter_sweep`.
+        """
+        import pandas as pd
+        df = pd.DataFrame(chunk, columns=list(chunk))
+        df.to_csv(self.path, mode='w' if self._header else 'a',
+                  header=self._header, index=False, **self.kwargs)
+        self._header = False
+
+    def close(self):
+        """
+        Closes the sink.
+        """
+        pass
+
+
+def run_sweep(func, params, sink, grid=False, chunk_size=CHUNK_SIZE,
+              progress=None, **kwargs):
+    """
+    Evaluates a section summary function over a sweep of parameters, as
+    by :func:`iter_sweep`, and writes each chunk of results to a sink as it
+    is calculated, such that memory use is independent of the size of the
+    sweep. Returns a dictionary with the number of sections evaluated, the
+    elapsed time in seconds, and the throughput in sections per second.
+
+    Parameters
+    ----------
+    func : function
+        A section summary function. See :func:`iter_sweep`.
+    params : dict or :class:`pandas.DataFrame`
+        The sweep parameters. See :func:`iter_sweep`.
+    sink : object
+        The result sink, such as :class:`NpySink` or :class:`CsvSink`.
+        Any object with `open(size)`, `write(start, chunk)` and `close()`
+        methods may be used.
+    grid : bool
+        If True, every combination of the varying parameters is evaluated.
+    chunk_size : int
+        The maximum number of sections evaluated at once.
+    progress : function
+        A function called after each chunk with the number of completed
+        sections, the total number of sections, and the throughput in
+        sections per second.
+    kwargs
+        Additional constant parameters passed to the summary function.
+    """
+    shape = _sweep_params(params, grid, kwargs)[0]
+    size = int(np.prod(shape))
+    t0 = time.time()
+    done = 0
+
+    sink.open(size)
+
+    try:
+        for chunk in iter_sweep(func, params, grid, chunk_size, **kwargs):
+            sink.write(done, chunk)
+            done += len(next(iter(chunk.values())))
+
+            if progress is not None:
+                progress(done, size, done / max(time.time() - t0, 1e-9))
+    finally:
+        sink.close()
+
+    dt = time.time() - t0
+    return dict(count=done, seconds=dt, rate=done / max(dt, 1e-9))
+
+
+class SweepAccessor():
+    """
+    A :class:`pandas.DataFrame` accessor, available as ``df.xsect`` once
+    registered by :func:`register_accessor`, for evaluating section summary
+    functions over the rows of a DataFrame. Each column is passed to the
+    summary function as the parameter of the same name.
+
+    Examples
+    --------
+    >>> register_accessor()
+    >>> df = pd.DataFrame(dict(leg1=[4, 6, 8], leg2=[4, 4, 6]))
+    >>> df.xsect.sweep(angle_summary, thickness1=0.5)['area']
+    0    3.75
+    1    4.75
+    2    6.75
+    Name: area, dtype: float64
+    """
+    def __init__(self, obj):
+        self._obj = obj
+
+    def sweep(self, func, chunk_size=CHUNK_SIZE, as_frame=True, **kwargs):
+        """
+        Evaluates a section summary function over the rows of the DataFrame.
+        See :func:`sweep` for the parameters.
+        """
+        return sweep(func, self._obj, chunk_size=chunk_size,
+                     as_frame=as_frame, **kwargs)
+
+
+def register_accessor():
+    """
+    Registers the :class:`SweepAccessor` with pandas as ``df.xsect``, if it
+    is not already registered. Since pandas is not imported with this
+    package and provides no entry point for accessors, this function must
+    be called before the accessor is used. It is also called when this
+    package is imported after pandas and on the first call to :func:`sweep`.
+    """
+    import pandas as pd
+
+    if getattr(pd.DataFrame, 'xsect', None) is not SweepAccessor:
+        pd.api.extensions.register_dataframe_accessor('xsect')(SweepAccessor)
+
+
+if 'pandas' in sys.modules:
+    register_accessor()
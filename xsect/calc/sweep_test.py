@@ -0,0 +1,88 @@
+from __future__ import division
+import pytest
+import numpy as np
+import pandas as pd
+from .angle import angle_summary
+from .i_beam import i_beam_summary
+from .round import round_summary
+from .sweep import *
+
+
+def test_iter_sweep():
+    params = dict(height=np.arange(10, 15), width=8,
+                  flange_thickness=0.5, web_thickness=0.3)
+    chunks = list(iter_sweep(i_beam_summary, params, chunk_size=2))
+    assert [len(x['area']) for x in chunks] == [2, 2, 1]
+
+
+def test_sweep():
+    # Grid
+    params = dict(height=[10, 12, 14], width=[6, 8],
+                  flange_thickness=0.5, web_thickness=[0.3, 0.4])
+    df = sweep(i_beam_summary, params, grid=True, chunk_size=5)
+    assert len(df) == 12
+
+    for _, row in df.iterrows():
+        a = i_beam_summary(row['height'], row['width'], 0.5, row['web_thickness'])
+        assert pytest.approx(row['inertia_x']) == a['inertia_x']
+
+    # Broadcast
+    params = dict(height=[[10], [12]], width=[6, 8, 10],
+                  flange_thickness=0.5, web_thickness=0.3)
+    df = sweep(i_beam_summary, params)
+    assert len(df) == 6
+    assert pytest.approx(df['width'].values) == [6, 8, 10, 6, 8, 10]
+
+    # Per section evaluation
+    x = sweep(round_summary, dict(diameter=[1, 2, 3], thickness=0.1),
+              as_frame=False)
+    assert x.dtype.names[0] == 'diameter'
+    assert pytest.approx(x['area'][1]) == round_summary(2, 0.1)['area']
+
+
+def test_sweep_scalar():
+    params = dict(leg1=6, leg2=4, thickness1=0.5)
+    df = sweep(angle_summary, params)
+    assert len(df) == 1
+    assert pytest.approx(df['area'][0]) == angle_summary(6, 4, 0.5)['area']
+
+    x = sweep(round_summary, dict(diameter=2), grid=True, as_frame=False)
+    assert len(x) == 1
+    assert pytest.approx(x['area'][0]) == round_summary(2)['area']
+
+
+def test_sweep_accessor():
+    register_accessor()
+    register_accessor()
+    assert pd.DataFrame.xsect is SweepAccessor
+
+    df = pd.DataFrame(dict(leg1=[4, 6, 8], leg2=[4, 4, 6]))
+    a = df.xsect.sweep(angle_summary, thickness1=0.5)
+    b = angle_summary(df['leg1'].values, df['leg2'].values, 0.5)
+    assert pytest.approx(a['elast_sect_mod_z'].values) == b['elast_sect_mod_z']
+
+
+def test_run_sweep(tmpdir):
+    params = dict(height=np.linspace(10, 40, 25), width=[6, 8, 10],
+                  flange_thickness=0.5, web_thickness=0.3)
+    sol = sweep(i_beam_summary, params, grid=True)
+    calls = []
+
+    path = str(tmpdir.join('npy'))
+    stats = run_sweep(i_beam_summary, params, NpySink(path), grid=True,
+                      chunk_size=10, progress=lambda *x: calls.append(x))
+
+    assert stats['count'] == 75
+    assert stats['rate'] > 0
+    assert [x[0] for x in calls] == [10, 20, 30, 40, 50, 60, 70, 75]
+
+    result = NpySink(path).load()
+    assert set(result) == set(sol.columns)
+    assert pytest.approx(result['inertia_x']) == sol['inertia_x'].values
+
+    path = str(tmpdir.join('sweep.csv'))
+    run_sweep(i_beam_summary, params, CsvSink(path), grid=True, chunk_size=10)
+    df = pd.read_csv(path)
+
+    assert list(df.columns) == list(sol.columns)
+    assert pytest.approx(df['area'].values) == sol['area'].values
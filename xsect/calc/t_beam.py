@@ -1,8 +1,11 @@
 from __future__ import division
 import numpy as np
-from .boundary import section_summary
+from .boundary import _broadcast_params, _rectangle_sums, _stack_points
+from .boundary import _shape_summary
+from .plastic import _rectangle_plastic
+from .section_moments import SectionMoments
 
-__all__ = ['t_beam_points', 't_beam_summary']
+__all__ = ['t_beam_points', 't_beam_moments', 't_beam_summary']
 
 
 def t_beam_points(height, width, flange_thickness, web_thickness):
@@ -30,20 +33,66 @@ def t_beam_points(height, width, flange_thickness, web_thickness):
     return np.array(p, dtype='float')
 
 
+def _t_beam_rects(h, b, tf, tw):
+    """
+    Returns a list of the (xmin, ymin, xmax, ymax) bounds of the rectangles
+    composing the web and flange of T-beams. See :func:`t_beam_points` for the
+    parameters.
+    """
+    z = np.zeros_like(h)
+    x1 = 0.5*(b - tw)
+    x2 = x1 + tw
+    y1 = h - tf
+
+    return [(x1, z, x2, y1), (z, y1, b, h)]
+
+
+def t_beam_moments(height, width, flange_thickness, web_thickness):
+    """
+    Returns the :class:`.SectionMoments` of T-beams. The moments are
+    calculated in closed form, and the dimensions may be arrays, in which
+    case they are broadcast against one another. See :func:`t_beam_points`
+    for the parameters.
+    """
+    shape, (h, b, tf, tw) = _broadcast_params(
+        height, width, flange_thickness, web_thickness)
+
+    z = np.zeros_like(h)
+    s = sum(_rectangle_sums(*x) for x in _t_beam_rects(h, b, tf, tw))
+    bounds = np.column_stack([z, z, b, h])
+
+    return SectionMoments._from_sums(shape, s, bounds)
+
+
 def t_beam_summary(height, width, flange_thickness, web_thickness):
     """
     Returns a dictionary with a summary of T-beam section properties.
 
+    The properties are calculated in closed form, and the dimensions may be
+    arrays, in which case they are broadcast against one another and each
+    property is returned as an array of the broadcast shape.
+
     Parameters
     ----------
-    height : float
+    height : float or array
         The height of the section.
-    width : float
+    width : float or array
         The width of the section.
-    flange_thickness : float
+    flange_thickness : float or array
         The thickness of the horizontal flange.
-    web_thickness : float
+    web_thickness : float or array
         The thickness of the vertical web.
     """
-    p = t_beam_points(height, width, flange_thickness, web_thickness)
-    return section_summary(p)
+    shape, (h, b, tf, tw) = _broadcast_params(
+        height, width, flange_thickness, web_thickness)
+
+    r = _t_beam_rects(h, b, tf, tw)
+    z = np.zeros_like(h)
+    s = sum(_rectangle_sums(*x) for x in r)
+
+    bounds = np.column_stack([z, z, b, h])
+    plastic = _rectangle_plastic(r)
+    (x1, _, x2, y1), _ = r
+    hull = _stack_points([(x1, z), (x2, z), (b, y1), (b, h), (z, h), (z, y1)])
+
+    return _shape_summary(shape, s, bounds, plastic, hull)
@@ -1,5 +1,7 @@
 from __future__ import division
 import pytest
+import numpy as np
+from .boundary import section_summary
 from ..data import query_aisc
 from .t_beam import *
 
@@ -18,3 +20,14 @@ def test_t_beam_summary():
 
     for k, x in a.items():
         assert pytest.approx(x, 0.01) == b[k]
+
+
+def test_t_beam_summary_array():
+    h = np.array([10, 22])
+    a = t_beam_summary(h, 15.9, 1.77, 1.03)
+
+    for i, x in enumerate(h):
+        b = section_summary(t_beam_points(x, 15.9, 1.77, 1.03))
+
+        for k, v in b.items():
+            assert pytest.approx(a[k][i], rel=1e-9, abs=1e-9) == v
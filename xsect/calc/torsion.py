@@ -0,0 +1,494 @@
+from __future__ import division
+import numpy as np
+from collections import OrderedDict
+from .arc import tessellate
+from .boundary import _check_offsets
+from .multi import _pack_multi
+
+__all__ = [
+    'TorsionSolver',
+    'torsion_constant',
+    'multi_torsion_constant',
+    'batch_torsion_constant'
+]
+
+MESH_DIVISIONS = 10 # Default number of mesh divisions per mean wall thickness
+CACHE_SIZE = 256 # Maximum number of cached torsion solvers
+INSIDE_BLOCK_SIZE = 65536 # Maximum point-edge pairs tested at once
+
+_SOLVERS = OrderedDict()
+
+
+def _rings(p, offsets, h):
+    """
+    Returns a list of the boundaries in the input vertex buffer with any arc
+    edges tessellated and the closing points removed.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (R + 1,).
+    h : float
+        The mesh size. If None, arc edges are tessellated in steps of 0.01.
+    """
+    step = 0.01 if h is None else 0.25 * h
+    rings = []
+
+    for i, j in zip(offsets[:-1], offsets[1:]):
+        q = tessellate(p[i:j], step=step)
+
+        if len(q) > 1 and (q[0] == q[-1]).all():
+            q = q[:-1]
+
+        rings.append(q)
+
+    return rings
+
+
+def _mesh_size(rings, weights):
+    """
+    Returns the default mesh size for the input boundaries, which is the
+    mean wall thickness, taken as twice the area divided by the perimeter,
+    divided by :data:`MESH_DIVISIONS`.
+
+    Parameters
+    ----------
+    rings : list
+        A list of open boundaries of shape (N, 2).
+    weights : array
+        The weights of the boundaries, 1 for added and -1 for subtracted.
+    """
+    a = 0
+    perimeter = 0
+
+    for q, w in zip(rings, weights):
+        x, y = q[:,0], q[:,1]
+        x1, y1 = np.roll(x, -1), np.roll(y, -1)
+        a += 0.5 * w * abs(np.sum(x*y1 - x1*y))
+        perimeter += np.sum(np.hypot(x1 - x, y1 - y))
+
+    return 2 * abs(a) / perimeter / MESH_DIVISIONS
+
+
+def _crossings(ring, points):
+    """
+    Returns a boolean array indicating which of the input points lie inside
+    the boundary by the even-odd rule, where a ray cast from the point in
+    the positive x direction crosses the boundary edges an odd number of
+    times. The points are tested in blocks of at most
+    :data:`INSIDE_BLOCK_SIZE` point-edge pairs.
+
+    Parameters
+    ----------
+    ring : array
+        An open boundary of shape (N, 2).
+    points : array
+        An array of (x, y) points of shape (M, 2).
+    """
+    x, y = ring[:,0], ring[:,1]
+    x1, y1 = np.roll(x, -1), np.roll(y, -1)
+    result = np.zeros(len(points), dtype='bool')
+    step = max(1, INSIDE_BLOCK_SIZE // max(1, len(ring)))
+
+    # Horizontal edges never straddle the ray, so their undefined slopes
+    # are masked below
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (x1 - x) / (y1 - y)
+
+    for i in range(0, len(points), step):
+        px = points[i:i+step,0:1]
+        py = points[i:i+step,1:2]
+        mask = (y > py) != (y1 > py)
+
+        with np.errstate(invalid='ignore'):
+            xi = (py - y) * slope
+            xi += x
+
+        mask &= px < xi
+        result[i:i+step] = np.count_nonzero(mask, axis=1) % 2 == 1
+
+    return result
+
+
+def _inside(rings, weights, points):
+    """
+    Returns a boolean array indicating which of the input points lie inside
+    the section, where the weighted count of the boundaries containing
+    each point is positive.
+
+    Parameters
+    ----------
+    rings : list
+        A list of open boundaries of shape (N, 2).
+    weights : array
+        The weights of the boundaries, 1 for added and -1 for subtracted.
+    points : array
+        An array of (x, y) points of shape (M, 2).
+    """
+    points = np.asarray(points, dtype='float')
+    count = np.zeros(len(points))
+
+    for q, w in zip(rings, weights):
+        count += w * _crossings(q, points)
+
+    return count > 0.5
+
+
+def _torsion_mesh(rings, weights, h):
+    """
+    Generates a triangular mesh of the section enclosed by the input
+    boundaries. The boundaries are resampled at the mesh size, and the
+    interior is filled with a staggered grid of points, after which the
+    points are triangulated and the triangles outside of the section are
+    discarded. Returns a tuple of the node coordinates of shape (N, 2) and
+    the triangle node indices of shape (T, 3).
+
+    Parameters
+    ----------
+    rings : list
+        A list of open boundaries of shape (N, 2).
+    weights : array
+        The weights of the boundaries, 1 for added and -1 for subtracted.
+    h : float
+        The mesh size.
+    """
+    from scipy.spatial import Delaunay, cKDTree
+
+    # Resample the boundary edges
+    b = []
+
+    for q in rings:
+        d = np.roll(q, -1, axis=0) - q
+        n = np.ceil(np.hypot(d[:,0], d[:,1]) / h).astype('int')
+        n = np.maximum(n, 1)
+        t = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+        t = t / np.repeat(n, n)
+        b.append(np.repeat(q, n, axis=0) + t[:,np.newaxis] * np.repeat(d, n, axis=0))
+
+    b = np.concatenate(b)
+
+    # Staggered grid of interior points, forming near equilateral triangles
+    lo, hi = b.min(axis=0), b.max(axis=0)
+    dy = 0.5 * np.sqrt(3) * h
+    x = np.arange(lo[0], hi[0] + h, h)
+    y = np.arange(lo[1], hi[1] + dy, dy)
+    x, y = np.meshgrid(x, y)
+    x[1::2] += 0.5 * h
+    g = np.column_stack([x.ravel(), y.ravel()])
+
+    g = g[_inside(rings, weights, g)]
+    g = g[cKDTree(b).query(g)[0] > 0.5 * h]
+
+    nodes = np.concatenate([b, g])
+    tri = Delaunay(nodes).simplices
+
+    # Discard triangles outside of the section or of zero area
+    p = nodes[tri]
+    c = p.mean(axis=1)
+    d1, d2 = p[:,1] - p[:,0], p[:,2] - p[:,0]
+    a = d1[:,0]*d2[:,1] - d1[:,1]*d2[:,0]
+    tri = tri[_inside(rings, weights, c) & (np.abs(a) > 1e-12 * h**2)]
+
+    # Remove unused nodes and orient the triangles counterclockwise
+    used, tri = np.unique(tri, return_inverse=True)
+    nodes, tri = nodes[used], tri.reshape(-1, 3)
+    p = nodes[tri]
+    d1, d2 = p[:,1] - p[:,0], p[:,2] - p[:,0]
+    cw = d1[:,0]*d2[:,1] - d1[:,1]*d2[:,0] < 0
+    tri[cw] = tri[cw][:,::-1]
+
+    return nodes, tri
+
+
+class TorsionSolver():
+    """
+    A finite element solver for the St. Venant torsion of a section. The
+    section is meshed with linear triangles, on which the warping function
+    is solved subject to the traction free boundary conditions. The torsion
+    constant is then the polar moment of inertia less the warping
+    contribution. Sections containing holes or multiple disconnected shapes
+    are supported.
+
+    The sparse stiffness matrix is assembled and factorized on the first
+    solve and cached thereafter. The torsion constant converges from above
+    as the mesh size is reduced.
+
+    Parameters
+    ----------
+    points : array
+        An array of boundary points of shape (N, 2), or of shape (N, 3) if
+        the boundary contains arc edges.
+    offsets : array
+        An array of offsets of shape (M + 1,) if the points are a vertex
+        buffer containing multiple boundaries. If None, the points are
+        assumed to be a single boundary.
+    weights : array
+        An array of boundary weights of shape (M,), where 1 adds and -1
+        subtracts the boundary from the section. If None, all boundaries
+        are added.
+    mesh_size : float
+        The target edge length of the mesh triangles. If None, the mean
+        wall thickness of the section divided by :data:`MESH_DIVISIONS`
+        is used.
+
+    Examples
+    --------
+    >>> solver = TorsionSolver(round_points(4))
+    >>> solver.torsion_constant()
+    25.1...
+    """
+    def __init__(self, points, offsets=None, weights=None, mesh_size=None):
+        p = np.asarray(points, dtype='float')
+
+        if offsets is None:
+            offsets = [0, len(p)]
+
+        p, offsets = _check_offsets(p, offsets)
+
+        if weights is None:
+            weights = np.ones(len(offsets) - 1)
+
+        weights = np.asarray(weights, dtype='float')
+        rings = _rings(p, offsets, mesh_size)
+
+        if mesh_size is None:
+            mesh_size = _mesh_size(rings, weights)
+            rings = _rings(p, offsets, mesh_size)
+
+        self.mesh_size = mesh_size
+        self.nodes, self.triangles = _torsion_mesh(rings, weights, mesh_size)
+        self._system = None
+        self._factor = None
+        self._warping = None
+
+    def __repr__(self):
+        return '{}(nodes={}, triangles={})'.format(
+            type(self).__name__, len(self.nodes), len(self.triangles))
+
+    @classmethod
+    def from_multi(cls, add, subtract=[], mesh_size=None):
+        """
+        Initializes a solver for a composite section.
+
+        Parameters
+        ----------
+        add : list
+            A list of (x, y) boundary coordinates for shapes included in the
+            cross section. Each set of boundary coordinates should be of the
+            shape (N, 2).
+        subtract : list
+            A list of (x, y) boundary coordinates for cut out shapes to be
+            subtracted from the cross section. Each set of boundary coordinates
+            should be of the shape (N, 2).
+        mesh_size : float
+            The target edge length of the mesh triangles.
+        """
+        p, offsets, weights = _pack_multi(add, subtract)
+        return cls(p, offsets, weights, mesh_size)
+
+    def system(self):
+        """
+        Returns the sparse stiffness matrix, the load vector, and the polar
+        moment of inertia of the mesh about its centroid. The system is
+        assembled on the first call and cached thereafter.
+        """
+        if self._system is None:
+            from scipy.sparse import coo_matrix
+            tri = self.triangles
+            p = self.nodes[tri]
+
+            # Signed double areas and centroids of the triangles
+            d1, d2 = p[:,1] - p[:,0], p[:,2] - p[:,0]
+            a2 = d1[:,0]*d2[:,1] - d1[:,1]*d2[:,0]
+            c = p.mean(axis=1)
+            o = np.sum(a2[:,np.newaxis] * c, axis=0) / np.sum(a2)
+            p = p - o
+            c = c - o
+
+            # Shape function gradients, multiplied by the double areas
+            b = np.roll(p[...,1], -1, axis=1) - np.roll(p[...,1], 1, axis=1)
+            g = np.roll(p[...,0], 1, axis=1) - np.roll(p[...,0], -1, axis=1)
+
+            k = (b[:,:,np.newaxis] * b[:,np.newaxis] +
+                 g[:,:,np.newaxis] * g[:,np.newaxis]) / (2 * a2[:,np.newaxis,np.newaxis])
+            f = 0.5 * (b * c[:,1:2] - g * c[:,0:1])
+
+            n = len(self.nodes)
+            i = np.repeat(tri, 3, axis=1).ravel()
+            j = np.tile(tri, (1, 3)).ravel()
+            k = coo_matrix((k.ravel(), (i, j)), shape=(n, n)).tocsc()
+            f = np.bincount(tri.ravel(), f.ravel(), minlength=n)
+
+            x, y = p[...,0], p[...,1]
+            s = (np.sum(x**2, axis=1) + np.sum(x * np.roll(x, 1, axis=1), axis=1)
+                 + np.sum(y**2, axis=1) + np.sum(y * np.roll(y, 1, axis=1), axis=1))
+            ip = np.sum(a2 * s) / 12
+
+            self._system = (k, f, ip)
+
+        return self._system
+
+    def _free_nodes(self):
+        """
+        Returns a boolean array of the nodes whose warping is solved. The
+        warping is fixed at one node of each connected part of the mesh
+        to remove the rigid body displacements.
+        """
+        from scipy.sparse.csgraph import connected_components
+        k = self.system()[0]
+        _, label = connected_components(k, directed=False)
+        free = np.ones(len(self.nodes), dtype='bool')
+        free[np.unique(label, return_index=True)[1]] = False
+        return free
+
+    def factorize(self):
+        """
+        Returns the sparse LU factorization of the stiffness matrix reduced
+        to the free nodes. The factorization is calculated on the first call
+        and cached thereafter.
+        """
+        if self._factor is None:
+            from scipy.sparse.linalg import splu
+            k = self.system()[0]
+            free = self._free_nodes()
+            self._factor = (free, splu(k[free][:,free].tocsc()))
+
+        return self._factor
+
+    def warping(self):
+        """
+        Returns the warping function at the mesh nodes, relative to the
+        centroid of the mesh. The result is an array of shape (N,).
+        """
+        if self._warping is None:
+            f = self.system()[1]
+            free, lu = self.factorize()
+            w = np.zeros(len(self.nodes))
+            w[free] = lu.solve(f[free])
+            self._warping = w
+
+        return self._warping
+
+    def torsion_constant(self):
+        """
+        Returns the St. Venant torsion constant of the section.
+        """
+        _, f, ip = self.system()
+        return ip - np.dot(f, self.warping())
+
+
+def _cached_solver(p, offsets, weights, mesh_size):
+    """
+    Returns the torsion solver for the input geometry from the solver cache.
+    If the geometry is not cached, a new solver is created and added to the
+    cache, and the least recently used solver is evicted if the cache
+    exceeds :data:`CACHE_SIZE`.
+
+    Parameters
+    ----------
+    p : array
+        A vertex buffer of shape (K, 2) or (K, 3).
+    offsets : array
+        An array of boundary offsets into the vertex buffer of shape (M + 1,).
+    weights : array
+        The boundary weights.
+    mesh_size : float
+        The target edge length of the mesh triangles.
+    """
+    p = np.ascontiguousarray(p, dtype='float')
+    offsets = np.asarray(offsets, dtype='int')
+    weights = np.asarray(weights, dtype='float')
+    key = (p.shape, p.tobytes(), offsets.tobytes(), weights.tobytes(), mesh_size)
+
+    if key in _SOLVERS:
+        _SOLVERS[key] = _SOLVERS.pop(key)
+    else:
+        _SOLVERS[key] = TorsionSolver(p, offsets, weights, mesh_size)
+
+        while len(_SOLVERS) > CACHE_SIZE:
+            _SOLVERS.popitem(last=False)
+
+    return _SOLVERS[key]
+
+
+def torsion_constant(points, mesh_size=None):
+    """
+    Returns the St. Venant torsion constant of the shape defined by the
+    input boundary points. See :class:`TorsionSolver`.
+
+    Parameters
+    ----------
+    points : array
+        An array of (x, y) coordinates of shape (N, 2).
+    mesh_size : float
+        The target edge length of the mesh triangles. If None, a default
+        based on the mean wall thickness is used.
+
+    Examples
+    --------
+    >>> torsion_constant(angle_points(8, 8, 1))
+    4.9...
+    """
+    p = np.asarray(points, dtype='float')
+    solver = _cached_solver(p, [0, len(p)], [1.0], mesh_size)
+    return solver.torsion_constant()
+
+
+def multi_torsion_constant(add, subtract=[], mesh_size=None):
+    """
+    Returns the St. Venant torsion constant for a cross section including
+    multiple shapes. See :class:`TorsionSolver`.
+
+    Parameters
+    ----------
+    add : list
+        A list of (x, y) boundary coordinates for shapes included in the
+        cross section. Each set of boundary coordinates should be of the
+        shape (N, 2).
+    subtract : list
+        A list of (x, y) boundary coordinates for cut out shapes to be
+        subtracted from the cross section. Each set of boundary coordinates
+        should be of the shape (N, 2).
+    mesh_size : float
+        The target edge length of the mesh triangles. If None, a default
+        based on the mean wall thickness is used.
+    """
+    p, offsets, weights = _pack_multi(add, subtract)
+    solver = _cached_solver(p, offsets, weights, mesh_size)
+
+    return solver.torsion_constant()
+
+
+def batch_torsion_constant(points, offsets=None, mesh_size=None):
+    """
+    Returns the St. Venant torsion constants for many independent boundaries.
+    The result is an array of shape (M,).
+
+    The boundaries are meshed and solved one at a time through the solver
+    cache, so the cost is that of calling :func:`torsion_constant` for each
+    boundary, less any repeated geometries. The function is a convenience
+    for packed vertex buffers rather than a vectorized solver.
+
+    Parameters
+    ----------
+    points : array
+        Either a stack of boundaries of shape (M, N, 2) or a vertex buffer
+        of shape (K, 2) containing the concatenated points of all boundaries,
+        such as returned by :func:`.pack_points`.
+    offsets : array
+        An array of shape (M + 1,) of boundary offsets into the vertex buffer.
+        If None, the points are assumed to be a stack of boundaries.
+    mesh_size : float
+        The target edge length of the mesh triangles. If None, a default
+        based on the mean wall thickness of each boundary is used.
+    """
+    p, offsets = _check_offsets(points, offsets)
+    j = np.zeros(len(offsets) - 1)
+
+    for k, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+        q = p[a:b]
+        j[k] = _cached_solver(q, [0, len(q)], [1.0], mesh_size).torsion_constant()
+
+    return j
@@ -0,0 +1,74 @@
+from __future__ import division
+import numpy as np
+from pytest import approx
+from .angle import angle_points
+from .boundary import pack_points
+from .round import round_arc_points
+from .torsion import *
+from .torsion import _inside
+
+
+def test_torsion_constant():
+    # Square
+    p = np.array([(0, 0), (1, 0), (1, 1), (0, 1)]) + (100, -50)
+    assert approx(torsion_constant(p, 0.01), 1e-3) == 0.140577
+
+    # Rectangle with aspect ratio of 2
+    p = np.array([(0, 0), (2, 0), (2, 1), (0, 1), (0, 0)])
+    assert approx(torsion_constant(p, 0.01), 1e-3) == 2 * 0.228682
+
+    # Round
+    p = round_arc_points(4)
+    assert approx(torsion_constant(p), 1e-3) == np.pi * 2**4 / 2
+
+
+def test_multi_torsion_constant():
+    # Pipe
+    add = [round_arc_points(4)]
+    subtract = [round_arc_points(3.5)]
+    a = multi_torsion_constant(add, subtract)
+    assert approx(a, 1e-4) == np.pi * (2**4 - 1.75**4) / 2
+
+    # Disconnected shapes sum
+    p = angle_points(8, 6, 1)
+    a = multi_torsion_constant([p, p + (20, 0)], mesh_size=0.1)
+    b = torsion_constant(p, 0.1)
+    assert approx(a, 1e-6) == 2 * b
+
+
+def test_batch_torsion_constant():
+    points = [angle_points(8, 6, 1), angle_points(4, 4, 0.5)]
+    buffer, offsets = pack_points(points)
+
+    a = batch_torsion_constant(buffer, offsets)
+    b = [torsion_constant(x) for x in points]
+    assert approx(a) == b
+
+
+def test_torsion_solver():
+    p = angle_points(8, 6, 1)
+    solver = TorsionSolver(p, mesh_size=0.1)
+    repr(solver)
+
+    a = solver.torsion_constant()
+    assert solver.warping().shape == (len(solver.nodes),)
+
+    # Refining the mesh reduces the torsion constant
+    b = TorsionSolver(p, mesh_size=0.05).torsion_constant()
+    assert b < a
+    assert approx(b, 0.01) == a
+
+
+def test_inside():
+    square = np.array([(0, 0), (4, 0), (4, 4), (0, 4)])
+    hole = np.array([(1, 1), (3, 1), (3, 3), (1, 3)])
+    points = np.array([(0.5, 0.5), (2, 2), (5, 2), (2, -1), (3.5, 2),
+                       (0.5, 2), (2, 3.5)])
+
+    a = _inside([square, hole], [1, -1], points)
+    assert list(a) == [True, False, False, False, True, True, True]
+
+    # Points level with vertices are counted once
+    diamond = np.array([(0, -2), (2, 0), (0, 2), (-2, 0)])
+    a = _inside([diamond], [1], [(0, 0), (-1, 0), (3, 0), (-3, 0)])
+    assert list(a) == [True, True, False, False]
@@ -2,9 +2,10 @@
 
 import os
 import sys
-import matplotlib
 
+# The backend is selected through the environment, such that matplotlib is
+# not imported until it is used
 if sys.version_info[0] < 3 and 'DISPLAY' not in os.environ:
-    matplotlib.use('Agg')
+    os.environ.setdefault('MPLBACKEND', 'Agg')
 
 __all__ = []
@@ -31,6 +31,8 @@ Contains methods for accessing AISC shape information from the database.
     filter_aisc
     query_aisc
     query_aisc_shapes
+    db_connection
+    ConnectionManager
 
 
 Building the Database
@@ -1,10 +1,14 @@
 import re
+import sqlite3
 import pandas as pd
-from config_db import DB_CONNECTION
+from config_db import SQLDB
 
 __all__ = []
 
 
+# The package connections are read only, so a writable connection is opened
+DB_CONNECTION = sqlite3.connect(SQLDB)
+
 OPTIONS = dict(
     if_exists='replace',
     index=False
@@ -109,6 +113,7 @@ def write_aisc_metric_15_0():
     make_unique_columns(df)
 
     df.to_sql(table, DB_CONNECTION, **OPTIONS)
+    write_keys(table)
 
 
 def write_aisc_imperial_15_0():
@@ -125,6 +130,35 @@ def write_aisc_imperial_15_0():
     make_unique_columns(df)
 
     df.to_sql(table, DB_CONNECTION, **OPTIONS)
+    write_keys(table)
+
+
+def write_keys(table):
+    """
+    Adds the normalized name and type key columns to a table and indexes
+    them, such that shapes are looked up by a single index search rather
+    than a scan of the table. The keys are the upper case names and types
+    stripped of surrounding whitespace.
+
+    Parameters
+    ----------
+    table : str
+        The name of the table.
+    """
+    for column in ['name', 'type']:
+        key = column + '_key'
+        DB_CONNECTION.execute('ALTER TABLE {} ADD COLUMN {} TEXT;'
+            .format(table, key))
+        DB_CONNECTION.execute('UPDATE {} SET {}=UPPER(TRIM({}));'
+            .format(table, key, column))
+
+    DB_CONNECTION.execute('CREATE UNIQUE INDEX ix_{0}_name_key '
+        'ON {0} (name_key);'.format(table))
+    DB_CONNECTION.execute('CREATE INDEX ix_{0}_type_key '
+        'ON {0} (type_key);'.format(table))
+    DB_CONNECTION.execute('CREATE INDEX ix_{0}_type ON {0} (type);'
+        .format(table))
+    DB_CONNECTION.commit()
 
 
 def write_database():
@@ -133,6 +167,7 @@ def write_database():
     """
     write_aisc_metric_15_0()
     write_aisc_imperial_15_0()
+    DB_CONNECTION.execute('VACUUM;')
 
 
 if __name__ == '__main__':
@@ -1,13 +1,192 @@
 import os
+import sys
 import sqlite3
+import warnings
+import threading
 
 __all__ = [
     'DATA_FOLDER',
     'SQLDB',
-    'DB_CONNECTION'
+    'DB_CONNECTION',
+    'ConnectionManager',
+    'db_connection',
 ]
 
 
 DATA_FOLDER = os.path.abspath(os.path.dirname(__file__))
 SQLDB = os.path.join(DATA_FOLDER, 'xsect.sqlite')
-DB_CONNECTION = sqlite3.connect(SQLDB)
+DB_MMAP_SIZE = 2**28 # Maximum bytes of the database memory mapped for reads
+DB_CACHE_SIZE = -16384 # Page cache size per connection, negative for KiB
+DB_CACHED_STATEMENTS = 256 # Compiled statements cached per connection
+URI_SUPPORTED = sys.version_info >= (3, 4) # If sqlite3 accepts URI filenames
+
+
+class ConnectionManager():
+    """
+    A class managing connections to an SQLite database, such that each
+    thread of each process uses its own connection. Connections are opened
+    on first use by a thread, and are reopened if the process has been
+    forked since they were opened, since SQLite connections may not be
+    shared across threads or forked processes.
+
+    By default, connections are opened read only with the `immutable` URI
+    parameter, which skips file locking and change detection. The database
+    should then not be modified while connections are open. Where URI
+    filenames are not supported, such as on Python 2.7, connections are
+    opened by path, and read only connections are only protected by the
+    `query_only` pragma.
+
+    Parameters
+    ----------
+    path : str
+        The path to the database file.
+    readonly : bool
+        If True, connections are opened read only and immutable. Otherwise,
+        connections are opened for reading and writing.
+    mmap_size : int
+        The maximum number of bytes of the database memory mapped for reads.
+    cache_size : int
+        The page cache size of each connection. If negative, the size is
+        in KiB. Otherwise, the size is in pages.
+    cached_statements : int
+        The number of compiled statements cached by each connection.
+
+    Examples
+    --------
+    >>> manager = ConnectionManager(SQLDB)
+    >>> cursor = manager.connection().execute('SELECT 1;')
+    """
+    def __init__(self, path, readonly=True, mmap_size=DB_MMAP_SIZE,
+                 cache_size=DB_CACHE_SIZE,
+                 cached_statements=DB_CACHED_STATEMENTS):
+        self.path = path
+        self.readonly = readonly
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+
+    def __repr__(self):
+        return '{}(path={!r}, readonly={!r})'.format(type(self).__name__,
+            self.path, self.readonly)
+
+    def uri(self):
+        """
+        Returns the URI used to open the database.
+        """
+        try:
+            from urllib.parse import quote
+        except ImportError:
+            from urllib import quote
+
+        path = os.path.abspath(self.path).replace(os.sep, '/')
+
+        if not path.startswith('/'):
+            path = '/' + path
+
+        uri = 'file://' + quote(path, safe='/:')
+
+        if self.readonly:
+            return uri + '?mode=ro&immutable=1'
+
+        return uri + '?mode=rwc'
+
+    def _connect(self):
+        """
+        Opens and returns a new connection with the manager settings.
+        """
+        if URI_SUPPORTED:
+            conn = sqlite3.connect(self.uri(), uri=True,
+                                   cached_statements=self.cached_statements)
+        else:
+            # Read only connections then rely on the query_only pragma
+            conn = sqlite3.connect(self.path,
+                                   cached_statements=self.cached_statements)
+
+        conn.execute('PRAGMA mmap_size={:d};'.format(self.mmap_size))
+        conn.execute('PRAGMA cache_size={:d};'.format(self.cache_size))
+
+        if self.readonly:
+            conn.execute('PRAGMA query_only=ON;')
+
+        return conn
+
+    def is_open(self):
+        """
+        Returns True if the current thread of the current process has an
+        open connection.
+        """
+        local = self._local
+        return (getattr(local, 'connection', None) is not None
+                and local.pid == os.getpid())
+
+    def connection(self):
+        """
+        Returns the connection of the current thread, opening it if it is
+        not open or was opened by a parent process before a fork.
+        """
+        local = self._local
+
+        if not self.is_open():
+            # A connection inherited over a fork belongs to the parent and
+            # is discarded without being closed
+            local.connection = self._connect()
+            local.pid = os.getpid()
+
+        return local.connection
+
+    def close(self):
+        """
+        Closes the connection of the current thread, if open. Connections of
+        other threads are closed when their threads exit.
+        """
+        if self.is_open():
+            self._local.connection.close()
+
+        self._local.connection = None
+
+
+_MANAGER = ConnectionManager(SQLDB) # Manages the package database connections
+
+
+def db_connection():
+    """
+    Returns the read only connection to the package database for the
+    current thread, opening it on the first call by the thread. See
+    :class:`.ConnectionManager`.
+    """
+    return _MANAGER.connection()
+
+
+class _LazyConnection():
+    """
+    A deprecated proxy forwarding attribute access and context management
+    to the package database connection of the current thread, which is
+    opened on first use. The proxy is not an instance of
+    :class:`sqlite3.Connection`, so functions requiring one, such as
+    :func:`pandas.read_sql`, should be passed :func:`db_connection` instead.
+    """
+    def __repr__(self):
+        return '<lazy connection to {!r}>'.format(_MANAGER.path)
+
+    def _connection(self):
+        warnings.warn('DB_CONNECTION is deprecated. Use db_connection() '
+                      'instead.', DeprecationWarning, stacklevel=3)
+        return db_connection()
+
+    def __getattr__(self, name):
+        # Special attributes are looked up by introspection, such as by
+        # pytest or copy, and are not forwarded
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self._connection(), name)
+
+    def __enter__(self):
+        return self._connection().__enter__()
+
+    def __exit__(self, *args):
+        return db_connection().__exit__(*args)
+
+
+# Deprecated, opens the connection on first use rather than on import
+DB_CONNECTION = _LazyConnection()
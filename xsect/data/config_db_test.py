@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import threading
+import pytest
+from .config_db import *
+from . import config_db
+from .config_db import _MANAGER
+
+
+def test_thread_connections():
+    conns = {}
+
+    def run(i):
+        conn = db_connection()
+        conn.execute('SELECT COUNT(*) FROM aisc_imperial_15_0;').fetchone()
+        conns[i] = conn
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ids = {id(x) for x in conns.values()} | {id(db_connection())}
+    assert len(ids) == 5
+    assert db_connection() is db_connection()
+
+
+def test_read_only():
+    conn = db_connection()
+
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute('CREATE TABLE test_table (x INTEGER);')
+
+    assert conn.execute('PRAGMA query_only;').fetchone()[0] == 1
+
+
+def test_close():
+    manager = ConnectionManager(SQLDB)
+    assert not manager.is_open()
+
+    conn = manager.connection()
+    assert manager.is_open()
+
+    manager.close()
+    assert not manager.is_open()
+    assert manager.connection() is not conn
+
+
+def test_uri(tmpdir):
+    # Characters with special meaning in URIs are escaped
+    path = str(tmpdir.join('test db#1?.sqlite'))
+    manager = ConnectionManager(path, readonly=False)
+    assert manager.uri().endswith('/test%20db%231%3F.sqlite?mode=rwc')
+
+    manager.connection().execute('CREATE TABLE test_table (x INTEGER);')
+    manager.close()
+    assert os.path.exists(path)
+
+
+def test_path_fallback(monkeypatch):
+    # Connections are opened by path where URI filenames are not supported
+    monkeypatch.setattr(config_db, 'URI_SUPPORTED', False)
+    manager = ConnectionManager(SQLDB)
+    conn = manager.connection()
+
+    assert conn.execute('SELECT 1;').fetchone() == (1,)
+
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute('CREATE TABLE test_table (x INTEGER);')
+
+    manager.close()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Requires os.fork.')
+def test_fork():
+    parent = db_connection()
+    r, w = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        # Report whether the child opened its own working connection
+        try:
+            conn = db_connection()
+            conn.execute('SELECT 1;').fetchone()
+            os.write(w, b'1' if conn is not parent else b'0')
+        finally:
+            os._exit(0)
+
+    os.close(w)
+    result = os.read(r, 1)
+    os.close(r)
+    os.waitpid(pid, 0)
+
+    assert result == b'1'
+    assert db_connection() is parent
@@ -1,6 +1,5 @@
 import re
-import pandas as pd
-from .config_db import DB_CONNECTION
+from .config_db import db_connection
 
 __all__ = [
     'original_names',
@@ -9,6 +8,8 @@ __all__ = [
     'filter_aisc',
 ]
 
+_KEY_COLUMNS = {'name_key', 'type_key'} # Indexed lookup columns of the tables
+
 
 def original_names(names):
     """
@@ -25,6 +26,34 @@ def original_names(names):
     return [re.sub('_+$', '', x) for x in names]
 
 
+def _key(value):
+    """
+    Returns the normalized lookup key for a shape name or type, matching the
+    key columns of the database tables.
+
+    Parameters
+    ----------
+    value : str
+        The name or type.
+    """
+    return value.strip().upper()
+
+
+def _select_columns(columns):
+    """
+    Returns the quoted column list of a select statement.
+
+    Parameters
+    ----------
+    columns : list of str
+        Column names. If none specified, all columns are selected.
+    """
+    if not columns:
+        return '*'
+
+    return ', '.join('"{}"'.format(x.replace('"', '""')) for x in columns)
+
+
 def _aisc_table(metric, version):
     """
     Returns the name of the AISC table matching the criteria.
@@ -53,10 +82,11 @@ def _aisc_table(metric, version):
         raise ValueError('Version {!r} not found.'.format(version))
 
 
-def query_aisc(name, metric=False, version=None):
+def query_aisc(name, metric=False, version=None, columns=None):
     """
     Queries the AISC steel shape database and returns a dictionary of the
-    result.
+    result. The shape is looked up by the indexed name key column, so each
+    query is a single index search.
 
     Parameters
     ----------
@@ -68,20 +98,25 @@ def query_aisc(name, metric=False, version=None):
     version : {'15.0'}
         The version of the shape database to query. If None, the latest version
         will be used.
+    columns : list of str
+        Column names to include in result. If none specified, all will be
+        returned.
     """
-    name = name.upper()
+    key = _key(name)
     table = _aisc_table(metric, version)
 
-    statement = "SELECT * FROM {} WHERE UPPER(name)='{}';".format(table, name)
-    cursor = DB_CONNECTION.execute(statement)
+    statement = 'SELECT {} FROM {} WHERE name_key=?;'.format(
+        _select_columns(columns), table)
+    cursor = db_connection().execute(statement, (key,))
 
     header = original_names(cursor.description)
     row = cursor.fetchone()
 
     if not row:
-        raise ValueError('Shape {} not found.'.format(name))
+        raise ValueError('Shape {} not found.'.format(key))
 
-    odict = {k: x for k, x in zip(header, row) if x is not None}
+    odict = {k: x for k, x in zip(header, row)
+             if x is not None and k not in _KEY_COLUMNS}
 
     return odict
 
@@ -106,17 +141,19 @@ def query_aisc_shapes(shape=None, metric=False, version=None):
     table = _aisc_table(metric, version)
 
     if shape is None:
-        statement = "SELECT name FROM {};".format(table)
+        statement = 'SELECT name FROM {};'.format(table)
+        params = ()
     else:
-        shape = shape.upper()
-        statement = "SELECT name FROM {} WHERE UPPER(type)='{}';".format(table, shape)
+        statement = 'SELECT name FROM {} WHERE type_key=?;'.format(table)
+        params = (_key(shape),)
 
-    cursor = DB_CONNECTION.execute(statement)
+    cursor = db_connection().execute(statement, params)
 
     return cursor.fetchall()
 
 
-def filter_aisc(conditions, order=[], columns=[], metric=False, version=None):
+def filter_aisc(conditions, order=[], columns=[], metric=False, version=None,
+                params=()):
     """
     Returns a dataframe with the data for the specified AISC steel shape
     database query.
@@ -131,6 +168,16 @@ def filter_aisc(conditions, order=[], columns=[], metric=False, version=None):
     columns : list of str
         Column names to include in result. If none specified, all will be
         returned.
+    metric : bool
+        If True, queries the metric shape database. Otherwise, queries the
+        imperial shape database.
+    version : {'15.0'}
+        The version of the shape database to query. If None, the latest version
+        will be used.
+    params : tuple
+        Values bound to the `?` placeholders of the conditions. Values
+        supplied by users should be bound rather than formatted into the
+        conditions.
 
     Examples
     --------
@@ -138,19 +185,29 @@ def filter_aisc(conditions, order=[], columns=[], metric=False, version=None):
                name  area
     0  L12X12X1-1/4  28.4
     1  L12X12X1-3/8  31.1
+
+    >>> filter_aisc(['type=?', 'area>?'], order=['area'], columns=['name'],
+    ...             params=('L', 28))
+               name
+    0  L12X12X1-1/4
+    1  L12X12X1-3/8
     """
     table = _aisc_table(metric, version)
 
     where = ' AND '.join(conditions)
     order = 'ORDER BY {}'.format(', '.join(order)) if order else ''
-    columns = ', '.join(columns) if columns else '*'
+    select = ', '.join(columns) if columns else '*'
 
-    statement = "SELECT {} FROM {} WHERE {} {};".format(columns, table, where, order)
+    statement = "SELECT {} FROM {} WHERE {} {};".format(select, table, where, order)
 
-    cursor = DB_CONNECTION.execute(statement)
+    cursor = db_connection().execute(statement, params)
 
     header = original_names(cursor.description)
 
+    import pandas as pd
     df = pd.DataFrame(cursor.fetchall(), columns=header)
 
+    if not columns:
+        df = df.drop(columns=[x for x in header if x in _KEY_COLUMNS])
+
     return df
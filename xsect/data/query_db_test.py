@@ -1,4 +1,5 @@
 import pytest
+from .config_db import db_connection
 from .query_db import *
 
 
@@ -20,3 +21,32 @@ def test_query_aisc_shapes():
 
 def test_filter_aisc():
     filter_aisc(["type='L'", 'area>28'], order=['area'], columns=['name', 'area'])
+
+
+def test_query_aisc_key():
+    odict = query_aisc(' l8x8x1-1/8 ')
+    assert odict['name'] == 'L8X8X1-1/8'
+    assert 'name_key' not in odict
+
+    odict = query_aisc('L8x8x1-1/8', columns=['name', 'area'])
+    assert set(odict) == {'name', 'area'}
+
+    # Names are bound rather than formatted into the statement
+    with pytest.raises(ValueError):
+        query_aisc("L8x8x1-1/8' OR '1'='1")
+
+
+def test_query_aisc_index():
+    conn = db_connection()
+
+    for table in ['aisc_imperial_15_0', 'aisc_metric_15_0']:
+        for column in ['name_key', 'type_key']:
+            statement = 'EXPLAIN QUERY PLAN SELECT * FROM {} WHERE {}=?;'
+            plan = conn.execute(statement.format(table, column), ('L',))
+            assert 'USING INDEX' in plan.fetchall()[0][-1]
+
+
+def test_filter_aisc_params():
+    df = filter_aisc(['type=?', 'area>?'], order=['area'], params=('L', 28))
+    assert list(df['name']) == ['L12X12X1-1/4', 'L12X12X1-3/8']
+    assert 'name_key' not in df
@@ -0,0 +1,42 @@
+import sys
+import json
+import subprocess
+import pytest
+
+SCRIPT = '''
+import sys, json
+import xsect
+from xsect.data import config_db
+print(json.dumps(dict(
+    connected=config_db._MANAGER.is_open(),
+    modules=[x for x in ('matplotlib', 'pandas', 'scipy') if x in sys.modules]
+)))
+'''
+
+
+def import_state():
+    out = subprocess.check_output([sys.executable, '-c', SCRIPT])
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def test_deferred_imports():
+    odict = import_state()
+    assert odict['modules'] == []
+    assert not odict['connected']
+
+
+def test_lazy_attributes():
+    import pandas as pd
+    import xsect
+
+    xsect.register_accessor()
+    assert hasattr(pd.DataFrame(), 'xsect')
+
+    with pytest.warns(DeprecationWarning):
+        cursor = xsect.DB_CONNECTION.execute('SELECT 1;')
+
+    assert cursor.fetchone() == (1,)
+
+    with pytest.warns(DeprecationWarning):
+        with xsect.DB_CONNECTION as conn:
+            assert conn is xsect.db_connection()